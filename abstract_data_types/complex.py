@@ -1,8 +1,93 @@
 '''
 Implements the Complex Numbers Data Type
+
+Classes
+-------
+Complex
+    An approach to complex numbers.
+ComplexAccumulator
+    A mutable complex number for accumulation loops.
+ComplexArray
+    A columnar array of complex numbers.
+
+Functions
+---------
+roots_of_unity(n)
+    The n-th roots of unity, cached.
+rotate(values, angle)
+    Rotates many complex numbers by the same angle.
 '''
 
 import math
+import sys
+from array import array
+from functools import lru_cache
+
+# The constants of the Baudin-Smith division: the largest and smallest normal floats, the
+# machine epsilon and the scale applied to tiny operands.
+_FLOAT_MAX = sys.float_info.max
+_FLOAT_MIN = sys.float_info.min
+_EPSILON = sys.float_info.epsilon
+_SCALE = 2 / (_EPSILON * _EPSILON)
+# Within these magnitudes, a division needs no scaling and its ratio cannot underflow.
+_SAFE_MIN, _SAFE_MAX = 2.0 ** -400, 2.0 ** 400
+
+def _divide_part(a, b, c, d, ratio, t):
+    '''
+    (a + b * d / c) / (c + d * d / c), reassociated where the ratio or a product underflows.
+    '''
+    if abs(ratio) < _FLOAT_MIN:
+        # The ratio is subnormal or zero, so it lost precision: divide by c first instead.
+        return (a + d * (b / c)) * t
+    product = b * ratio
+    if product == 0:
+        return a * t + (b * t) * ratio
+    return (a + product) * t
+
+def _divide_internal(a, b, c, d):
+    '''
+    (a + bi) / (c + di) for |d| <= |c|, following Smith with the ratio d/c.
+    '''
+    ratio = d / c
+    t = 1 / (c + d * ratio)
+    return _divide_part(a, b, c, d, ratio, t), _divide_part(b, -a, c, d, ratio, t)
+
+def _divide(a, b, c, d):
+    '''
+    The real and imaginary parts of (a + bi) / (c + di), with c + di nonzero.
+
+    Baudin and Smith's robust version of Smith's algorithm: the operands are first scaled by
+    powers of two away from overflow and underflow, and the division goes through the ratio of
+    the smaller to the greater part of the divisor, so no square of a part is ever formed.
+    '''
+    if all(not part or _SAFE_MIN <= abs(part) <= _SAFE_MAX for part in (a, b, c, d)):
+        # No scaling is needed and the ratio cannot underflow: plain Smith.
+        if abs(d) <= abs(c):
+            ratio = d / c
+            t = 1 / (c + d * ratio)
+            return (a + b * ratio) * t, (b - a * ratio) * t
+        ratio = c / d
+        t = 1 / (d + c * ratio)
+        return (b + a * ratio) * t, -((a - b * ratio) * t)
+
+    first = max(abs(a), abs(b))
+    second = max(abs(c), abs(d))
+    scale = 1.0
+    if first >= _FLOAT_MAX / 2:
+        a, b, scale = a / 2, b / 2, scale * 2
+    if second >= _FLOAT_MAX / 2:
+        c, d, scale = c / 2, d / 2, scale / 2
+    if first <= _FLOAT_MIN * 2 / _EPSILON:
+        a, b, scale = a * _SCALE, b * _SCALE, scale / _SCALE
+    if second <= _FLOAT_MIN * 2 / _EPSILON:
+        c, d, scale = c * _SCALE, d * _SCALE, scale * _SCALE
+
+    if abs(d) <= abs(c):
+        real, imaginary = _divide_internal(a, b, c, d)
+    else:
+        real, imaginary = _divide_internal(b, a, d, c)
+        imaginary = -imaginary
+    return real * scale, imaginary * scale
 
 class Complex:
     '''
@@ -39,6 +124,12 @@ class Complex:
         self.real = real
         self.imaginary = imaginary
 
+    def __reduce__(self):
+        '''
+        Pickles the complex number by its real and imaginary parts only.
+        '''
+        return (Complex, (self.real, self.imaginary))
+
     def __repr__(self):
         '''
         The abstract representation of a complex number.
@@ -79,6 +170,9 @@ class Complex:
         TypeError
             If other is not an instance of Complex, int or float.
         '''
+        # An array broadcasts the complex over its elements, through its reflected operator.
+        if isinstance(other, ComplexArray):
+            return NotImplemented
         if isinstance(other, (int, float)):
             other = Complex(other)
         if not isinstance(other, Complex):
@@ -87,7 +181,7 @@ class Complex:
         imaginary = self.imaginary + other.imaginary
         return Complex(real, imaginary)
 
-    def _iadd__(self, other):
+    def __iadd__(self, other):
         '''
         Addition of two complex numbers.
 
@@ -106,6 +200,8 @@ class Complex:
         TypeError
             If other is not an instance of Complex, int or float.
         '''
+        if isinstance(other, ComplexArray):
+            return NotImplemented
         if isinstance(other, (int, float)):
             other = Complex(other)
         if not isinstance(other, Complex):
@@ -133,6 +229,8 @@ class Complex:
         TypeError
             If other is not an instance of Complex, int or float.
         '''
+        if isinstance(other, ComplexArray):
+            return NotImplemented
         if isinstance(other, (int, float)):
             other = Complex(other)
         if not isinstance(other, Complex):
@@ -161,6 +259,8 @@ class Complex:
         TypeError
             If other is not an instance of Complex, int or float.
         '''
+        if isinstance(other, ComplexArray):
+            return NotImplemented
         if isinstance(other, (int, float)):
             other = Complex(other)
         if not isinstance(other, Complex):
@@ -189,6 +289,8 @@ class Complex:
         TypeError
             If other is not an instance of Complex, int or float.
         '''
+        if isinstance(other, ComplexArray):
+            return NotImplemented
         if isinstance(other, (int, float)):
             other = Complex(other)
         if not isinstance(other, Complex):
@@ -219,6 +321,8 @@ class Complex:
         TypeError
             If other is not an instance of Complex, int or float.
         '''
+        if isinstance(other, ComplexArray):
+            return NotImplemented
         if isinstance(other, (int, float)):
             other = Complex(other)
         if not isinstance(other, Complex):
@@ -234,6 +338,9 @@ class Complex:
         '''
         Division of complex numbers.
 
+        The quotient is computed by Baudin and Smith's algorithm, which neither overflows nor
+        underflows for extreme parts and builds no intermediate Complex.
+
         Args
         ----
         other : Complex or int or float
@@ -251,21 +358,24 @@ class Complex:
         ZeroDivisionError
             If other is equal to zero.    
         '''
+        if isinstance(other, ComplexArray):
+            return NotImplemented
         if isinstance(other, (int, float)):
             other = Complex(other)
         if not isinstance(other, Complex):
             raise TypeError("You can only divide a complex by another complex, an int or a float.")
-        if abs(other) == 0:
+        c, d = other.real, other.imaginary
+        if c == 0 and d == 0:
             raise ZeroDivisionError("Division by zero is undefined.")
-        x, y = other.real, other.imaginary
-        denominator = x**2 + y**2
-        inverse_other = Complex(x/denominator, y/denominator)
-        return self * inverse_other
+        return Complex(*_divide(self.real, self.imaginary, c, d))
 
     def __itruediv__(self, other):
         '''
         Division of complex numbers.
 
+        The quotient is computed by Baudin and Smith's algorithm, which neither overflows nor
+        underflows for extreme parts and builds no intermediate Complex.
+
         Args
         ----
         other : Complex or int or float
@@ -283,16 +393,16 @@ class Complex:
         ZeroDivisionError
             If other is equal to zero.    
         '''
+        if isinstance(other, ComplexArray):
+            return NotImplemented
         if isinstance(other, (int, float)):
             other = Complex(other)
         if not isinstance(other, Complex):
             raise TypeError("You can only divide a complex by another complex, an int or a float.")
-        if abs(other) == 0:
+        c, d = other.real, other.imaginary
+        if c == 0 and d == 0:
             raise ZeroDivisionError("Division by zero is undefined.")
-        x, y = other.real, other.imaginary
-        denominator = x**2 + y**2
-        inverse_other = Complex(x/denominator, y/denominator)
-        return self * inverse_other
+        return Complex(*_divide(self.real, self.imaginary, c, d))
 
     def __abs__(self):
         '''
@@ -303,8 +413,7 @@ class Complex:
         float
             The absolute value of the complex.
         '''
-        x, y = self.real, self.imaginary
-        return math.sqrt(x**2 + y**2)
+        return math.hypot(self.real, self.imaginary)
 
     def conjugate(self):
         '''
@@ -318,3 +427,882 @@ class Complex:
         real = self.real
         imaginary = -self.imaginary
         return Complex(real, imaginary)
+
+    @classmethod
+    def from_polar(cls, modulus, angle):
+        '''
+        Builds a complex number from its polar form.
+
+        Args
+        ----
+        modulus : int or float
+            The absolute value of the complex.
+        angle : int or float
+            The argument of the complex, in radians.
+
+        Returns
+        -------
+        Complex
+            modulus * (cos(angle) + i sin(angle)).
+
+        Raises
+        ------
+        TypeError
+            If modulus or angle aren't instances of float or int.
+        '''
+        if not isinstance(modulus, (int, float)) or not isinstance(angle, (int, float)):
+            raise TypeError("The modulus and the angle must be integers or floats.")
+        return cls(modulus * math.cos(angle), modulus * math.sin(angle))
+
+    def arg(self):
+        '''
+        The argument of a complex number.
+
+        Returns
+        -------
+        float
+            The angle in radians, from -pi to pi, between the positive real axis and the
+            complex.
+        '''
+        return math.atan2(self.imaginary, self.real)
+
+    def to_polar(self):
+        '''
+        The polar form of a complex number.
+
+        Returns
+        -------
+        tuple of float
+            The absolute value and the argument of the complex.
+        '''
+        return math.hypot(self.real, self.imaginary), self.arg()
+
+    def exp(self):
+        '''
+        The exponential of a complex number.
+
+        Returns
+        -------
+        Complex
+            e ** real * (cos(imaginary) + i sin(imaginary)).
+        '''
+        modulus = math.exp(self.real)
+        return Complex(modulus * math.cos(self.imaginary), modulus * math.sin(self.imaginary))
+
+    def log(self):
+        '''
+        The principal natural logarithm of a complex number.
+
+        Returns
+        -------
+        Complex
+            log(abs(self)) + i arg(self).
+
+        Raises
+        ------
+        ValueError
+            If the complex is equal to zero.
+        '''
+        if self.real == 0 and self.imaginary == 0:
+            raise ValueError("The logarithm of zero is undefined.")
+        return Complex(math.log(math.hypot(self.real, self.imaginary)), self.arg())
+
+    def sqrt(self):
+        '''
+        The principal square root of a complex number.
+
+        The root is computed from the sum of the modulus and the absolute value of the real
+        part, which never cancels, so small parts keep their precision.
+
+        Returns
+        -------
+        Complex
+            The square root with non-negative real part.
+        '''
+        x, y = self.real, self.imaginary
+        if x == 0 and y == 0:
+            return Complex(0.0, float(y))
+        t = math.sqrt((math.hypot(x, y) + abs(x)) / 2)
+        if x >= 0:
+            return Complex(t, y / (2 * t))
+        return Complex(abs(y) / (2 * t), math.copysign(t, y))
+
+    def __pow__(self, power):
+        '''
+        Raises a complex number to the given power.
+
+        Integer powers use binary exponentiation, with O(log power) multiplications on the
+        parts and no intermediate Complex (a negative power starts from the inverse); real
+        powers use the polar form, and complex ones exp(power * log(self)).
+
+        Args
+        ----
+        power : Complex or int or float
+            The power to raise the complex.
+
+        Returns
+        -------
+        Complex
+            The (principal) power.
+
+        Raises
+        ------
+        TypeError
+            If power is not an instance of Complex, int or float.
+        ZeroDivisionError
+            If the complex is zero and the power is negative or not real.
+        '''
+        x, y = self.real, self.imaginary
+        if isinstance(power, int):
+            if power < 0:
+                if x == 0 and y == 0:
+                    raise ZeroDivisionError("Division by zero is undefined.")
+                (x, y), power = _divide(1.0, 0.0, x, y), -power
+            real, imaginary = 1, 0
+            while power:
+                if power & 1:
+                    real, imaginary = real * x - imaginary * y, real * y + imaginary * x
+                power >>= 1
+                if power:
+                    x, y = x * x - y * y, 2 * x * y
+            return Complex(real, imaginary)
+
+        if not isinstance(power, (float, Complex)):
+            raise TypeError("The power must be a complex, an integer or a float.")
+        if x == 0 and y == 0:
+            if isinstance(power, float) and power > 0:
+                return Complex(0.0, 0.0)
+            raise ZeroDivisionError("Zero can only be raised to a positive real power.")
+        if isinstance(power, float):
+            modulus, angle = self.to_polar()
+            return Complex.from_polar(modulus ** power, angle * power)
+        return (power * self.log()).exp()
+
+class ComplexAccumulator:
+    '''
+    A mutable complex number for accumulation loops.
+
+    The in-place operators (+=, -=, *=, /=) and the fused helpers update the real and imaginary
+    parts of the accumulator itself, so a loop like acc += w * x becomes
+    acc.add_product(w, x) and no intermediate Complex is built.
+
+    Attributes
+    ----------
+    real : float
+        The real part of the accumulated value.
+    imaginary : float
+        The imaginary part of the accumulated value.
+
+    Methods
+    -------
+    add_product(a, b):
+        Adds the product a * b to the accumulator.
+    sub_product(a, b):
+        Subtracts the product a * b from the accumulator.
+    add_scaled(value, scale):
+        Adds value * scale to the accumulator, for a real scale.
+    to_complex():
+        The accumulated value as a Complex.
+    reset(real=0.0, imaginary=0.0):
+        Sets the accumulated value.
+    '''
+    __slots__ = ("real", "imaginary")
+
+    def __init__(self, real=0.0, imaginary=0.0):
+        '''
+        Initializes a ComplexAccumulator instance.
+
+        Args
+        ----
+        real : int or float, optional
+            The initial real part (default = 0.0).
+        imaginary : int or float, optional
+            The initial imaginary part (default = 0.0).
+
+        Raises
+        ------
+        TypeError
+            If real or imaginary aren't instances of float or int.
+        '''
+        self.reset(real, imaginary)
+
+    def __repr__(self):
+        '''
+        The abstract representation of an accumulator.
+        '''
+        return f"ComplexAccumulator({self.real}, {self.imaginary})"
+
+    def __str__(self):
+        '''
+        The string representation of the accumulated value.
+        '''
+        return str(self.to_complex())
+
+    def reset(self, real=0.0, imaginary=0.0):
+        '''
+        Sets the accumulated value.
+
+        Args
+        ----
+        real : int or float, optional
+            The real part (default = 0.0).
+        imaginary : int or float, optional
+            The imaginary part (default = 0.0).
+
+        Raises
+        ------
+        TypeError
+            If real or imaginary aren't instances of float or int.
+        '''
+        if not isinstance(real, (int, float)) or not isinstance(imaginary, (int, float)):
+            raise TypeError("The real and imaginary parts must be integers or floats.")
+        self.real = real
+        self.imaginary = imaginary
+
+    def to_complex(self):
+        '''
+        The accumulated value as a Complex.
+
+        Returns
+        -------
+        Complex
+            A new complex number with the current parts.
+        '''
+        return Complex(self.real, self.imaginary)
+
+    def __iadd__(self, other):
+        '''
+        Adds other to the accumulator, in place.
+
+        Args
+        ----
+        other : Complex or ComplexAccumulator or int or float
+            The number to be summed.
+
+        Returns
+        -------
+        ComplexAccumulator
+            The accumulator itself.
+
+        Raises
+        ------
+        TypeError
+            If other is not a complex number, an integer or a float.
+        '''
+        if isinstance(other, (Complex, ComplexAccumulator)):
+            self.real += other.real
+            self.imaginary += other.imaginary
+        elif isinstance(other, (int, float)):
+            self.real += other
+        else:
+            raise TypeError("You can only sum a complex, an integer or a float to an " +
+            "accumulator.")
+        return self
+
+    def __isub__(self, other):
+        '''
+        Subtracts other from the accumulator, in place.
+
+        Args
+        ----
+        other : Complex or ComplexAccumulator or int or float
+            The number to be subtracted.
+
+        Returns
+        -------
+        ComplexAccumulator
+            The accumulator itself.
+
+        Raises
+        ------
+        TypeError
+            If other is not a complex number, an integer or a float.
+        '''
+        if isinstance(other, (Complex, ComplexAccumulator)):
+            self.real -= other.real
+            self.imaginary -= other.imaginary
+        elif isinstance(other, (int, float)):
+            self.real -= other
+        else:
+            raise TypeError("You can only subtract a complex, an integer or a float from an " +
+            "accumulator.")
+        return self
+
+    def __imul__(self, other):
+        '''
+        Multiplies the accumulator by other, in place.
+
+        Args
+        ----
+        other : Complex or ComplexAccumulator or int or float
+            The number to multiply the accumulator.
+
+        Returns
+        -------
+        ComplexAccumulator
+            The accumulator itself.
+
+        Raises
+        ------
+        TypeError
+            If other is not a complex number, an integer or a float.
+        '''
+        if isinstance(other, (Complex, ComplexAccumulator)):
+            a, b = self.real, self.imaginary
+            c, d = other.real, other.imaginary
+            self.real = a * c - b * d
+            self.imaginary = a * d + b * c
+        elif isinstance(other, (int, float)):
+            self.real *= other
+            self.imaginary *= other
+        else:
+            raise TypeError("You can only multiply an accumulator by a complex, an integer or " +
+            "a float.")
+        return self
+
+    def __itruediv__(self, other):
+        '''
+        Divides the accumulator by other, in place.
+
+        Args
+        ----
+        other : Complex or ComplexAccumulator or int or float
+            The number to divide the accumulator.
+
+        Returns
+        -------
+        ComplexAccumulator
+            The accumulator itself.
+
+        Raises
+        ------
+        TypeError
+            If other is not a complex number, an integer or a float.
+        ZeroDivisionError
+            If other is equal to zero.
+        '''
+        if isinstance(other, (Complex, ComplexAccumulator)):
+            c, d = other.real, other.imaginary
+        elif isinstance(other, (int, float)):
+            c, d = other, 0
+        else:
+            raise TypeError("You can only divide an accumulator by a complex, an integer or " +
+            "a float.")
+        if c == 0 and d == 0:
+            raise ZeroDivisionError("Division by zero is undefined.")
+        self.real, self.imaginary = _divide(self.real, self.imaginary, c, d)
+        return self
+
+    def add_product(self, a, b):
+        '''
+        Adds the product a * b to the accumulator, without building the product.
+
+        Args
+        ----
+        a, b : Complex or ComplexAccumulator
+            The factors.
+
+        Returns
+        -------
+        ComplexAccumulator
+            The accumulator itself.
+        '''
+        ar, ai, br, bi = a.real, a.imaginary, b.real, b.imaginary
+        self.real += ar * br - ai * bi
+        self.imaginary += ar * bi + ai * br
+        return self
+
+    def sub_product(self, a, b):
+        '''
+        Subtracts the product a * b from the accumulator, without building the product.
+
+        Args
+        ----
+        a, b : Complex or ComplexAccumulator
+            The factors.
+
+        Returns
+        -------
+        ComplexAccumulator
+            The accumulator itself.
+        '''
+        ar, ai, br, bi = a.real, a.imaginary, b.real, b.imaginary
+        self.real -= ar * br - ai * bi
+        self.imaginary -= ar * bi + ai * br
+        return self
+
+    def add_scaled(self, value, scale):
+        '''
+        Adds value * scale to the accumulator, for a real scale (the axpy operation).
+
+        Args
+        ----
+        value : Complex or ComplexAccumulator
+            The complex number to be scaled.
+        scale : int or float
+            The real factor.
+
+        Returns
+        -------
+        ComplexAccumulator
+            The accumulator itself.
+        '''
+        self.real += value.real * scale
+        self.imaginary += value.imaginary * scale
+        return self
+
+class ComplexArray:
+    '''
+    A columnar array of complex numbers.
+
+    The real and the imaginary parts are kept in two separate float64 columns (array('d')), so
+    the arithmetic runs over whole columns at once instead of building one Complex per element.
+
+    Attributes
+    ----------
+    reals : array
+        The real parts of the elements.
+    imaginaries : array
+        The imaginary parts of the elements.
+
+    Methods
+    -------
+    from_columns(reals, imaginaries):
+        Builds an array from the columns of real and imaginary parts.
+    to_list():
+        Returns the elements as a list of Complex.
+    conjugate():
+        The elementwise complex conjugate.
+    sum():
+        The sum of all the elements.
+    prod():
+        The product of all the elements.
+    mean():
+        The arithmetic mean of the elements.
+    '''
+    def __init__(self, values=()):
+        '''
+        Initializes a ComplexArray instance.
+
+        Args
+        ----
+        values : iterable of Complex or int or float, optional
+            The elements of the array (default = empty).
+
+        Raises
+        ------
+        TypeError
+            If some element is not an instance of Complex, int or float.
+        '''
+        self.reals = array('d')
+        self.imaginaries = array('d')
+        for value in values:
+            if isinstance(value, (int, float)):
+                self.reals.append(value)
+                self.imaginaries.append(0.0)
+            elif isinstance(value, Complex):
+                self.reals.append(value.real)
+                self.imaginaries.append(value.imaginary)
+            else:
+                raise TypeError("The elements of a ComplexArray must be complex numbers, " +
+                "integers or floats.")
+
+    @classmethod
+    def from_columns(cls, reals, imaginaries):
+        '''
+        Builds an array from the columns of real and imaginary parts.
+
+        Args
+        ----
+        reals : iterable of int or float
+            The real parts of the elements.
+        imaginaries : iterable of int or float
+            The imaginary parts of the elements.
+
+        Returns
+        -------
+        ComplexArray
+            The array with the given parts.
+
+        Raises
+        ------
+        TypeError
+            If some part is not a number.
+        ValueError
+            If the columns have different lengths.
+        '''
+        reals, imaginaries = array('d', reals), array('d', imaginaries)
+        if len(reals) != len(imaginaries):
+            raise ValueError("The real and the imaginary parts must have the same length.")
+        return cls._from_columns(reals, imaginaries)
+
+    @classmethod
+    def _from_columns(cls, reals, imaginaries):
+        '''
+        Builds an array from two float64 columns of the same length, without checks.
+        '''
+        instance = cls.__new__(cls)
+        instance.reals = reals
+        instance.imaginaries = imaginaries
+        return instance
+
+    def _columns_of(self, other):
+        '''
+        The real and imaginary columns of other, broadcasting scalars.
+
+        Args
+        ----
+        other : ComplexArray or Complex or int or float
+            The second operand of an elementwise operation.
+
+        Returns
+        -------
+        tuple
+            The real and the imaginary parts of other, one for each element of self.
+
+        Raises
+        ------
+        TypeError
+            If other is not an instance of ComplexArray, Complex, int or float.
+        ValueError
+            If other is a ComplexArray of a different length.
+        '''
+        if isinstance(other, (int, float)):
+            return [float(other)] * len(self), [0.0] * len(self)
+        if isinstance(other, Complex):
+            return [float(other.real)] * len(self), [float(other.imaginary)] * len(self)
+        if not isinstance(other, ComplexArray):
+            raise TypeError("You can only operate a ComplexArray with another ComplexArray, " +
+            "a complex, an integer or a float.")
+        if len(other) != len(self):
+            raise ValueError("The arrays must have the same length.")
+        return other.reals, other.imaginaries
+
+    def __len__(self):
+        '''
+        The number of elements of the array.
+        '''
+        return len(self.reals)
+
+    def __getitem__(self, index):
+        '''
+        The element (or the slice of the array) at index.
+
+        Args
+        ----
+        index : int or slice
+            The position of the element or the slice to be taken.
+
+        Returns
+        -------
+        Complex or ComplexArray
+            A Complex if index is an integer; a ComplexArray if it is a slice.
+        '''
+        if isinstance(index, slice):
+            return ComplexArray._from_columns(self.reals[index], self.imaginaries[index])
+        return Complex(self.reals[index], self.imaginaries[index])
+
+    def __iter__(self):
+        '''
+        Iterates over the elements of the array as instances of Complex.
+        '''
+        for real, imaginary in zip(self.reals, self.imaginaries):
+            yield Complex(real, imaginary)
+
+    def __repr__(self):
+        '''
+        The abstract representation of an instance of ComplexArray.
+        '''
+        return f"ComplexArray({self.to_list()})"
+
+    def __str__(self):
+        '''
+        The string representation of an instance of ComplexArray.
+        '''
+        return "[" + ", ".join(str(element) for element in self) + "]"
+
+    def to_list(self):
+        '''
+        Returns the elements as a list of Complex.
+
+        Returns
+        -------
+        list of Complex
+            The elements of the array.
+        '''
+        return list(self)
+
+    def __add__(self, other):
+        '''
+        The elementwise sum of the array and other.
+
+        Args
+        ----
+        other : ComplexArray or Complex or int or float
+            The array or number to be summed to each element.
+
+        Returns
+        -------
+        ComplexArray
+            The elementwise sum.
+        '''
+        reals, imaginaries = self._columns_of(other)
+        return ComplexArray._from_columns(
+            array('d', [a + c for a, c in zip(self.reals, reals)]),
+            array('d', [b + d for b, d in zip(self.imaginaries, imaginaries)]))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        '''
+        The elementwise subtraction of other from the array.
+
+        Args
+        ----
+        other : ComplexArray or Complex or int or float
+            The array or number to be subtracted from each element.
+
+        Returns
+        -------
+        ComplexArray
+            The elementwise subtraction.
+        '''
+        reals, imaginaries = self._columns_of(other)
+        return ComplexArray._from_columns(
+            array('d', [a - c for a, c in zip(self.reals, reals)]),
+            array('d', [b - d for b, d in zip(self.imaginaries, imaginaries)]))
+
+    def __rsub__(self, other):
+        '''
+        The elementwise subtraction of the array from other.
+        '''
+        return -self + other
+
+    def __mul__(self, other):
+        '''
+        The elementwise multiplication of the array and other.
+
+        Args
+        ----
+        other : ComplexArray or Complex or int or float
+            The array or number to multiply each element.
+
+        Returns
+        -------
+        ComplexArray
+            The elementwise multiplication.
+        '''
+        reals, imaginaries = self._columns_of(other)
+        columns = (self.reals, self.imaginaries, reals, imaginaries)
+        return ComplexArray._from_columns(
+            array('d', [a * c - b * d for a, b, c, d in zip(*columns)]),
+            array('d', [a * d + b * c for a, b, c, d in zip(*columns)]))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        '''
+        The elementwise division of the array by other.
+
+        Each quotient is computed as in Complex.__truediv__ (Baudin and Smith's algorithm), so
+        extreme parts neither overflow nor underflow.
+
+        Args
+        ----
+        other : ComplexArray or Complex or int or float
+            The array or number to divide each element.
+
+        Returns
+        -------
+        ComplexArray
+            The elementwise division.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If some element of other is equal to zero.
+        '''
+        reals, imaginaries = self._columns_of(other)
+        if any(c == 0 and d == 0 for c, d in zip(reals, imaginaries)):
+            raise ZeroDivisionError("Division by zero is undefined.")
+        columns = (self.reals, self.imaginaries, reals, imaginaries)
+        parts = [abs(part) for column in columns for part in column if part]
+        if not parts or (min(parts) >= _SAFE_MIN and max(parts) <= _SAFE_MAX):
+            # No scaling can be needed and no ratio can underflow, so Smith's steps are inlined.
+            result_reals, result_imaginaries = array('d'), array('d')
+            for a, b, c, d in zip(*columns):
+                if abs(d) <= abs(c):
+                    ratio = d / c
+                    t = 1 / (c + d * ratio)
+                    result_reals.append((a + b * ratio) * t)
+                    result_imaginaries.append((b - a * ratio) * t)
+                else:
+                    ratio = c / d
+                    t = 1 / (d + c * ratio)
+                    result_reals.append((b + a * ratio) * t)
+                    result_imaginaries.append(-((a - b * ratio) * t))
+            return ComplexArray._from_columns(result_reals, result_imaginaries)
+        quotients = [_divide(a, b, c, d) for a, b, c, d in zip(*columns)]
+        return ComplexArray._from_columns(array('d', [real for real, _ in quotients]),
+                                          array('d', [imaginary for _, imaginary in quotients]))
+
+    def __rtruediv__(self, other):
+        '''
+        The elementwise division of other by the array.
+        '''
+        reals, imaginaries = self._columns_of(other)
+        return ComplexArray._from_columns(array('d', reals), array('d', imaginaries)) / self
+
+    def __neg__(self):
+        '''
+        Returns the elementwise negative of the array.
+        '''
+        return ComplexArray._from_columns(array('d', [-a for a in self.reals]),
+                                          array('d', [-b for b in self.imaginaries]))
+
+    def __pos__(self):
+        '''
+        Returns the array itself (unary sum operator).
+        '''
+        return self
+
+    def __abs__(self):
+        '''
+        The elementwise absolute value of the array.
+
+        Returns
+        -------
+        array
+            The moduli of the elements, as a float64 array.
+        '''
+        return array('d', [math.hypot(a, b) for a, b in zip(self.reals, self.imaginaries)])
+
+    def conjugate(self):
+        '''
+        The elementwise complex conjugate.
+
+        Returns
+        -------
+        ComplexArray
+            The conjugates of the elements.
+        '''
+        return ComplexArray._from_columns(array('d', self.reals),
+                                          array('d', [-b for b in self.imaginaries]))
+
+    def sum(self):
+        '''
+        The sum of all the elements.
+
+        Each column is summed with math.fsum, so the parts are correctly rounded.
+
+        Returns
+        -------
+        Complex
+            The sum of the elements (zero for an empty array).
+        '''
+        return Complex(math.fsum(self.reals), math.fsum(self.imaginaries))
+
+    def prod(self):
+        '''
+        The product of all the elements.
+
+        Returns
+        -------
+        Complex
+            The product of the elements (one for an empty array).
+        '''
+        real, imaginary = 1.0, 0.0
+        for c, d in zip(self.reals, self.imaginaries):
+            real, imaginary = real * c - imaginary * d, real * d + imaginary * c
+        return Complex(real, imaginary)
+
+    def mean(self):
+        '''
+        The arithmetic mean of the elements.
+
+        Returns
+        -------
+        Complex
+            The mean of the elements.
+
+        Raises
+        ------
+        ValueError
+            If the array is empty.
+        '''
+        if len(self) == 0:
+            raise ValueError("The array is empty.")
+        return Complex(math.fsum(self.reals) / len(self), math.fsum(self.imaginaries) / len(self))
+
+@lru_cache(maxsize=64)
+def roots_of_unity(n):
+    '''
+    The n-th roots of unity, exp(2*pi*i*k/n) for k from 0 to n - 1.
+
+    The tables are cached (for the last 64 values of n), so the trigonometric functions are
+    evaluated once per n; the returned numbers are shared and must not be modified.
+
+    Args
+    ----
+    n : int
+        The number of roots.
+
+    Returns
+    -------
+    tuple of Complex
+        The roots, in counterclockwise order from 1.
+
+    Raises
+    ------
+    TypeError
+        If n is not an integer.
+    ValueError
+        If n is not positive.
+    '''
+    if not isinstance(n, int):
+        raise TypeError("The number of roots must be an integer.")
+    if n < 1:
+        raise ValueError("The number of roots must be a positive integer.")
+    return tuple(Complex(math.cos(2 * math.pi * k / n), math.sin(2 * math.pi * k / n))
+                 for k in range(n))
+
+def rotate(values, angle):
+    '''
+    Rotates many complex numbers by the same angle.
+
+    The phasor cos(angle) + i sin(angle) is computed once and every value is multiplied by it
+    on its parts.
+
+    Args
+    ----
+    values : ComplexArray or iterable of Complex or int or float
+        The numbers to be rotated.
+    angle : int or float
+        The angle of the rotation, in radians.
+
+    Returns
+    -------
+    ComplexArray or list of Complex
+        The rotated numbers, as a ComplexArray if values is one and as a list of Complex
+        otherwise.
+
+    Raises
+    ------
+    TypeError
+        If angle is not a number or some value is not an instance of Complex, int or float.
+    '''
+    if not isinstance(angle, (int, float)):
+        raise TypeError("The angle must be an integer or a float.")
+    c, s = math.cos(angle), math.sin(angle)
+    if isinstance(values, ComplexArray):
+        return values * Complex(c, s)
+    rotated = []
+    for value in values:
+        if isinstance(value, (int, float)):
+            rotated.append(Complex(value * c, value * s))
+        elif isinstance(value, Complex):
+            x, y = value.real, value.imaginary
+            rotated.append(Complex(x * c - y * s, x * s + y * c))
+        else:
+            raise TypeError("You can only rotate complex numbers, integers or floats.")
+    return rotated
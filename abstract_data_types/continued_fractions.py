@@ -0,0 +1,506 @@
+'''
+Implements lazy continued fractions with Gosper's arithmetic.
+
+A continued fraction [a0; a1, a2, ...] stands for a0 + 1 / (a1 + 1 / (a2 + ...)). Here the terms
+are produced on demand, so the sum, product or quotient of two continued fractions only computes
+as many terms as its consumer reads; the first convergents of a long computation come at the
+price of a few small integer operations.
+
+Classes
+-------
+ContinuedFraction
+    A continued fraction whose terms are computed lazily.
+'''
+
+from math import inf
+
+from .fractions import Fraction
+
+def _euclid(numerator, denominator):
+    '''
+    Yields the terms of the continued fraction of numerator/denominator.
+    '''
+    while denominator:
+        term = numerator // denominator
+        yield term
+        numerator, denominator = denominator, numerator - term * denominator
+
+def _ratio(numerator, denominator):
+    '''
+    A float approximation of numerator/denominator, infinite if the denominator is zero.
+    '''
+    if denominator == 0:
+        return inf
+    try:
+        return numerator / denominator
+    except OverflowError:
+        return inf if (numerator < 0) == (denominator < 0) else -inf
+
+def _simplest(low_numerator, low_denominator, high_numerator, high_denominator):
+    '''
+    Yields the terms of the simplest fraction in the closed interval [low, high], given by
+    numerators and positive denominators.
+    '''
+    while True:
+        ceiling = -(-low_numerator // low_denominator)
+        if ceiling * high_denominator <= high_numerator:
+            yield ceiling
+            return
+        # No integer in the interval: both ends share the integer part, and the rest of the
+        # fraction is in [1 / (high - term), 1 / (low - term)].
+        term = ceiling - 1
+        yield term
+        low_numerator, low_denominator, high_numerator, high_denominator = (
+            high_denominator, high_numerator - term * high_denominator,
+            low_denominator, low_numerator - term * low_denominator)
+
+def _settle(corners):
+    '''
+    Yields the terms of the simplest fraction between the corner ratios.
+
+    Raises
+    ------
+    ArithmeticError
+        If some corner denominator is zero or has a sign different from the others, so the
+        corners do not bound the value.
+    '''
+    sign = 1 if corners[-1][1] > 0 else -1
+    if not all(denominator and (denominator > 0) == (sign > 0) for _, denominator in corners):
+        raise ArithmeticError("The continued fraction does not settle: its value is not " +
+        "bounded by the terms read.")
+    corners = [(sign * numerator, sign * denominator) for numerator, denominator in corners]
+    low = high = corners[0]
+    for corner in corners[1:]:
+        if corner[0] * low[1] < low[0] * corner[1]:
+            low = corner
+        if corner[0] * high[1] > high[0] * corner[1]:
+            high = corner
+    yield from _simplest(*low, *high)
+
+def _bihomographic(x, y, coefficients, max_pending=None):
+    '''
+    Yields the terms of z = (a*x*y + b*x + c*y + d) / (e*x*y + f*x + g*y + h).
+
+    Gosper's algorithm: a term is output as soon as the four corner ratios a/e, b/f, c/g, d/h
+    share their integer part, which fixes the integer part of z whatever the rest of x and y;
+    otherwise a term of x or of y is taken in, the one whose unknown tail makes the ratios
+    spread the most. An exhausted input stands for infinity.
+
+    If max_pending is given and that many input terms are read without output while both
+    inputs are started and neither is exhausted, the corner ratios bound z within an interval
+    whose width shrinks geometrically with the terms read, yet their integer parts still differ:
+    z is then (nearly) a rational number on the boundary between two terms, as the square of
+    the square root of 2. The terms of the simplest fraction in that interval are output and
+    the expansion ends. Once an input is exhausted, z is a homographic function of the other,
+    which always outputs its next term (or ends) after finitely many terms, so it is never settled.
+
+    Args
+    ----
+    x, y : iterator of int
+        The terms of the operands.
+    coefficients : tuple of int
+        The eight coefficients (a, b, c, d, e, f, g, h).
+    max_pending : int, optional
+        The number of input terms read without output after which z is settled; if None, z is
+        never settled (default = None).
+    '''
+    a, b, c, d, e, f, g, h = coefficients
+    x_done = y_done = False
+    x_started = y_started = False
+    pending = 0
+    while True:
+        if x_done and y_done:
+            # z is now the rational number d/h.
+            yield from _euclid(d, h)
+            return
+        if e == f == g == h == 0:
+            return
+
+        # Once an input is exhausted, the coefficients that depend on it are zero and only the
+        # other corners are left.
+        if x_done:
+            corners = ((c, g), (d, h))
+        elif y_done:
+            corners = ((b, f), (d, h))
+        else:
+            corners = ((a, e), (b, f), (c, g), (d, h))
+        if x_started and y_started and all(denominator and (denominator > 0) == (h > 0)
+                                           for _, denominator in corners):
+            term = d // h
+            if all(numerator // denominator == term for numerator, denominator in corners):
+                yield term
+                a, b, c, d, e, f, g, h = (e, f, g, h, a - term * e, b - term * f,
+                                          c - term * g, d - term * h)
+                pending = 0
+                continue
+        if max_pending is not None and pending >= max_pending and x_started and y_started and \
+            not (x_done or y_done):
+            yield from _settle(corners)
+            return
+        pending += 1
+
+        if not x_started:
+            take_x = True
+        elif not y_started:
+            take_x = False
+        elif x_done or y_done:
+            take_x = y_done
+        else:
+            corner = _ratio(a, e)
+            # a/e to c/g is the range left open by x, a/e to b/f the one left open by y.
+            take_x = abs(_ratio(c, g) - corner) > abs(_ratio(b, f) - corner)
+
+        if take_x:
+            x_started = True
+            term = next(x, None)
+            if term is None:
+                x_done = True
+                a, b, c, d, e, f, g, h = 0, 0, a, b, 0, 0, e, f
+            else:
+                a, b, c, d, e, f, g, h = (a * term + c, b * term + d, a, b,
+                                          e * term + g, f * term + h, e, f)
+        else:
+            y_started = True
+            term = next(y, None)
+            if term is None:
+                y_done = True
+                a, b, c, d, e, f, g, h = 0, a, 0, c, 0, e, 0, g
+            else:
+                a, b, c, d, e, f, g, h = (a * term + b, a, c * term + d, c,
+                                          e * term + f, e, g * term + h, g)
+
+class ContinuedFraction:
+    '''
+    A continued fraction whose terms are computed lazily.
+
+    The terms already computed are cached, so a continued fraction can be read many times and
+    by many consumers. An empty continued fraction stands for infinity (as in 1 / 0).
+
+    An operation whose exact result is rational while its operands are not (the square of the
+    square root of 2, for instance) cannot decide its next term from finitely many terms of the
+    operands, and keeps reading them without end. Giving max_pending to an operand settles
+    such results: after that many terms of the operands read without output, while both still
+    have terms, the result is taken to be the simplest fraction within the bounds reached, so
+    the square of the square root of 2 ends as [2]. This is an approximation, since a result
+    merely very close to a simple fraction (as the difference of two long fractions) is
+    settled as well; without max_pending, operations on finite continued fractions are exact
+    and settling never happens. If the bounds reached are not finite, ArithmeticError is
+    raised.
+
+    Methods
+    -------
+    from_fraction(value):
+        The continued fraction of a fraction or integer.
+    terms():
+        Yields the terms, computing them as needed.
+    term(index):
+        The term at index.
+    convergents():
+        Yields the convergents as instances of Fraction.
+    to_fraction(max_terms=None):
+        The value, or its approximation after max_terms terms, as a Fraction.
+    '''
+    def __init__(self, terms, max_pending=None):
+        '''
+        Initializes a ContinuedFraction instance.
+
+        Args
+        ----
+        terms : iterable of int
+            The terms [a0, a1, ...], consumed lazily: a0 may be any integer, the others must be
+            positive.
+        max_pending : int, optional
+            In operations with this continued fraction (and with their results), the number of
+            terms of the operands read without output after which the result is settled, as
+            described above; if None, results are never settled (default = None).
+
+        Raises
+        ------
+        TypeError
+            If max_pending is neither None nor an integer.
+        ValueError
+            If max_pending is not positive.
+        '''
+        if max_pending is not None:
+            if not isinstance(max_pending, int):
+                raise TypeError("The maximum of pending terms must be an integer.")
+            if max_pending < 1:
+                raise ValueError("The maximum of pending terms must be positive.")
+        self._source = iter(terms)
+        self._cache = []
+        self._max_pending = max_pending
+
+    @classmethod
+    def from_fraction(cls, value):
+        '''
+        The continued fraction of a fraction or integer.
+
+        Args
+        ----
+        value : Fraction or int
+            The value to be converted.
+
+        Returns
+        -------
+        ContinuedFraction
+            The (finite) continued fraction of value.
+
+        Raises
+        ------
+        TypeError
+            If value is not an instance of Fraction or int.
+        '''
+        if isinstance(value, int):
+            return cls((value,))
+        if not isinstance(value, Fraction):
+            raise TypeError("Only fractions and integers can be converted to a continued " +
+            "fraction.")
+        return cls(_euclid(value.numerator, value.denominator))
+
+    def _fetch(self):
+        '''
+        Computes the next term; returns False if there are no more terms.
+
+        Raises
+        ------
+        TypeError
+            If the term is not an integer.
+        ValueError
+            If a term after the first is not positive.
+        '''
+        if self._source is None:
+            return False
+        term = next(self._source, None)
+        if term is None:
+            self._source = None
+            return False
+        if not isinstance(term, int):
+            raise TypeError("The terms of a continued fraction must be integers.")
+        if self._cache and term <= 0:
+            raise ValueError("The terms of a continued fraction after the first must be " +
+            "positive.")
+        self._cache.append(term)
+        return True
+
+    def terms(self):
+        '''
+        Yields the terms, computing them as needed.
+
+        Yields
+        ------
+        int
+            The successive terms.
+        '''
+        index = 0
+        while index < len(self._cache) or self._fetch():
+            yield self._cache[index]
+            index += 1
+
+    def term(self, index):
+        '''
+        The term at index.
+
+        Args
+        ----
+        index : int
+            The position of the term, starting at zero.
+
+        Returns
+        -------
+        int
+            The term.
+
+        Raises
+        ------
+        IndexError
+            If the continued fraction has no term at index.
+        '''
+        while index >= len(self._cache):
+            if not self._fetch():
+                raise IndexError("The continued fraction has no term at this index.")
+        return self._cache[index]
+
+    def convergents(self):
+        '''
+        Yields the convergents as instances of Fraction.
+
+        Yields
+        ------
+        Fraction
+            The successive convergents; if the continued fraction is finite, the last one is
+            its exact value.
+        '''
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        for term in self.terms():
+            p0, q0, p1, q1 = p1, q1, p0 + term * p1, q0 + term * q1
+            yield Fraction._from_reduced(p1, q1)
+
+    def to_fraction(self, max_terms=None):
+        '''
+        The value, or its approximation after max_terms terms, as a Fraction.
+
+        Args
+        ----
+        max_terms : int, optional
+            The number of terms to be used; if None, all of them, which only ends for finite
+            continued fractions (default = None).
+
+        Returns
+        -------
+        Fraction
+            The convergent after max_terms terms, or the exact value.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If the continued fraction is empty (infinite).
+        '''
+        convergent = None
+        for count, convergent in enumerate(self.convergents(), start=1):
+            if count == max_terms:
+                break
+        if convergent is None:
+            raise ZeroDivisionError("Division by zero is undefined.")
+        return convergent
+
+    def __float__(self):
+        '''
+        The value as a float, read from the first convergent precise enough.
+        '''
+        previous = None
+        for convergent in self.convergents():
+            # Consecutive convergents bracket the value within 1 / (q_k * q_(k+1)).
+            if previous is not None and previous.denominator * convergent.denominator > 2 ** 60:
+                break
+            previous = convergent
+        if previous is None:
+            raise ZeroDivisionError("Division by zero is undefined.")
+        return float(convergent)
+
+    def __repr__(self):
+        '''
+        The abstract representation of a continued fraction, with up to ten terms.
+        '''
+        terms = []
+        for term in self.terms():
+            if len(terms) == 10:
+                return f"ContinuedFraction([{terms[0]}; {', '.join(map(str, terms[1:]))}, ...])"
+            terms.append(term)
+        if len(terms) <= 1:
+            return f"ContinuedFraction({terms})"
+        return f"ContinuedFraction([{terms[0]}; {', '.join(map(str, terms[1:]))}])"
+
+    def _operate(self, other, coefficients, reflected=False):
+        '''
+        The continued fraction of a bihomographic function of self and other.
+
+        Raises
+        ------
+        TypeError
+            If other is not an instance of ContinuedFraction, Fraction or int.
+        '''
+        if isinstance(other, (Fraction, int)):
+            other = ContinuedFraction.from_fraction(other)
+        if not isinstance(other, ContinuedFraction):
+            raise TypeError("You can only operate a continued fraction with another continued " +
+            "fraction, a fraction or an integer.")
+        x, y = (other, self) if reflected else (self, other)
+        limits = [operand._max_pending for operand in (x, y)
+                  if operand._max_pending is not None]
+        max_pending = min(limits) if limits else None
+        return ContinuedFraction(_bihomographic(x.terms(), y.terms(), coefficients,
+                                                max_pending), max_pending)
+
+    def __add__(self, other):
+        '''
+        The lazy sum of the continued fraction and other.
+
+        Args
+        ----
+        other : ContinuedFraction or Fraction or int
+            The value to be summed.
+
+        Returns
+        -------
+        ContinuedFraction
+            The sum, whose terms are computed on demand.
+        '''
+        return self._operate(other, (0, 1, 1, 0, 0, 0, 0, 1))
+
+    def __radd__(self, other):
+        '''
+        The lazy sum of other and the continued fraction.
+        '''
+        return self._operate(other, (0, 1, 1, 0, 0, 0, 0, 1), reflected=True)
+
+    def __sub__(self, other):
+        '''
+        The lazy subtraction of other from the continued fraction.
+
+        Args
+        ----
+        other : ContinuedFraction or Fraction or int
+            The value to be subtracted.
+
+        Returns
+        -------
+        ContinuedFraction
+            The subtraction, whose terms are computed on demand.
+        '''
+        return self._operate(other, (0, 1, -1, 0, 0, 0, 0, 1))
+
+    def __rsub__(self, other):
+        '''
+        The lazy subtraction of the continued fraction from other.
+        '''
+        return self._operate(other, (0, 1, -1, 0, 0, 0, 0, 1), reflected=True)
+
+    def __mul__(self, other):
+        '''
+        The lazy product of the continued fraction and other.
+
+        Args
+        ----
+        other : ContinuedFraction or Fraction or int
+            The value to multiply the continued fraction.
+
+        Returns
+        -------
+        ContinuedFraction
+            The product, whose terms are computed on demand.
+        '''
+        return self._operate(other, (1, 0, 0, 0, 0, 0, 0, 1))
+
+    def __rmul__(self, other):
+        '''
+        The lazy product of other and the continued fraction.
+        '''
+        return self._operate(other, (1, 0, 0, 0, 0, 0, 0, 1), reflected=True)
+
+    def __truediv__(self, other):
+        '''
+        The lazy division of the continued fraction by other.
+
+        Args
+        ----
+        other : ContinuedFraction or Fraction or int
+            The value to divide the continued fraction.
+
+        Returns
+        -------
+        ContinuedFraction
+            The division, whose terms are computed on demand (none if other is zero).
+        '''
+        return self._operate(other, (0, 1, 0, 0, 0, 0, 1, 0))
+
+    def __rtruediv__(self, other):
+        '''
+        The lazy division of other by the continued fraction.
+        '''
+        return self._operate(other, (0, 1, 0, 0, 0, 0, 1, 0), reflected=True)
+
+    def __neg__(self):
+        '''
+        The lazy negative of the continued fraction.
+        '''
+        return self._operate(0, (0, 1, -1, 0, 0, 0, 0, 1), reflected=True)
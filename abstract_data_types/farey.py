@@ -0,0 +1,282 @@
+'''
+Enumerates the reduced fractions: Farey sequences and the Stern-Brocot and Calkin-Wilf trees.
+
+Every term is built from its neighbours with a few integer operations and is already in its
+simplest form, so no gcd is ever taken.
+
+Functions
+---------
+farey(order)
+    Yields the Farey sequence of the given order.
+farey_array(order)
+    The Farey sequence of the given order as a FractionArray.
+farey_length(order)
+    The number of terms of the Farey sequence of the given order.
+farey_rank(value, order)
+    The number of terms of the Farey sequence of the given order not greater than value.
+farey_select(index, order)
+    The term at index of the Farey sequence of the given order.
+stern_brocot(depth)
+    Yields the nodes of the Stern-Brocot tree, level by level.
+calkin_wilf()
+    Yields every positive fraction once, in the breadth-first order of the Calkin-Wilf tree.
+'''
+
+from array import array
+from collections import deque
+
+from .fractions import Fraction, FractionArray
+
+def _check_order(order):
+    '''
+    Raises TypeError or ValueError if order is not a positive integer.
+    '''
+    if not isinstance(order, int):
+        raise TypeError("The order must be an integer.")
+    if order < 1:
+        raise ValueError("The order must be a positive integer.")
+
+def _farey_pairs(order):
+    '''
+    Yields the (numerator, denominator) pairs of the Farey sequence of the given order.
+
+    If a/b and c/d are consecutive terms, the next one is (k*c - a)/(k*d - b), with
+    k = (order + b) // d.
+    '''
+    a, b, c, d = 0, 1, 1, order
+    yield a, b
+    while c <= order:
+        k = (order + b) // d
+        a, b, c, d = c, d, k * c - a, k * d - b
+        yield a, b
+
+def farey(order):
+    '''
+    Yields the Farey sequence of the given order.
+
+    Args
+    ----
+    order : int
+        The greatest denominator of the sequence.
+
+    Yields
+    ------
+    Fraction
+        The fractions from 0 to 1 with denominator at most order, in increasing order.
+
+    Raises
+    ------
+    TypeError
+        If order is not an integer.
+    ValueError
+        If order is not positive.
+    '''
+    _check_order(order)
+    for numerator, denominator in _farey_pairs(order):
+        yield Fraction._from_reduced(numerator, denominator)
+
+def farey_array(order):
+    '''
+    The Farey sequence of the given order as a FractionArray.
+
+    The terms go straight into the integer columns, without a Fraction per term.
+
+    Args
+    ----
+    order : int
+        The greatest denominator of the sequence.
+
+    Returns
+    -------
+    FractionArray
+        The fractions from 0 to 1 with denominator at most order, in increasing order.
+    '''
+    _check_order(order)
+    numerators, denominators = array('q'), array('q')
+    for numerator, denominator in _farey_pairs(order):
+        numerators.append(numerator)
+        denominators.append(denominator)
+    return FractionArray._from_reduced(numerators, denominators)
+
+def farey_length(order):
+    '''
+    The number of terms of the Farey sequence of the given order.
+
+    It is 1 + phi(1) + ... + phi(order), with Euler's totients taken from a sieve.
+
+    Args
+    ----
+    order : int
+        The greatest denominator of the sequence.
+
+    Returns
+    -------
+    int
+        The number of terms.
+    '''
+    _check_order(order)
+    totients = list(range(order + 1))
+    for prime in range(2, order + 1):
+        if totients[prime] == prime:
+            for multiple in range(prime, order + 1, prime):
+                totients[multiple] -= totients[multiple] // prime
+    return 1 + sum(totients[1:])
+
+def _rank(numerator, denominator, order):
+    '''
+    The number of terms of the Farey sequence of the given order in (0, n/d], with d > 0.
+
+    counts[q] starts as the number of fractions a/q in (0, n/d] and ends as the number of the
+    reduced ones, after removing the fractions that reduce to a smaller denominator dividing q.
+    '''
+    counts = [0] + [q * numerator // denominator for q in range(1, order + 1)]
+    for q in range(1, order + 1):
+        for multiple in range(2 * q, order + 1, q):
+            counts[multiple] -= counts[q]
+    return sum(counts)
+
+def farey_rank(value, order):
+    '''
+    The number of terms of the Farey sequence of the given order not greater than value.
+
+    It takes O(order log order) operations and does not enumerate the sequence; if value is a
+    term, it is its position counting from one.
+
+    Args
+    ----
+    value : Fraction or int
+        The value to be ranked.
+    order : int
+        The greatest denominator of the sequence.
+
+    Returns
+    -------
+    int
+        The number of terms not greater than value.
+
+    Raises
+    ------
+    TypeError
+        If value is not an instance of Fraction or int.
+    '''
+    _check_order(order)
+    if isinstance(value, int):
+        value = Fraction._from_reduced(value, 1)
+    if not isinstance(value, Fraction):
+        raise TypeError("Only fractions and integers can be ranked.")
+    if value < 0:
+        return 0
+    if value >= 1:
+        value = Fraction._from_reduced(1, 1)
+    return 1 + _rank(value.numerator, value.denominator, order)
+
+def farey_select(index, order):
+    '''
+    The term at index of the Farey sequence of the given order.
+
+    Consecutive terms are more than 1/order**2 apart, so a binary search over the multiples of
+    1/order**2, ranked with farey_rank, isolates the term; it takes O(order log**2 order)
+    operations.
+
+    Args
+    ----
+    index : int
+        The position of the term, starting at zero; negative indices count from the end.
+    order : int
+        The greatest denominator of the sequence.
+
+    Returns
+    -------
+    Fraction
+        The term at index.
+
+    Raises
+    ------
+    TypeError
+        If index is not an integer.
+    IndexError
+        If index is out of range.
+    '''
+    _check_order(order)
+    if not isinstance(index, int):
+        raise TypeError("The index must be an integer.")
+    length = farey_length(order)
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError("The index is out of range.")
+    if index == 0:
+        return Fraction._from_reduced(0, 1)
+
+    # The smallest grid point m/scale with index terms in (0, m/scale].
+    scale = order * order
+    low, high = 1, scale
+    while low < high:
+        middle = (low + high) // 2
+        if _rank(middle, scale, order) >= index:
+            high = middle
+        else:
+            low = middle + 1
+
+    # The term is the greatest fraction a/q not above low/scale.
+    numerator, denominator = 0, 1
+    for q in range(1, order + 1):
+        a = q * low // scale
+        if a * denominator > numerator * q:
+            numerator, denominator = a, q
+    return Fraction._from_reduced(numerator, denominator)
+
+def stern_brocot(depth):
+    '''
+    Yields the nodes of the Stern-Brocot tree, level by level.
+
+    Each node is the mediant (a + c)/(b + d) of its nearest ancestors a/b and c/d on the left
+    and on the right, starting from 0/1 and 1/0; the tree holds every positive fraction once.
+
+    Args
+    ----
+    depth : int
+        The number of levels to be traversed (level k has 2 ** (k - 1) nodes).
+
+    Yields
+    ------
+    Fraction
+        The nodes in breadth-first order, each level from left to right.
+
+    Raises
+    ------
+    TypeError
+        If depth is not an integer.
+    ValueError
+        If depth is negative.
+    '''
+    if not isinstance(depth, int):
+        raise TypeError("The depth must be an integer.")
+    if depth < 0:
+        raise ValueError("The depth must not be negative.")
+    level = deque([(0, 1, 1, 0)])
+    for _ in range(depth):
+        for _ in range(len(level)):
+            a, b, c, d = level.popleft()
+            numerator, denominator = a + c, b + d
+            yield Fraction._from_reduced(numerator, denominator)
+            level.append((a, b, numerator, denominator))
+            level.append((numerator, denominator, c, d))
+
+def calkin_wilf():
+    '''
+    Yields every positive fraction once, in the breadth-first order of the Calkin-Wilf tree.
+
+    Newman's recurrence gives the term after x as 1 / (2 * floor(x) - x + 1), so the traversal
+    keeps no queue.
+
+    Yields
+    ------
+    Fraction
+        1, 1/2, 2, 1/3, 3/2, 2/3, 3, 1/4, ...
+    '''
+    numerator, denominator = 1, 1
+    while True:
+        yield Fraction._from_reduced(numerator, denominator)
+        numerator, denominator = denominator, (2 * (numerator // denominator) + 1) * \
+            denominator - numerator
@@ -0,0 +1,444 @@
+'''
+Implements the fast Fourier transform over sequences of complex numbers.
+
+The transforms work on the real and imaginary parts as two lists of floats. Lengths that are
+powers of two use the iterative radix-2 algorithm; lengths whose prime factors are all small use
+the mixed-radix Cooley-Tukey algorithm; any other length uses Bluestein's algorithm, which turns
+the transform into a convolution of power-of-two length. The twiddle factors of each length
+are computed once and kept in a bounded cache.
+
+The forward transform is X[k] = sum(x[j] * exp(-2*pi*i*j*k/n)); the inverse one divides by n.
+
+Functions
+---------
+fft(values)
+    The discrete Fourier transform of a sequence.
+ifft(values)
+    The inverse discrete Fourier transform of a sequence.
+rfft(values)
+    The non-negative frequency terms of the transform of a real sequence.
+irfft(values, n=None)
+    The real sequence whose non-negative frequency terms are values.
+convolve(a, b)
+    The linear convolution of two sequences.
+clear_cache()
+    Empties the cache of twiddle factors.
+'''
+
+import math
+from collections import OrderedDict
+
+from .complex import Complex, ComplexArray
+
+# The greatest prime factor handled by the mixed-radix algorithm; above it, Bluestein's.
+_MAX_RADIX = 31
+
+# The number of lengths whose twiddle factors (and Bluestein chirps) are cached.
+_CACHE_SIZE = 32
+_cache = OrderedDict()
+
+def clear_cache():
+    '''
+    Empties the cache of twiddle factors.
+    '''
+    _cache.clear()
+
+def _cached(key, build):
+    '''
+    The cached value of key, built (and cached, evicting the least recently used) if missing.
+    '''
+    value = _cache.get(key)
+    if value is None:
+        value = build()
+        if len(_cache) >= _CACHE_SIZE:
+            _cache.popitem(last=False)
+        _cache[key] = value
+    else:
+        _cache.move_to_end(key)
+    return value
+
+def _twiddles(n):
+    '''
+    The cosines and the sines of -2*pi*k/n, for k from 0 to n - 1.
+    '''
+    def build():
+        cosines, sines = [], []
+        for k in range(n):
+            angle = -2 * math.pi * k / n
+            cosines.append(math.cos(angle))
+            sines.append(math.sin(angle))
+        return cosines, sines
+    return _cached(("twiddles", n), build)
+
+def _columns(values):
+    '''
+    The real and imaginary parts of a sequence, as two new lists of floats.
+
+    Raises
+    ------
+    TypeError
+        If some element is not an instance of Complex, int or float.
+    '''
+    if isinstance(values, ComplexArray):
+        return list(values.reals), list(values.imaginaries)
+    reals, imaginaries = [], []
+    for value in values:
+        if isinstance(value, Complex):
+            reals.append(float(value.real))
+            imaginaries.append(float(value.imaginary))
+        elif isinstance(value, (int, float)):
+            reals.append(float(value))
+            imaginaries.append(0.0)
+        else:
+            raise TypeError("The elements must be complex numbers, integers or floats.")
+    return reals, imaginaries
+
+def _output(reals, imaginaries, like):
+    '''
+    The parts as a ComplexArray if like is one, or as a list of Complex otherwise.
+    '''
+    if isinstance(like, ComplexArray):
+        return ComplexArray.from_columns(reals, imaginaries)
+    return [Complex(real, imaginary) for real, imaginary in zip(reals, imaginaries)]
+
+def _smallest_factor(n):
+    '''
+    The smallest prime factor of n > 1.
+    '''
+    if n % 2 == 0:
+        return 2
+    factor = 3
+    while factor * factor <= n:
+        if n % factor == 0:
+            return factor
+        factor += 2
+    return n
+
+def _radix2(reals, imaginaries):
+    '''
+    The transform of a power-of-two length, in place: bit reversal, then butterflies.
+    '''
+    n = len(reals)
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            reals[i], reals[j] = reals[j], reals[i]
+            imaginaries[i], imaginaries[j] = imaginaries[j], imaginaries[i]
+
+    cosines, sines = _twiddles(n)
+    size = 2
+    while size <= n:
+        half, stride = size // 2, n // size
+        for start in range(0, n, size):
+            for k in range(half):
+                c, s = cosines[k * stride], sines[k * stride]
+                top, bottom = start + k, start + k + half
+                xr, xi = reals[bottom], imaginaries[bottom]
+                tr, ti = xr * c - xi * s, xr * s + xi * c
+                reals[bottom], imaginaries[bottom] = reals[top] - tr, imaginaries[top] - ti
+                reals[top] += tr
+                imaginaries[top] += ti
+        size *= 2
+
+def _mixed_radix(reals, imaginaries, cosines, sines, stride):
+    '''
+    The transform of a length whose prime factors are at most _MAX_RADIX.
+
+    The sequence is split into p interleaved subsequences (p its smallest prime factor), which
+    are transformed recursively and combined with the twiddle factors of the full length; a
+    prime length is transformed directly. cosines and sines are the twiddles of the top-level
+    length, and stride maps the current length into them.
+
+    Returns
+    -------
+    tuple of list of float
+        The real and imaginary parts of the transform.
+    '''
+    n = len(reals)
+    if n == 1:
+        return reals, imaginaries
+    top = len(cosines)
+    p = _smallest_factor(n)
+    if p == n:
+        result_reals, result_imaginaries = [], []
+        for k in range(n):
+            real = imaginary = 0.0
+            for j in range(n):
+                index = (j * k % n) * stride
+                c, s = cosines[index], sines[index]
+                xr, xi = reals[j], imaginaries[j]
+                real += xr * c - xi * s
+                imaginary += xr * s + xi * c
+            result_reals.append(real)
+            result_imaginaries.append(imaginary)
+        return result_reals, result_imaginaries
+
+    m = n // p
+    parts = [_mixed_radix(reals[r::p], imaginaries[r::p], cosines, sines, stride * p)
+             for r in range(p)]
+    result_reals, result_imaginaries = [0.0] * n, [0.0] * n
+    for k in range(n):
+        real = imaginary = 0.0
+        for r, (part_reals, part_imaginaries) in enumerate(parts):
+            index = (r * k * stride) % top
+            c, s = cosines[index], sines[index]
+            xr, xi = part_reals[k % m], part_imaginaries[k % m]
+            real += xr * c - xi * s
+            imaginary += xr * s + xi * c
+        result_reals[k], result_imaginaries[k] = real, imaginary
+    return result_reals, result_imaginaries
+
+def _bluestein(reals, imaginaries):
+    '''
+    The transform of any length, as a convolution with a chirp of power-of-two length.
+
+    With w[k] = exp(-pi*i*k**2/n), X[k] = w[k] * sum(x[j] * w[j] * conj(w[k - j])).
+    '''
+    n = len(reals)
+    size = 1 << (2 * n - 2).bit_length()
+
+    def build():
+        # k**2 is reduced modulo 2n before scaling, to keep the angles accurate.
+        cosines, sines = [], []
+        for k in range(n):
+            angle = -math.pi * (k * k % (2 * n)) / n
+            cosines.append(math.cos(angle))
+            sines.append(math.sin(angle))
+        # The transform of the conjugate chirp, laid out circularly for indices -(n-1)..n-1.
+        filter_reals, filter_imaginaries = [0.0] * size, [0.0] * size
+        for k in range(n):
+            filter_reals[k], filter_imaginaries[k] = cosines[k], -sines[k]
+            if k:
+                filter_reals[size - k], filter_imaginaries[size - k] = cosines[k], -sines[k]
+        _radix2(filter_reals, filter_imaginaries)
+        return cosines, sines, filter_reals, filter_imaginaries
+    cosines, sines, filter_reals, filter_imaginaries = _cached(("chirp", n), build)
+
+    work_reals, work_imaginaries = [0.0] * size, [0.0] * size
+    for k in range(n):
+        c, s, xr, xi = cosines[k], sines[k], reals[k], imaginaries[k]
+        work_reals[k], work_imaginaries[k] = xr * c - xi * s, xr * s + xi * c
+    _radix2(work_reals, work_imaginaries)
+    for k in range(size):
+        ar, ai, br, bi = work_reals[k], work_imaginaries[k], filter_reals[k], filter_imaginaries[k]
+        # Conjugated, so that a forward transform computes the inverse one.
+        work_reals[k], work_imaginaries[k] = ar * br - ai * bi, -(ar * bi + ai * br)
+    _radix2(work_reals, work_imaginaries)
+
+    result_reals, result_imaginaries = [], []
+    for k in range(n):
+        c, s = cosines[k], sines[k]
+        xr, xi = work_reals[k] / size, -work_imaginaries[k] / size
+        result_reals.append(xr * c - xi * s)
+        result_imaginaries.append(xr * s + xi * c)
+    return result_reals, result_imaginaries
+
+def _transform(reals, imaginaries):
+    '''
+    The forward transform of the parts, choosing the algorithm by the length.
+    '''
+    n = len(reals)
+    if n <= 1:
+        return reals, imaginaries
+    if n & (n - 1) == 0:
+        _radix2(reals, imaginaries)
+        return reals, imaginaries
+
+    largest, rest = 1, n
+    while rest > 1:
+        largest = _smallest_factor(rest)
+        rest //= largest
+    if largest <= _MAX_RADIX:
+        cosines, sines = _twiddles(n)
+        return _mixed_radix(reals, imaginaries, cosines, sines, 1)
+    return _bluestein(reals, imaginaries)
+
+def _inverse(reals, imaginaries):
+    '''
+    The inverse transform of the parts, through the forward one of the conjugates.
+    '''
+    n = len(reals)
+    reals, imaginaries = _transform(reals, [-imaginary for imaginary in imaginaries])
+    return [real / n for real in reals], [-imaginary / n for imaginary in imaginaries]
+
+def fft(values):
+    '''
+    The discrete Fourier transform of a sequence.
+
+    Args
+    ----
+    values : ComplexArray or iterable of Complex or int or float
+        The sequence to be transformed, of any length.
+
+    Returns
+    -------
+    ComplexArray or list of Complex
+        The transform, as a ComplexArray if values is one and as a list of Complex otherwise.
+
+    Raises
+    ------
+    TypeError
+        If some element is not an instance of Complex, int or float.
+    '''
+    return _output(*_transform(*_columns(values)), values)
+
+def ifft(values):
+    '''
+    The inverse discrete Fourier transform of a sequence.
+
+    Args
+    ----
+    values : ComplexArray or iterable of Complex or int or float
+        The sequence to be transformed, of any length.
+
+    Returns
+    -------
+    ComplexArray or list of Complex
+        The inverse transform, as a ComplexArray if values is one and as a list of Complex
+        otherwise.
+
+    Raises
+    ------
+    TypeError
+        If some element is not an instance of Complex, int or float.
+    '''
+    reals, imaginaries = _columns(values)
+    if not reals:
+        return _output(reals, imaginaries, values)
+    return _output(*_inverse(reals, imaginaries), values)
+
+def rfft(values):
+    '''
+    The non-negative frequency terms of the transform of a real sequence.
+
+    For an even length n, the sequence is packed into a complex one of length n/2 (the even
+    samples as real parts, the odd ones as imaginary parts), whose transform is then split,
+    halving the work.
+
+    Args
+    ----
+    values : iterable of int or float
+        The real sequence to be transformed.
+
+    Returns
+    -------
+    list of Complex
+        The terms X[0], ..., X[n // 2] of the transform; the others are their conjugates.
+
+    Raises
+    ------
+    TypeError
+        If some element is not an instance of int or float.
+    '''
+    samples = []
+    for value in values:
+        if not isinstance(value, (int, float)):
+            raise TypeError("The elements of a real sequence must be integers or floats.")
+        samples.append(float(value))
+    n = len(samples)
+    if n % 2:
+        reals, imaginaries = _transform(samples, [0.0] * n)
+        return _output(reals[:n // 2 + 1], imaginaries[:n // 2 + 1], None)
+
+    half = n // 2
+    if half == 0:
+        return []
+    reals, imaginaries = _transform(samples[0::2], samples[1::2])
+    cosines, sines = _twiddles(n)
+    result_reals, result_imaginaries = [], []
+    for k in range(half + 1):
+        ar, ai = reals[k % half], imaginaries[k % half]
+        br, bi = reals[-k % half], -imaginaries[-k % half]
+        # The transforms of the even and of the odd samples.
+        er, ei = (ar + br) / 2, (ai + bi) / 2
+        orr, oi = (ai - bi) / 2, -(ar - br) / 2
+        c, s = cosines[k % n], sines[k % n]
+        result_reals.append(er + orr * c - oi * s)
+        result_imaginaries.append(ei + orr * s + oi * c)
+    return _output(result_reals, result_imaginaries, None)
+
+def irfft(values, n=None):
+    '''
+    The real sequence whose non-negative frequency terms are values (the inverse of rfft).
+
+    Args
+    ----
+    values : iterable of Complex or int or float
+        The terms X[0], ..., X[n // 2] of the transform.
+    n : int, optional
+        The length of the output (default = 2 * (len(values) - 1)).
+
+    Returns
+    -------
+    list of float
+        The real sequence.
+
+    Raises
+    ------
+    TypeError
+        If n is not an integer.
+    ValueError
+        If n is not positive or does not match the number of terms.
+    '''
+    reals, imaginaries = _columns(values)
+    if n is None:
+        n = 2 * (len(reals) - 1)
+    if not isinstance(n, int):
+        raise TypeError("The length must be an integer.")
+    if n < 1 or len(reals) != n // 2 + 1:
+        raise ValueError("The length does not match the number of terms.")
+
+    # The missing terms are the conjugates of the given ones.
+    full_reals = reals + [reals[k] for k in range(n - n // 2 - 1, 0, -1)]
+    full_imaginaries = imaginaries + [-imaginaries[k] for k in range(n - n // 2 - 1, 0, -1)]
+    result, _ = _inverse(full_reals, full_imaginaries)
+    return result
+
+def convolve(a, b):
+    '''
+    The linear convolution of two sequences.
+
+    Both sequences are padded to a power of two no smaller than len(a) + len(b) - 1,
+    transformed, multiplied and transformed back.
+
+    Args
+    ----
+    a, b : ComplexArray or iterable of Complex or int or float
+        The sequences to be convolved.
+
+    Returns
+    -------
+    ComplexArray or list of Complex
+        The sequence c[k] = sum(a[j] * b[k - j]), of length len(a) + len(b) - 1, as a
+        ComplexArray if a or b is one and as a list of Complex otherwise.
+
+    Raises
+    ------
+    TypeError
+        If some element is not an instance of Complex, int or float.
+    '''
+    like = a if isinstance(a, ComplexArray) else b
+    a_reals, a_imaginaries = _columns(a)
+    b_reals, b_imaginaries = _columns(b)
+    if not a_reals or not b_reals:
+        return _output([], [], like)
+
+    length = len(a_reals) + len(b_reals) - 1
+    size = 1 << (length - 1).bit_length()
+    for reals, imaginaries in ((a_reals, a_imaginaries), (b_reals, b_imaginaries)):
+        padding = [0.0] * (size - len(reals))
+        reals += padding
+        imaginaries += padding
+    _radix2(a_reals, a_imaginaries)
+    _radix2(b_reals, b_imaginaries)
+    product_reals = [ar * br - ai * bi for ar, ai, br, bi in
+                     zip(a_reals, a_imaginaries, b_reals, b_imaginaries)]
+    product_imaginaries = [ar * bi + ai * br for ar, ai, br, bi in
+                           zip(a_reals, a_imaginaries, b_reals, b_imaginaries)]
+    reals, imaginaries = _inverse(product_reals, product_imaginaries)
+    return _output(reals[:length], imaginaries[:length], like)
@@ -0,0 +1,343 @@
+'''
+Implements a compact binary file format for collections of fractions.
+
+A file starts with an 8-byte header: the magic bytes b"FRAC", the format version, the encoding
+and two reserved bytes. Then come the (numerator, denominator) pairs of the simplified
+fractions, in one of two encodings:
+
+- "varint": the zigzag-encoded numerator and the denominator as LEB128 variable-length
+  integers, so small values take one or two bytes and big integers are supported;
+- "int64": both terms as fixed-width little-endian 64-bit integers, which can be mapped
+  straight into columns without parsing.
+
+Classes
+-------
+FractionReader
+    A memory-mapped reader of fraction files.
+
+Functions
+---------
+write_fractions(file, values, encoding="varint")
+    Writes fractions and integers to a binary file.
+'''
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from .fractions import Fraction, FractionArray
+
+_MAGIC = b"FRAC"
+_VERSION = 1
+_ENCODINGS = {"varint": 0, "int64": 1}
+_HEADER_SIZE = 8
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+# The number of int64 pairs decoded at a time when iterating.
+_CHUNK = 4096
+
+def _varint(value):
+    '''
+    The LEB128 encoding of a non-negative integer.
+    '''
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return encoded
+
+def write_fractions(file, values, encoding="varint"):
+    '''
+    Writes fractions and integers to a binary file.
+
+    The values are consumed one at a time, so any iterable (a generator, a FractionArray) can
+    be written without being held in memory.
+
+    Args
+    ----
+    file : str or path-like or binary file
+        The path of the file to be created, or a file opened for binary writing.
+    values : iterable of Fraction or int
+        The values to be written.
+    encoding : str, optional
+        "varint" for the compact variable-length encoding or "int64" for the fixed-width one
+        (default = "varint").
+
+    Returns
+    -------
+    int
+        The number of values written.
+
+    Raises
+    ------
+    TypeError
+        If some value is not an instance of Fraction or int.
+    ValueError
+        If encoding is not valid.
+    OverflowError
+        If encoding is "int64" and some term does not fit in 64 bits.
+    '''
+    if encoding not in _ENCODINGS:
+        raise ValueError("The encoding must be 'varint' or 'int64'.")
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as opened:
+            return write_fractions(opened, values, encoding)
+
+    file.write(_MAGIC + bytes((_VERSION, _ENCODINGS[encoding], 0, 0)))
+    count = 0
+    buffer = bytearray() if encoding == "varint" else array("q")
+    for value in values:
+        if isinstance(value, int):
+            numerator, denominator = value, 1
+        elif isinstance(value, Fraction):
+            numerator, denominator = value.numerator, value.denominator
+        else:
+            raise TypeError("You can only write fractions and integers.")
+
+        if encoding == "varint":
+            # Zigzag: 0, -1, 1, -2, 2, ... are mapped to 0, 1, 2, 3, 4, ...
+            buffer += _varint(2 * numerator if numerator >= 0 else -2 * numerator - 1)
+            buffer += _varint(denominator)
+        else:
+            if not _INT64_MIN <= numerator <= _INT64_MAX or denominator > _INT64_MAX:
+                raise OverflowError("The int64 encoding only supports terms that fit in 64 " +
+                "bits; use the varint encoding instead.")
+            buffer.append(numerator)
+            buffer.append(denominator)
+        count += 1
+
+        if len(buffer) >= 1 << 16:
+            _flush(file, buffer, encoding)
+            buffer = bytearray() if encoding == "varint" else array("q")
+    _flush(file, buffer, encoding)
+    return count
+
+def _flush(file, buffer, encoding):
+    '''
+    Writes the buffered terms to file, as little-endian bytes.
+    '''
+    if encoding == "int64" and sys.byteorder == "big":
+        buffer.byteswap()
+    file.write(buffer)
+
+class FractionReader:
+    '''
+    A memory-mapped reader of fraction files written by write_fractions.
+
+    The file is mapped, not read: iterating decodes the fractions lazily, straight from the
+    mapping, and the columns of an int64 file are exposed as views of it, without parsing or
+    copying.
+
+    Attributes
+    ----------
+    encoding : str
+        The encoding of the file, "varint" or "int64".
+
+    Methods
+    -------
+    columns():
+        The numerator and denominator columns of an int64 file, without copying.
+    to_array():
+        All the fractions as a FractionArray.
+    close():
+        Closes the file.
+    '''
+    def __init__(self, path):
+        '''
+        Initializes a FractionReader instance.
+
+        Args
+        ----
+        path : str or path-like
+            The path of the file to be read.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a fraction file or has an unknown version or encoding.
+        '''
+        self._file = open(path, "rb")
+        try:
+            header = self._file.read(_HEADER_SIZE)
+            if len(header) != _HEADER_SIZE or header[:4] != _MAGIC:
+                raise ValueError("The file is not a fraction file.")
+            if header[4] != _VERSION:
+                raise ValueError(f"Unknown fraction file version: {header[4]}.")
+            encodings = {code: name for name, code in _ENCODINGS.items()}
+            if header[5] not in encodings:
+                raise ValueError(f"Unknown fraction file encoding: {header[5]}.")
+            self.encoding = encodings[header[5]]
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        self._size = len(self._map) - _HEADER_SIZE
+        self._length = None
+
+        if self.encoding == "int64" and self._size % 16:
+            self.close()
+            raise ValueError("The file is truncated.")
+
+    def __repr__(self):
+        '''
+        The abstract representation of an instance of FractionReader.
+        '''
+        return f"FractionReader(<{self._file.name!r}, {self.encoding}>)"
+
+    def __enter__(self):
+        '''
+        Returns the reader itself, to be closed at the end of a with block.
+        '''
+        return self
+
+    def __exit__(self, *exc_info):
+        '''
+        Closes the reader.
+        '''
+        self.close()
+
+    def close(self):
+        '''
+        Closes the file.
+
+        Views returned by columns() must be released before; if some is still alive, the file
+        is closed anyway and BufferError is raised, the mapping being kept until the views go
+        away.
+        '''
+        if self._map.closed and self._file.closed:
+            return
+        try:
+            self._map.close()
+        finally:
+            self._file.close()
+
+    def _pairs(self):
+        '''
+        Yields the (numerator, denominator) pairs stored in the file.
+
+        The pairs are unpacked from the mapping in chunks, so no view of it outlives a step of
+        the iteration and the reader can be closed while an iterator is alive.
+        '''
+        if self.encoding == "int64":
+            count = self._size // 16
+            for start in range(0, count, _CHUNK):
+                size = min(_CHUNK, count - start)
+                terms = struct.unpack_from(f"<{2 * size}q", self._map,
+                                           _HEADER_SIZE + 16 * start)
+                yield from zip(terms[0::2], terms[1::2])
+            return
+
+        view, position, size = self._map, _HEADER_SIZE, len(self._map)
+        terms = []
+        while position < size:
+            value, shift = 0, 0
+            while True:
+                byte = view[position]
+                position += 1
+                value |= (byte & 0x7F) << shift
+                shift += 7
+                if byte < 0x80:
+                    break
+                if position == size:
+                    raise ValueError("The file is truncated.")
+            terms.append(value)
+            if len(terms) == 2:
+                zigzag, denominator = terms
+                yield (zigzag >> 1 if not zigzag & 1 else -(zigzag >> 1) - 1), denominator
+                terms = []
+        if terms:
+            raise ValueError("The file is truncated.")
+
+    def __iter__(self):
+        '''
+        Yields the fractions stored in the file, decoding them lazily.
+        '''
+        for numerator, denominator in self._pairs():
+            yield Fraction(numerator, denominator)
+
+    def __len__(self):
+        '''
+        The number of fractions in the file (a varint file is scanned the first time).
+        '''
+        if self._length is None:
+            if self.encoding == "int64":
+                self._length = self._size // 16
+            else:
+                self._length = sum(1 for _ in self._pairs())
+        return self._length
+
+    def __getitem__(self, index):
+        '''
+        The fraction at index, read directly from the mapping of an int64 file.
+
+        Args
+        ----
+        index : int
+            The position of the fraction.
+
+        Returns
+        -------
+        Fraction
+            The fraction at index.
+
+        Raises
+        ------
+        TypeError
+            If the file does not use the int64 encoding, which has no random access.
+        IndexError
+            If index is out of range.
+        '''
+        if self.encoding != "int64":
+            raise TypeError("Only int64 fraction files support random access.")
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("The index is out of range.")
+        return Fraction(*struct.unpack_from("<2q", self._map, _HEADER_SIZE + 16 * index))
+
+    def columns(self):
+        '''
+        The numerator and denominator columns of an int64 file, without copying.
+
+        Returns
+        -------
+        tuple of memoryview
+            Views of the numerators and of the denominators, as 64-bit integers.
+
+        Raises
+        ------
+        TypeError
+            If the file does not use the int64 encoding.
+        '''
+        if self.encoding != "int64":
+            raise TypeError("Only int64 fraction files have fixed-width columns.")
+        if sys.byteorder == "big":
+            pairs = array("q", self._map[_HEADER_SIZE:])
+            pairs.byteswap()
+            pairs = memoryview(pairs)
+        else:
+            with memoryview(self._map) as view:
+                pairs = view[_HEADER_SIZE:].cast("q")
+        return pairs[0::2], pairs[1::2]
+
+    def to_array(self):
+        '''
+        All the fractions as a FractionArray.
+
+        Returns
+        -------
+        FractionArray
+            The fractions stored in the file.
+        '''
+        if self.encoding == "int64":
+            numerators, denominators = self.columns()
+            with numerators, denominators:
+                return FractionArray.from_columns(numerators.tolist(), denominators.tolist())
+        numerators, denominators = [], []
+        for numerator, denominator in self._pairs():
+            numerators.append(numerator)
+            denominators.append(denominator)
+        return FractionArray.from_columns(numerators, denominators)
@@ -5,14 +5,354 @@ Classes
 -------
 Fraction
     A fraction in its simplest form.
+FractionArray
+    A columnar array of fractions in their simplest form.
+BoundedPrecision
+    A policy that keeps the results of Fraction arithmetic within a bounded precision.
+CanonicalCache
+    A bounded cache from raw (numerator, denominator) pairs to the fractions they build.
+
+Functions
+---------
+unreduced(max_bits=1024)
+    Context manager that defers the simplification of arithmetic results.
+fsum(values)
+    The exact sum of fractions and integers.
+fprod(values)
+    The exact product of fractions and integers.
+fdot(values, weights)
+    The exact dot product of two sequences of fractions and integers.
+fmean(values)
+    The exact arithmetic mean of fractions and integers.
+parse_fractions(source, column=None, delimiter=',', skip_header=False, chunk_size=None)
+    Streams the fractions written in the lines of a text or CSV source.
+sort_fractions(values, reverse=False)
+    Sorts fractions and integers, comparing precomputed keys.
 '''
 
-from math import gcd
+import csv
+import re
+import sys
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
+from math import gcd, inf, isqrt
+
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+# Interned instances of the small integers and of one half, filled in after Fraction.
+_INTERN_LIMIT = 256
+_interned = {}
+
+_ROUNDING_MODES = ("nearest", "floor", "ceiling")
+
+# Above this many bits in the denominators, comparisons try the bit length bounds of _compare
+# before multiplying; below it, multiplying is cheaper than the bounds.
+_COMPARE_BITS = 1024
+
+# The BoundedPrecision policy in effect; None when results are kept exact.
+_precision_policy = None
+
+# An integer, a fraction "n/d" or a decimal in positional or scientific notation.
+_FRACTION_PATTERN = re.compile(r'''
+    \s*(?P<sign>[-+]?)
+    (?=\d|\.\d)(?P<integer>\d*)
+    (?:\.(?P<decimals>\d*))?
+    (?:[eE](?P<exponent>[-+]?\d+))?
+    (?:\s*/\s*(?P<denominator>[-+]?\d+))?
+    \s*$''', re.VERBOSE)
+
+# Bit length above which a deferred result is simplified; None while unreduced() is inactive.
+_unreduced_max_bits = None
+
+# The CanonicalCache in effect for Fraction construction; None when caching is off.
+_canonical_cache = None
+_EVICTIONS = ("lru", "fifo")
+
+@contextmanager
+def unreduced(max_bits=1024):
+    '''
+    Defers the simplification of the results of +, -, * and / inside a with block.
+
+    While active, arithmetic results skip the greatest common divisor and are only simplified
+    when observed (by ==, hash, str, repr, float, int, complex, reading their numerator or
+    denominator, or normalize()), or as soon as their denominator grows beyond max_bits bits.
+
+    Args
+    ----
+    max_bits : int, optional
+        The bit length of the denominator that forces a simplification (default = 1024).
+
+    Raises
+    ------
+    TypeError
+        If max_bits is not an instance of int.
+    ValueError
+        If max_bits is not positive.
+    '''
+    global _unreduced_max_bits
+    if not isinstance(max_bits, int):
+        raise TypeError("The maximum bit length must be an integer.")
+    if max_bits <= 0:
+        raise ValueError("The maximum bit length must be a positive integer.")
+
+    previous = _unreduced_max_bits
+    _unreduced_max_bits = max_bits
+    try:
+        yield
+    finally:
+        _unreduced_max_bits = previous
+
+def _add_reduced(na, da, nb, db):
+    '''
+    The sum na/da + nb/db of two simplified fractions, already simplified.
+
+    Henrici's algorithm (Knuth, TAOCP vol. 2, 4.5.1): the greatest common divisors are taken of
+    the denominators and of their common factor, never of the full cross products.
+    '''
+    factor = gcd(da, db)
+    if factor == 1:
+        return na * db + da * nb, da * db
+    scale = da // factor
+    numerator = na * (db // factor) + nb * scale
+    factor = gcd(numerator, factor)
+    return numerator // factor, scale * (db // factor)
+
+def _mul_reduced(na, da, nb, db):
+    '''
+    The product (na/da) * (nb/db) of two simplified fractions, already simplified.
+
+    Cross-cancellation (Knuth, TAOCP vol. 2, 4.5.1): na is reduced against db and nb against da
+    before multiplying, so no gcd is ever taken of the products. db must be positive.
+    '''
+    factor_a = gcd(na, db)
+    factor_b = gcd(nb, da)
+    return (na // factor_a) * (nb // factor_b), (da // factor_b) * (db // factor_a)
+
+def _approximation_bounds(numerator, denominator, max_denominator):
+    '''
+    The best lower and upper approximations of numerator/denominator with bounded denominator.
+
+    Walks the continued fraction of the value until the next convergent would exceed
+    max_denominator. The last convergent and the largest admissible semiconvergent then lie on
+    opposite sides of the value, and no fraction with denominator <= max_denominator lies
+    between them (Khinchin, Continued Fractions, theorem 15). denominator must be positive and
+    greater than max_denominator, so that the value is not representable itself.
+
+    Returns
+    -------
+    tuple
+        The (numerator, denominator) pairs of the lower and of the upper bound.
+    '''
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = numerator, denominator
+    while True:
+        term = n // d
+        q2 = q0 + term * q1
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + term * p1, q2
+        n, d = d, n - term * d
+
+    steps = (max_denominator - q0) // q1
+    semiconvergent = (p0 + steps * p1, q0 + steps * q1)
+    convergent = (p1, q1)
+    if convergent[0] * denominator < numerator * convergent[1]:
+        return convergent, semiconvergent
+    return semiconvergent, convergent
+
+def _approximate(numerator, denominator, max_denominator, rounding):
+    '''
+    The best approximation of numerator/denominator with bounded denominator, as a pair.
+
+    rounding is one of "nearest", "floor" or "ceiling"; see Fraction.limit_denominator.
+    '''
+    lower, upper = _approximation_bounds(numerator, denominator, max_denominator)
+    if rounding == "floor":
+        return lower
+    if rounding == "ceiling":
+        return upper
+
+    # Both distances share the denominator of the value, so comparing the numerators suffices.
+    lower_distance = (numerator * lower[1] - lower[0] * denominator) * upper[1]
+    upper_distance = (upper[0] * denominator - numerator * upper[1]) * lower[1]
+    if lower_distance < upper_distance or \
+       (lower_distance == upper_distance and lower[1] < upper[1]):
+        return lower
+    return upper
+
+def _compare(na, da, nb, db):
+    '''
+    -1, 0 or 1 as na/da is smaller than, equal to or greater than nb/db (da, db > 0).
+
+    The signals and the bit lengths of the cross products decide most comparisons; the products
+    themselves are only computed when the bit lengths are within one of each other.
+    '''
+    if (na < 0) != (nb < 0):
+        return -1 if na < 0 else 1
+    if na and nb:
+        # |na * db| has left or left - 1 bits, |nb * da| has right or right - 1 bits.
+        left = na.bit_length() + db.bit_length()
+        right = nb.bit_length() + da.bit_length()
+        if left > right + 1:
+            return -1 if na < 0 else 1
+        if right > left + 1:
+            return 1 if na < 0 else -1
+    left, right = na * db, nb * da
+    return (left > right) - (left < right)
+
+# The digits of the expansions in bases 2 to 36.
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+def _check_base(base):
+    '''
+    Raises TypeError or ValueError if base is not an integer from 2 to 36.
+    '''
+    if not isinstance(base, int):
+        raise TypeError("The base must be an integer.")
+    if not 2 <= base <= len(_DIGITS):
+        raise ValueError(f"The base must be between 2 and {len(_DIGITS)}.")
+
+def _to_base(value, base):
+    '''
+    The digits of a non-negative integer in the given base.
+    '''
+    if base == 10:
+        return str(value)
+    digits = []
+    while True:
+        value, digit = divmod(value, base)
+        digits.append(_DIGITS[digit])
+        if not value:
+            return "".join(reversed(digits))
+
+# The primes found by trial division before Pollard's rho takes over, which are also the bases of
+# the Miller-Rabin test (deterministic below 3.3 * 10 ** 24).
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def _is_prime(n):
+    '''
+    Whether n > 1 is prime, by the Miller-Rabin test.
+    '''
+    if n in _SMALL_PRIMES:
+        return True
+    if any(n % prime == 0 for prime in _SMALL_PRIMES):
+        return False
+    odd, twos = n - 1, 0
+    while not odd & 1:
+        odd >>= 1
+        twos += 1
+    for witness in _SMALL_PRIMES:
+        power = pow(witness, odd, n)
+        if power in (1, n - 1):
+            continue
+        for _ in range(twos - 1):
+            power = power * power % n
+            if power == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def _rho(n):
+    '''
+    A non-trivial factor of the odd composite n, by Brent's variant of Pollard's rho.
+    '''
+    for constant in range(1, n):
+        x = y = saved = 2
+        factor, length, product = 1, 1, 1
+        while factor == 1:
+            x = y
+            for _ in range(length):
+                y = (y * y + constant) % n
+            steps = 0
+            while steps < length and factor == 1:
+                saved = y
+                for _ in range(min(128, length - steps)):
+                    y = (y * y + constant) % n
+                    product = product * abs(x - y) % n
+                factor = gcd(product, n)
+                steps += 128
+            length *= 2
+        if factor == n:
+            # The batched gcd overshot: retrace the last batch one step at a time.
+            factor = 1
+            while factor == 1:
+                saved = (saved * saved + constant) % n
+                factor = gcd(abs(x - saved), n)
+        if factor != n:
+            return factor
+
+def _factorize(n):
+    '''
+    The prime factorization of a positive integer, as a dict from primes to exponents.
+    '''
+    factors = {}
+    for prime in _SMALL_PRIMES:
+        while n % prime == 0:
+            factors[prime] = factors.get(prime, 0) + 1
+            n //= prime
+    pending = [n] if n > 1 else []
+    while pending:
+        n = pending.pop()
+        if _is_prime(n):
+            factors[n] = factors.get(n, 0) + 1
+        elif isqrt(n) ** 2 == n:
+            pending += [isqrt(n)] * 2
+        else:
+            factor = _rho(n)
+            pending += [factor, n // factor]
+    return factors
+
+def _multiplicative_order(base, modulus):
+    '''
+    The multiplicative order of base modulo modulus > 1, which must be coprime.
+
+    The order divides Carmichael's lambda of the modulus, the least common multiple of the
+    lambdas of its prime powers: p**(k-1) * (p-1), halved for powers of 2 above 4. Starting from
+    lambda, each prime factor is divided out while the power of the base stays one.
+    '''
+    order, primes = 1, {}
+    for prime, exponent in _factorize(modulus).items():
+        if prime == 2:
+            part = 1 << (exponent - 2 if exponent > 2 else exponent - 1)
+        else:
+            part = prime ** (exponent - 1) * (prime - 1)
+            if exponent > 1:
+                primes[prime] = True
+            primes.update(dict.fromkeys(_factorize(prime - 1), True))
+        order = order * part // gcd(order, part)
+    if order % 2 == 0:
+        primes[2] = True
+    for prime in primes:
+        while order % prime == 0 and pow(base, order // prime, modulus) == 1:
+            order //= prime
+    return order
+
+def _order_key(value):
+    '''
+    The (float approximation, value) key of a fraction or integer, see Fraction.sort_key.
+    '''
+    if isinstance(value, int):
+        numerator, denominator = value, 1
+    elif isinstance(value, Fraction):
+        numerator, denominator = value.numerator, value.denominator
+    else:
+        raise TypeError("You can only sort fractions and integers.")
+    try:
+        approximation = numerator / denominator
+    except OverflowError:
+        approximation = inf if numerator > 0 else -inf
+    return approximation, value
 
 class Fraction:
     '''
     A Fraction in its simplest form.
 
+    Fractions are immutable and hashable, with the same hash as the int or float of equal value.
+
     Attributes
     ----------
     numerator : int
@@ -20,9 +360,15 @@ class Fraction:
     denominator : int
         The denominator of the simplified fraction.
     '''
-    def __init__(self, numerator, denominator=1):
+    __slots__ = ("_numerator", "_denominator", "_normalized")
+
+    def __new__(cls, numerator, denominator=1):
         '''
-        Initializes a Fraction instance.
+        Creates a Fraction instance.
+
+        Small integers and one half are interned, so the same instance is returned for them.
+        Inside a CanonicalCache block, repeated (numerator, denominator) pairs are answered by
+        the cache.
 
         Parameters
         ----------
@@ -44,6 +390,13 @@ class Fraction:
         if denominator == 0:
             raise ZeroDivisionError("The denominator must not be equal to zero.")
 
+        cache = _canonical_cache
+        if cache is not None:
+            key = (numerator, denominator)
+            instance = cache.lookup(key)
+            if instance is not None:
+                return instance
+
         # Fraction's signal handling
         if numerator * denominator >= 0:
             signal = 1
@@ -53,8 +406,467 @@ class Fraction:
         # Using greatest common divisor to simplify the fraction.
         factor = gcd(numerator, denominator)
 
-        self.numerator = signal * numerator // factor
-        self.denominator = denominator // factor
+        numerator, denominator = signal * numerator // factor, denominator // factor
+        if denominator <= 2:
+            interned = _interned.get((numerator, denominator))
+            if interned is not None:
+                if cache is not None:
+                    cache.store(key, interned)
+                return interned
+        instance = object.__new__(cls)
+        instance._numerator = numerator
+        instance._denominator = denominator
+        instance._normalized = True
+        if cache is not None:
+            cache.store(key, instance)
+        return instance
+
+    @classmethod
+    def _new(cls, numerator, denominator):
+        '''
+        Builds the result of an arithmetic operation from integers with a nonzero denominator.
+
+        The result is simplified right away, unless unreduced() is active and the denominator
+        is still within its bit length limit. An active BoundedPrecision policy takes
+        precedence over unreduced().
+        '''
+        if _unreduced_max_bits is None:
+            return cls(numerator, denominator)
+
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        if _precision_policy is not None:
+            factor = gcd(numerator, denominator)
+            return _precision_policy.bound(numerator // factor, denominator // factor)
+        instance = object.__new__(cls)
+        instance._numerator = numerator
+        instance._denominator = denominator
+        instance._normalized = False
+        if denominator.bit_length() > _unreduced_max_bits:
+            instance.normalize()
+        return instance
+
+    @classmethod
+    def _result(cls, numerator, denominator):
+        '''
+        Builds the simplified result of an arithmetic operation, applying the active
+        BoundedPrecision policy, if any.
+        '''
+        if _precision_policy is not None:
+            return _precision_policy.bound(numerator, denominator)
+        return cls._from_reduced(numerator, denominator)
+
+    @classmethod
+    def _from_reduced(cls, numerator, denominator):
+        '''
+        Builds a fraction from integers already in their simplest form, with denominator > 0.
+        '''
+        if denominator <= 2:
+            interned = _interned.get((numerator, denominator))
+            if interned is not None:
+                return interned
+        instance = object.__new__(cls)
+        instance._numerator = numerator
+        instance._denominator = denominator
+        instance._normalized = True
+        return instance
+
+    @property
+    def numerator(self):
+        '''
+        The numerator of the simplified fraction.
+        '''
+        if not self._normalized:
+            self.normalize()
+        return self._numerator
+
+    @property
+    def denominator(self):
+        '''
+        The denominator of the simplified fraction.
+        '''
+        if not self._normalized:
+            self.normalize()
+        return self._denominator
+
+    def normalize(self):
+        '''
+        Simplifies a fraction whose simplification was deferred by unreduced().
+
+        Returns
+        -------
+        Fraction
+            The fraction itself, in its simplest form.
+        '''
+        if not self._normalized:
+            factor = gcd(self._numerator, self._denominator)
+            self._numerator //= factor
+            self._denominator //= factor
+            self._normalized = True
+        return self
+
+    def __hash__(self):
+        '''
+        The hash of the fraction, equal to the hash of int and float with the same value.
+
+        Returns
+        -------
+        int
+            The hash of the fraction.
+        '''
+        self.normalize()
+        # Python's numeric hash: numerator * inverse(denominator) modulo the hash modulus.
+        try:
+            inverse = pow(self._denominator, -1, _HASH_MODULUS)
+        except ValueError:
+            # The denominator is a multiple of the modulus, so the inverse doesn't exist.
+            hash_value = _HASH_INF
+        else:
+            hash_value = hash(hash(abs(self._numerator)) * inverse)
+        if self._numerator < 0:
+            hash_value = -hash_value
+        return -2 if hash_value == -1 else hash_value
+
+    def __reduce__(self):
+        '''
+        Pickles the fraction by its numerator and denominator.
+        '''
+        self.normalize()
+        return (Fraction, (self._numerator, self._denominator))
+
+    def __copy__(self):
+        '''
+        Fractions are immutable, so a copy is the fraction itself.
+        '''
+        return self
+
+    def __deepcopy__(self, memo):
+        '''
+        Fractions are immutable, so a copy is the fraction itself.
+        '''
+        return self
+
+    @classmethod
+    def from_string(cls, string):
+        '''
+        Creates a fraction from its text representation.
+
+        Accepts integers ("7"), fractions ("-3/4" or "-3 / 4") and decimals in positional or
+        scientific notation ("0.125", "-1.5e-3"), which are converted exactly.
+
+        Args
+        ----
+        string : str
+            The text representation of the fraction.
+
+        Returns
+        -------
+        Fraction
+            The fraction in its simplest form.
+
+        Raises
+        ------
+        TypeError
+            If string is not an instance of str.
+        ValueError
+            If string is not a valid representation of a fraction.
+        ZeroDivisionError
+            If the denominator is set to zero.
+        '''
+        return cls(*_parse(string))
+
+    @classmethod
+    def from_float(cls, value, max_denominator=None):
+        '''
+        Creates a fraction from a float.
+
+        Args
+        ----
+        value : float or int
+            The number to be converted.
+        max_denominator : int, optional
+            If given, the result is the closest fraction to value with denominator at most
+            max_denominator; otherwise the conversion is exact (default = None).
+
+        Returns
+        -------
+        Fraction
+            The fraction in its simplest form.
+
+        Raises
+        ------
+        TypeError
+            If value is not an instance of float or int.
+        ValueError
+            If value is nan.
+        OverflowError
+            If value is infinite.
+        '''
+        if not isinstance(value, (float, int)):
+            raise TypeError("Only floats and integers can be converted to a fraction.")
+
+        fraction = cls(*value.as_integer_ratio())
+        if max_denominator is None:
+            return fraction
+        return fraction.limit_denominator(max_denominator)
+
+    def limit_denominator(self, max_denominator=1000000, rounding="nearest"):
+        '''
+        The best approximation of the current fraction with a bounded denominator.
+
+        Args
+        ----
+        max_denominator : int, optional
+            The greatest denominator allowed (default = 1000000).
+        rounding : str, optional
+            "nearest" for the closest fraction (on a tie, the one with the smallest
+            denominator), "floor" for the greatest fraction not above the current one or
+            "ceiling" for the smallest fraction not below it (default = "nearest").
+
+        Returns
+        -------
+        Fraction
+            The best approximation with denominator at most max_denominator.
+
+        Raises
+        ------
+        TypeError
+            If max_denominator is not an instance of int.
+        ValueError
+            If max_denominator is smaller than one or rounding is not a valid mode.
+        '''
+        if not isinstance(max_denominator, int):
+            raise TypeError("The maximum denominator must be an integer.")
+        if max_denominator < 1:
+            raise ValueError("The maximum denominator must be a positive integer.")
+        if rounding not in _ROUNDING_MODES:
+            raise ValueError("The rounding must be 'nearest', 'floor' or 'ceiling'.")
+
+        self.normalize()
+        if self._denominator <= max_denominator:
+            return self
+        return Fraction._from_reduced(*_approximate(self._numerator, self._denominator,
+                                                    max_denominator, rounding))
+
+    def continued_fraction(self):
+        '''
+        The terms of the regular continued fraction of the current fraction.
+
+        Returns
+        -------
+        list of int
+            The terms [a0, a1, ..., an], with a0 = floor(self) and the others positive.
+        '''
+        self.normalize()
+        terms = []
+        numerator, denominator = self._numerator, self._denominator
+        while denominator:
+            term = numerator // denominator
+            terms.append(term)
+            numerator, denominator = denominator, numerator - term * denominator
+        return terms
+
+    def convergents(self):
+        '''
+        Yields the convergents of the continued fraction of the current fraction.
+
+        Each convergent is the best approximation among the fractions with denominator no
+        greater than its own; the last one is the fraction itself.
+
+        Yields
+        ------
+        Fraction
+            The successive convergents.
+        '''
+        p0, q0, p1, q1 = 0, 1, 1, 0
+        for term in self.continued_fraction():
+            p0, q0, p1, q1 = p1, q1, p0 + term * p1, q0 + term * q1
+            yield Fraction._from_reduced(p1, q1)
+
+    def digits(self, base=10):
+        '''
+        Yields the digits of the expansion of the fractional part of |self|, one at a time.
+
+        The digits are computed by long division, so only the current remainder is kept; the
+        generator stops if the expansion terminates and runs forever if it repeats.
+
+        Args
+        ----
+        base : int, optional
+            The base of the expansion, from 2 to 36 (default = 10).
+
+        Yields
+        ------
+        int
+            The successive digits after the point.
+        '''
+        _check_base(base)
+        self.normalize()
+        denominator = self._denominator
+        remainder = abs(self._numerator) % denominator
+        while remainder:
+            digit, remainder = divmod(remainder * base, denominator)
+            yield digit
+
+    def period(self, base=10):
+        '''
+        The lengths of the pre-period and of the repeating period of the expansion.
+
+        The pre-period is the number of times the factors shared by the base can be divided out
+        of the denominator; the period is the multiplicative order of the base modulo what is
+        left, found from the factorization of Carmichael's lambda of it (by Pollard's rho), so
+        it takes milliseconds even for 64-bit denominators.
+
+        Args
+        ----
+        base : int, optional
+            The base of the expansion, from 2 to 36 (default = 10).
+
+        Returns
+        -------
+        tuple of int
+            The number of digits before the repetition and the number of repeating digits (zero
+            if the expansion terminates).
+        '''
+        _check_base(base)
+        self.normalize()
+        denominator, pre_period = self._denominator, 0
+        while (common := gcd(denominator, base)) > 1:
+            denominator //= common
+            pre_period += 1
+        if denominator == 1:
+            return pre_period, 0
+        return pre_period, _multiplicative_order(base, denominator)
+
+    def nth_digit(self, index, base=10):
+        '''
+        The digit at index in the expansion of the fractional part of |self|.
+
+        The remainder before that digit is base ** (index - 1) * numerator modulo the
+        denominator, which modular exponentiation finds without the previous digits.
+
+        Args
+        ----
+        index : int
+            The position of the digit after the point, starting at one.
+        base : int, optional
+            The base of the expansion, from 2 to 36 (default = 10).
+
+        Returns
+        -------
+        int
+            The digit.
+
+        Raises
+        ------
+        TypeError
+            If index is not an integer.
+        ValueError
+            If index is smaller than one.
+        '''
+        _check_base(base)
+        if not isinstance(index, int):
+            raise TypeError("The index of a digit must be an integer.")
+        if index < 1:
+            raise ValueError("The index of a digit must be a positive integer.")
+        self.normalize()
+        denominator = self._denominator
+        remainder = abs(self._numerator) * pow(base, index - 1, denominator) % denominator
+        return remainder * base // denominator
+
+    def to_decimal(self, places, base=10, rounding="nearest"):
+        '''
+        The expansion of the current fraction rounded to a fixed number of places.
+
+        Args
+        ----
+        places : int
+            The number of digits after the point.
+        base : int, optional
+            The base of the expansion, from 2 to 36 (default = 10).
+        rounding : str, optional
+            "nearest" for the closest value (on a tie, the one with an even last digit),
+            "floor" for the greatest value not above the current one or "ceiling" for the
+            smallest one not below it (default = "nearest").
+
+        Returns
+        -------
+        str
+            The exactly rounded expansion, such as "-0.333" or "3.1416".
+
+        Raises
+        ------
+        TypeError
+            If places is not an integer.
+        ValueError
+            If places is negative or rounding is not a valid mode.
+        '''
+        _check_base(base)
+        if not isinstance(places, int):
+            raise TypeError("The number of places must be an integer.")
+        if places < 0:
+            raise ValueError("The number of places must not be negative.")
+        if rounding not in _ROUNDING_MODES:
+            raise ValueError("The rounding must be 'nearest', 'floor' or 'ceiling'.")
+
+        self.normalize()
+        quotient, remainder = divmod(self._numerator * base ** places, self._denominator)
+        if remainder and (rounding == "ceiling" or rounding == "nearest" and
+                          (2 * remainder > self._denominator or
+                           2 * remainder == self._denominator and quotient % 2)):
+            quotient += 1
+
+        sign = "-" if quotient < 0 else ""
+        digits = _to_base(abs(quotient), base).rjust(places + 1, "0")
+        if not places:
+            return sign + digits
+        return f"{sign}{digits[:-places]}.{digits[-places:]}"
+
+    def repeating(self, base=10):
+        '''
+        The exact expansion of the current fraction, with the repeating digits in parentheses.
+
+        The lengths come from period(), but every digit of the pre-period and of the period is
+        written out, so the cost grows with them (a prime denominator near 10 ** 9 may have a
+        period of a billion digits); use period() and nth_digit() to inspect long expansions.
+
+        Args
+        ----
+        base : int, optional
+            The base of the expansion, from 2 to 36 (default = 10).
+
+        Returns
+        -------
+        str
+            The expansion, such as "0.1(6)" for 1/6 or "0.125" for 1/8.
+        '''
+        pre_period, length = self.period(base)
+        integer = _to_base(abs(self._numerator) // self._denominator, base)
+        sign = "-" if self._numerator < 0 else ""
+        digits = "".join(_DIGITS[digit] for digit in
+                         islice(self.digits(base), pre_period + length))
+        if not digits:
+            return sign + integer
+        if length:
+            digits = f"{digits[:pre_period]}({digits[pre_period:]})"
+        return f"{sign}{integer}.{digits}"
+
+    def sort_key(self):
+        '''
+        A key that orders fractions as they compare, but is mostly compared as a float.
+
+        The key is the pair (float(self), self). Correctly rounded division is monotonic, so
+        different floats are ordered like the fractions, and the exact comparison only runs
+        when the floats tie. Meant for sorted(..., key=Fraction.sort_key) and for bisecting
+        a list of precomputed keys.
+
+        Returns
+        -------
+        tuple
+            The float approximation of the fraction (infinite if out of range) and the
+            fraction itself.
+        '''
+        return _order_key(self)
 
     def __repr__(self):
         '''
@@ -65,7 +877,8 @@ class Fraction:
         str
             Fraction({self.numerator}, {self.denominator})
         '''
-        return f"Fraction({self.numerator}, {self.denominator})"
+        self.normalize()
+        return f"Fraction({self._numerator}, {self._denominator})"
 
     def __str__(self):
         '''
@@ -76,11 +889,12 @@ class Fraction:
         str
             A visual representation of a simplified fraction.
         '''
-        if self.denominator == 1:
-            return f"{self.numerator}"
-        if self.numerator == 0:
+        self.normalize()
+        if self._denominator == 1:
+            return f"{self._numerator}"
+        if self._numerator == 0:
             return "0"
-        return f"{self.numerator} / {self.denominator}"
+        return f"{self._numerator} / {self._denominator}"
 
     def __add__(self, other):
         '''
@@ -101,15 +915,23 @@ class Fraction:
         TypeError
             If other is not an instance of Fraction or int.
         '''
-        # Exception handling
+        # Exception handling; an array broadcasts the fraction through its reflected operator.
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only add to a fraction another fraction or an integer.")
 
-        numerator = other.denominator * self.numerator + self.denominator * other.numerator
-        denominator = self.denominator * other.denominator
-        return Fraction(numerator, denominator)
+        if _unreduced_max_bits is not None:
+            numerator = other._denominator * self._numerator + self._denominator * other._numerator
+            denominator = self._denominator * other._denominator
+            return Fraction._new(numerator, denominator)
+
+        self.normalize()
+        other.normalize()
+        return Fraction._result(*_add_reduced(self._numerator, self._denominator,
+                                              other._numerator, other._denominator))
 
     def __iadd__(self, other):
         '''
@@ -131,8 +953,10 @@ class Fraction:
             If other is not an instance of Fraction or of int.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only add to a fraction another fraction or an integer.")
 
@@ -158,12 +982,22 @@ class Fraction:
             If other is not an instance of Fraction or of int.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only subtract from a fraction another fraction or an integer.")
 
-        return self + Fraction(-1) * other
+        if _unreduced_max_bits is not None:
+            numerator = other._denominator * self._numerator - self._denominator * other._numerator
+            denominator = self._denominator * other._denominator
+            return Fraction._new(numerator, denominator)
+
+        self.normalize()
+        other.normalize()
+        return Fraction._result(*_add_reduced(self._numerator, self._denominator,
+                                              -other._numerator, other._denominator))
 
     def __isub__(self, other):
         '''
@@ -185,8 +1019,10 @@ class Fraction:
             If other is not an instance of Fraction or of int.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only subtract from a fraction another fraction or an integer.")
 
@@ -212,14 +1048,22 @@ class Fraction:
             If other is not an instance of Fraction or of int. 
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only multiply a fraction by another fraction or an integer.")
 
-        numerator = self.numerator * other.numerator
-        denominator = self.denominator * other.denominator
-        return Fraction(numerator, denominator)
+        if _unreduced_max_bits is not None:
+            numerator = self._numerator * other._numerator
+            denominator = self._denominator * other._denominator
+            return Fraction._new(numerator, denominator)
+
+        self.normalize()
+        other.normalize()
+        return Fraction._result(*_mul_reduced(self._numerator, self._denominator,
+                                              other._numerator, other._denominator))
 
     def __imul__(self, other):
         '''
@@ -241,8 +1085,10 @@ class Fraction:
             If other is not an instance of Fraction or of int. 
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only multiply a fraction by another fraction or an integer.")
 
@@ -270,16 +1116,28 @@ class Fraction:
             If other is equal to zero.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only divide a fraction by another fraction or by an integer.")
-        if other.numerator == 0:
+        if other._numerator == 0:
             raise ZeroDivisionError("Division by zero is undefined.")
 
-        numerator = self.numerator * other.denominator
-        denominator = self.denominator * other.numerator
-        return Fraction(numerator, denominator)
+        if _unreduced_max_bits is not None:
+            numerator = self._numerator * other._denominator
+            denominator = self._denominator * other._numerator
+            return Fraction._new(numerator, denominator)
+
+        self.normalize()
+        other.normalize()
+        # Multiplies by the inverse of other, keeping the signal on its numerator.
+        if other._numerator < 0:
+            return Fraction._result(*_mul_reduced(self._numerator, self._denominator,
+                                                  -other._denominator, -other._numerator))
+        return Fraction._result(*_mul_reduced(self._numerator, self._denominator,
+                                              other._denominator, other._numerator))
 
     def __itruediv__(self, other):
         '''
@@ -303,11 +1161,13 @@ class Fraction:
             If other is equal to zero.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only divide a fraction by another fraction or by an integer.")
-        if other.numerator == 0:
+        if other._numerator == 0:
             raise ZeroDivisionError("Division by zero is undefined.")
 
         return self / other
@@ -334,16 +1194,18 @@ class Fraction:
             If other is equal to zero.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only divide a fraction by another fraction or by an integer.")
-        if other.numerator == 0:
+        if other._numerator == 0:
             raise ZeroDivisionError("Division by zero is undefined.")
 
-        floordiv =  (self.numerator * other.denominator) // (other.numerator * self.denominator)
+        floordiv =  (self._numerator * other._denominator) // (other._numerator * self._denominator)
 
-        return Fraction(floordiv)
+        return Fraction._from_reduced(floordiv, 1)
 
     def __ifloordiv__(self, other):
         '''
@@ -367,11 +1229,13 @@ class Fraction:
             If other is equal to zero.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only divide a fraction by another fraction or by an integer.")
-        if other.numerator == 0:
+        if other._numerator == 0:
             raise ZeroDivisionError("Division by zero is undefined.")
 
         return self // other
@@ -398,17 +1262,21 @@ class Fraction:
             If other is equal to zero.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only take the module between a fraction and another " +
             "fraction or a fraction and an integer.")
-        if other.numerator == 0:
+        if other._numerator == 0:
             raise ZeroDivisionError("Division by zero is undefined.")
 
-        mod = (self.numerator * other.denominator) % (other.numerator * self.denominator)
+        mod = (self._numerator * other._denominator) % (other._numerator * self._denominator)
 
-        return Fraction(mod)
+        denominator = self._denominator * other._denominator
+        factor = gcd(mod, denominator)
+        return Fraction._result(mod // factor, denominator // factor)
 
     def __imod__(self, other):
         '''
@@ -432,12 +1300,14 @@ class Fraction:
             If other is equal to zero.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
             raise TypeError("You can only take the module between a fraction and another " +
             "fraction or a fraction and an integer.")
-        if other.numerator == 0:
+        if other._numerator == 0:
             raise ZeroDivisionError("Division by zero is undefined.")
 
         return self % other
@@ -462,16 +1332,21 @@ class Fraction:
             If power is not an instance of int.    
         '''
         # Exception handling
+        if isinstance(power, FractionArray):
+            return NotImplemented
         if not isinstance(power, int):
             raise TypeError("The power must be an integer.")
 
+        self.normalize()
+        # Powers of coprime integers are still coprime, so only the signal must be fixed.
         if power < 0:
-            numerator = self.denominator ** abs(power)
-            denominator = self.numerator ** abs(power)
-        else:
-            numerator = self.numerator ** power
-            denominator = self.denominator ** power
-        return Fraction(numerator, denominator)
+            if self._numerator == 0:
+                raise ZeroDivisionError("The denominator must not be equal to zero.")
+            numerator, denominator = self._denominator, self._numerator
+            if denominator < 0:
+                numerator, denominator = -numerator, -denominator
+            return Fraction._result(numerator ** -power, denominator ** -power)
+        return Fraction._result(self._numerator ** power, self._denominator ** power)
 
     def __ipow__(self, power):
         '''
@@ -493,6 +1368,8 @@ class Fraction:
             If power is not an instance of int.    
         '''
          # Exception handling
+        if isinstance(power, FractionArray):
+            return NotImplemented
         if not isinstance(power, int):
             raise TypeError("The power must be an integer.")
 
@@ -510,20 +1387,18 @@ class Fraction:
         Returns
         -------
         Bool
-            The result of the comparison.
-
-        Raises
-        ------
-        TypeError
-            If other is not an instance of Fraction or of int.
+            The result of the comparison, or NotImplemented if other is not an instance of
+            Fraction or of int (so that fractions can share sets and dicts with other objects).
         '''
-        # Exception handling
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
-            raise TypeError("You can only compare a fraction with another fraction or an integer.")
+            return NotImplemented
 
-        return self.numerator * other.denominator == self.denominator * other.numerator
+        # Simplified fractions are equal only if their terms are.
+        self.normalize()
+        other.normalize()
+        return self._numerator == other._numerator and self._denominator == other._denominator
 
     def __lt__(self, other):
         '''
@@ -545,12 +1420,17 @@ class Fraction:
             If other is not an instance of Fraction or of int.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            return self._numerator < other * self._denominator
         if not isinstance(other, Fraction):
             raise TypeError("You can only compare a fraction with another fraction or an integer.")
 
-        return self.numerator * other.denominator < self.denominator * other.numerator
+        if self._denominator.bit_length() + other._denominator.bit_length() > _COMPARE_BITS:
+            return _compare(self._numerator, self._denominator,
+                            other._numerator, other._denominator) < 0
+        return self._numerator * other._denominator < self._denominator * other._numerator
 
     def __le__(self, other):
         '''
@@ -572,12 +1452,17 @@ class Fraction:
             If other is not an instance of Fraction or of int.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            return self._numerator <= other * self._denominator
         if not isinstance(other, Fraction):
             raise TypeError("You can only compare a fraction with another fraction or an integer.")
 
-        return self.numerator * other.denominator <= self.denominator * other.numerator
+        if self._denominator.bit_length() + other._denominator.bit_length() > _COMPARE_BITS:
+            return _compare(self._numerator, self._denominator,
+                            other._numerator, other._denominator) <= 0
+        return self._numerator * other._denominator <= self._denominator * other._numerator
 
     def __gt__(self, other):
         '''
@@ -599,12 +1484,17 @@ class Fraction:
             If other is not an instance of Fraction or of int.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            return self._numerator > other * self._denominator
         if not isinstance(other, Fraction):
             raise TypeError("You can only compare a fraction with another fraction or an integer.")
 
-        return self.numerator * other.denominator > self.denominator * other.numerator
+        if self._denominator.bit_length() + other._denominator.bit_length() > _COMPARE_BITS:
+            return _compare(self._numerator, self._denominator,
+                            other._numerator, other._denominator) > 0
+        return self._numerator * other._denominator > self._denominator * other._numerator
 
     def __ge__(self, other):
         '''
@@ -626,12 +1516,17 @@ class Fraction:
             If other is not an instance of Fraction or of int.
         '''
         # Exception handling
+        if isinstance(other, FractionArray):
+            return NotImplemented
         if isinstance(other, int):
-            other = Fraction(other)
+            return self._numerator >= other * self._denominator
         if not isinstance(other, Fraction):
             raise TypeError("You can only compare a fraction with another fraction or an integer.")
 
-        return self.numerator * other.denominator >= self.denominator * other.numerator
+        if self._denominator.bit_length() + other._denominator.bit_length() > _COMPARE_BITS:
+            return _compare(self._numerator, self._denominator,
+                            other._numerator, other._denominator) >= 0
+        return self._numerator * other._denominator >= self._denominator * other._numerator
 
     def __ne__(self, other):
         '''
@@ -645,26 +1540,22 @@ class Fraction:
         Returns
         -------
         Bool
-            The result of the comparison.
-
-        Raises
-        ------
-        TypeError
-            If other is not an instance of Fraction or of int.
+            The result of the comparison, or NotImplemented if other is not an instance of
+            Fraction or of int (so that fractions can share sets and dicts with other objects).
         '''
-        # Exception handling
         if isinstance(other, int):
-            other = Fraction(other)
+            other = Fraction._from_reduced(other, 1)
         if not isinstance(other, Fraction):
-            raise TypeError("You can only compare a fraction with another fraction or an integer.")
+            return NotImplemented
 
-        return not self == other
+        return not self.__eq__(other)
 
     def __neg__(self):
         '''
         Returns the negative of the fraction (unary subtraction operator).
         '''
-        return Fraction(-1) * self
+        self.normalize()
+        return Fraction._from_reduced(-self._numerator, self._denominator)
 
     def __pos__(self):
         '''
@@ -676,24 +1567,1252 @@ class Fraction:
         '''
         Returns the absolute value of the fraction.
         '''
-        numerator = abs(self.numerator)
-        denominator = self.denominator
-        return Fraction(numerator, denominator)
+        self.normalize()
+        return Fraction._from_reduced(abs(self._numerator), self._denominator)
 
     def __complex__(self):
         '''
         Returns the evaluated fraction as a complex. 
         '''
-        return complex(self.numerator / self.denominator)
+        self.normalize()
+        return complex(self._numerator / self._denominator)
 
     def __int__(self):
         '''
         Returns the approximation of the evaluated fraction as an integer.
         '''
-        return int(self.numerator / self.denominator)
+        self.normalize()
+        return int(self._numerator / self._denominator)
 
     def __float__(self):
         '''
         Returns the evaluated fraction as a float.
         '''
-        return self.numerator / self.denominator
+        self.normalize()
+        return self._numerator / self._denominator
+
+for _value in range(-_INTERN_LIMIT, _INTERN_LIMIT + 1):
+    _interned[_value, 1] = Fraction._from_reduced(_value, 1)
+_interned[1, 2] = Fraction._from_reduced(1, 2)
+_interned[-1, 2] = Fraction._from_reduced(-1, 2)
+del _value
+
+class BoundedPrecision:
+    '''
+    A policy that keeps the results of Fraction arithmetic within a bounded precision.
+
+    Inside a with block, every result of +, -, *, /, % and ** whose denominator exceeds the
+    limit is replaced by its best approximation within the limit, so the cost of each operation
+    stays flat instead of growing with the operands.
+
+    Attributes
+    ----------
+    max_denominator : int or None
+        The greatest denominator allowed.
+    max_bits : int or None
+        The greatest bit length allowed for the denominator.
+    rounding : str
+        The rounding mode: "nearest", "floor" or "ceiling".
+    operations : int
+        The number of results checked by the policy.
+    rounded : int
+        The number of results that had to be rounded.
+
+    Methods
+    -------
+    bound(numerator, denominator):
+        Builds a fraction from a simplified pair, rounding it if needed.
+    reset():
+        Sets the counters back to zero.
+    '''
+    def __init__(self, max_denominator=None, max_bits=None, rounding="nearest"):
+        '''
+        Initializes a BoundedPrecision instance.
+
+        Args
+        ----
+        max_denominator : int, optional
+            The greatest denominator allowed (default = None).
+        max_bits : int, optional
+            The greatest bit length allowed for the denominator (default = None).
+        rounding : str, optional
+            "nearest", "floor" or "ceiling"; see Fraction.limit_denominator
+            (default = "nearest").
+
+        Raises
+        ------
+        TypeError
+            If max_denominator or max_bits are given and are not integers.
+        ValueError
+            If neither limit is given, if a limit is not positive, or if rounding is not a
+            valid mode.
+        '''
+        if max_denominator is None and max_bits is None:
+            raise ValueError("A maximum denominator or a maximum bit length must be given.")
+        for limit in (max_denominator, max_bits):
+            if limit is not None and not isinstance(limit, int):
+                raise TypeError("The limits must be integers.")
+            if limit is not None and limit < 1:
+                raise ValueError("The limits must be positive integers.")
+        if rounding not in _ROUNDING_MODES:
+            raise ValueError("The rounding must be 'nearest', 'floor' or 'ceiling'.")
+
+        self.max_denominator = max_denominator
+        self.max_bits = max_bits
+        self.rounding = rounding
+        self.operations = 0
+        self.rounded = 0
+        self._previous = None
+
+        # The effective limit is the tighter of the two.
+        self._limit = max_denominator if max_denominator is not None else 2 ** max_bits - 1
+        if max_bits is not None:
+            self._limit = min(self._limit, 2 ** max_bits - 1)
+
+    def __repr__(self):
+        '''
+        The abstract representation of an instance of BoundedPrecision.
+        '''
+        return (f"BoundedPrecision(max_denominator={self.max_denominator}, " +
+                f"max_bits={self.max_bits}, rounding={self.rounding!r})")
+
+    def __enter__(self):
+        '''
+        Makes the policy active.
+        '''
+        global _precision_policy
+        self._previous = _precision_policy
+        _precision_policy = self
+        return self
+
+    def __exit__(self, *exc_info):
+        '''
+        Restores the policy that was active before.
+        '''
+        global _precision_policy
+        _precision_policy = self._previous
+        self._previous = None
+
+    def bound(self, numerator, denominator):
+        '''
+        Builds a fraction from a simplified pair, rounding it if the denominator is too big.
+
+        Args
+        ----
+        numerator : int
+            The numerator of a fraction in its simplest form.
+        denominator : int
+            The positive denominator of a fraction in its simplest form.
+
+        Returns
+        -------
+        Fraction
+            The fraction itself if within the limits; its best approximation otherwise.
+        '''
+        self.operations += 1
+        if denominator > self._limit:
+            self.rounded += 1
+            numerator, denominator = _approximate(numerator, denominator, self._limit,
+                                                  self.rounding)
+        return Fraction._from_reduced(numerator, denominator)
+
+    def reset(self):
+        '''
+        Sets the counters back to zero.
+        '''
+        self.operations = 0
+        self.rounded = 0
+
+class CanonicalCache:
+    '''
+    A bounded cache from raw (numerator, denominator) pairs to the fractions they build.
+
+    Inside a with block, Fraction(numerator, denominator) first looks the pair up, so inputs
+    that repeat skip the signal handling and the gcd. Fractions are immutable, so the cached
+    instances are shared safely. Only the construction from a pair is cached; arithmetic
+    results are not.
+
+    Attributes
+    ----------
+    capacity : int
+        The greatest number of pairs kept.
+    eviction : str
+        "lru" to evict the least recently used pair or "fifo" to evict the oldest one.
+    hits : int
+        The number of constructions answered by the cache.
+    misses : int
+        The number of constructions that had to simplify the pair.
+    evictions : int
+        The number of pairs evicted to make room.
+
+    Methods
+    -------
+    lookup(key):
+        The cached fraction of a pair, or None.
+    store(key, fraction):
+        Caches the fraction of a pair, evicting another pair if the cache is full.
+    clear():
+        Removes every cached pair.
+    reset():
+        Sets the counters back to zero.
+    '''
+    def __init__(self, capacity=4096, eviction="lru"):
+        '''
+        Initializes a CanonicalCache instance.
+
+        Args
+        ----
+        capacity : int, optional
+            The greatest number of pairs kept (default = 4096).
+        eviction : str, optional
+            "lru" or "fifo" (default = "lru").
+
+        Raises
+        ------
+        TypeError
+            If capacity is not an integer.
+        ValueError
+            If capacity is not positive or eviction is not a valid policy.
+        '''
+        if not isinstance(capacity, int):
+            raise TypeError("The capacity must be an integer.")
+        if capacity < 1:
+            raise ValueError("The capacity must be a positive integer.")
+        if eviction not in _EVICTIONS:
+            raise ValueError("The eviction must be 'lru' or 'fifo'.")
+
+        self.capacity = capacity
+        self.eviction = eviction
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._previous = None
+
+    def __repr__(self):
+        '''
+        The abstract representation of an instance of CanonicalCache.
+        '''
+        return f"CanonicalCache(capacity={self.capacity}, eviction={self.eviction!r})"
+
+    def __len__(self):
+        '''
+        The number of cached pairs.
+        '''
+        return len(self._entries)
+
+    def __enter__(self):
+        '''
+        Makes the cache active.
+        '''
+        global _canonical_cache
+        self._previous = _canonical_cache
+        _canonical_cache = self
+        return self
+
+    def __exit__(self, *exc_info):
+        '''
+        Restores the cache that was active before.
+        '''
+        global _canonical_cache
+        _canonical_cache = self._previous
+        self._previous = None
+
+    def lookup(self, key):
+        '''
+        The cached fraction of a pair, or None.
+
+        Args
+        ----
+        key : tuple of int
+            The raw (numerator, denominator) pair.
+
+        Returns
+        -------
+        Fraction or None
+            The cached fraction, if any.
+        '''
+        fraction = self._entries.get(key)
+        if fraction is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.eviction == "lru":
+            self._entries.move_to_end(key)
+        return fraction
+
+    def store(self, key, fraction):
+        '''
+        Caches the fraction of a pair, evicting another pair if the cache is full.
+
+        Args
+        ----
+        key : tuple of int
+            The raw (numerator, denominator) pair.
+        fraction : Fraction
+            The fraction built from the pair.
+        '''
+        entries = self._entries
+        if key not in entries and len(entries) >= self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = fraction
+
+    def clear(self):
+        '''
+        Removes every cached pair.
+        '''
+        self._entries.clear()
+
+    def reset(self):
+        '''
+        Sets the counters back to zero.
+        '''
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+def _column(values):
+    '''
+    Stores a sequence of integers as a contiguous int64 column.
+
+    Args
+    ----
+    values : iterable of int
+        The integers to be stored.
+
+    Returns
+    -------
+    array or list
+        An array('q') if every value fits in 64 bits; a list of Python ints otherwise.
+    '''
+    values = list(values)
+    try:
+        return array('q', values)
+    except OverflowError:
+        return values
+
+class FractionArray:
+    '''
+    A columnar array of fractions in their simplest form.
+
+    The numerators and the denominators are kept in two separate integer columns, so the
+    arithmetic runs over whole columns at once instead of building one Fraction per element.
+    Each column is an int64 array, falling back to a list of Python ints when some value does
+    not fit in 64 bits.
+
+    Attributes
+    ----------
+    numerators : array or list
+        The numerators of the simplified fractions.
+    denominators : array or list
+        The (positive) denominators of the simplified fractions.
+
+    Methods
+    -------
+    from_columns(numerators, denominators):
+        Builds an array from raw numerators and denominators.
+    to_list():
+        Returns the elements as a list of Fraction.
+    sum():
+        The sum of all the elements.
+    prod():
+        The product of all the elements.
+    min():
+        The smallest element.
+    max():
+        The greatest element.
+    '''
+    def __init__(self, values=()):
+        '''
+        Initializes a FractionArray instance.
+
+        Args
+        ----
+        values : iterable of Fraction or int, optional
+            The elements of the array (default = empty).
+
+        Raises
+        ------
+        TypeError
+            If some element is not an instance of Fraction or int.
+        '''
+        numerators, denominators = [], []
+        for value in values:
+            if isinstance(value, int):
+                numerators.append(value)
+                denominators.append(1)
+            elif isinstance(value, Fraction):
+                numerators.append(value.numerator)
+                denominators.append(value.denominator)
+            else:
+                raise TypeError("The elements of a FractionArray must be fractions or integers.")
+
+        self.numerators = _column(numerators)
+        self.denominators = _column(denominators)
+
+    @classmethod
+    def from_columns(cls, numerators, denominators):
+        '''
+        Builds an array from raw numerators and denominators.
+
+        Every pair is normalized exactly as in Fraction: the signal goes to the numerator and
+        both are divided by their greatest common divisor.
+
+        Args
+        ----
+        numerators : iterable of int
+            The numerators of the fractions.
+        denominators : iterable of int
+            The denominators of the fractions.
+
+        Returns
+        -------
+        FractionArray
+            The array with the simplified fractions.
+
+        Raises
+        ------
+        TypeError
+            If some numerator or denominator is not an integer.
+        ValueError
+            If the columns have different lengths.
+        ZeroDivisionError
+            If some denominator is equal to zero.
+        '''
+        numerators, denominators = list(numerators), list(denominators)
+        if len(numerators) != len(denominators):
+            raise ValueError("The numerators and the denominators must have the same length.")
+        for numerator, denominator in zip(numerators, denominators):
+            if not isinstance(numerator, int) or not isinstance(denominator, int):
+                raise TypeError("The numerator and the denominator must be integer numbers.")
+            if denominator == 0:
+                raise ZeroDivisionError("The denominator must not be equal to zero.")
+
+        return cls._reduce(numerators, denominators)
+
+    @classmethod
+    def _reduce(cls, numerators, denominators):
+        '''
+        Builds an array from validated, nonzero denominators, simplifying every pair.
+        '''
+        reduced_numerators, reduced_denominators = [], []
+        for numerator, denominator in zip(numerators, denominators):
+            if denominator < 0:
+                numerator, denominator = -numerator, -denominator
+            factor = gcd(numerator, denominator)
+            reduced_numerators.append(numerator // factor)
+            reduced_denominators.append(denominator // factor)
+        return cls._from_reduced(reduced_numerators, reduced_denominators)
+
+    @classmethod
+    def _from_reduced(cls, numerators, denominators):
+        '''
+        Builds an array from columns that are already in their simplest form.
+        '''
+        instance = cls.__new__(cls)
+        instance.numerators = _column(numerators)
+        instance.denominators = _column(denominators)
+        return instance
+
+    def _columns_of(self, other):
+        '''
+        The numerator and denominator columns of other, broadcasting scalars.
+
+        Args
+        ----
+        other : FractionArray or Fraction or int
+            The second operand of an elementwise operation.
+
+        Returns
+        -------
+        tuple
+            The numerators and the denominators of other, one for each element of self.
+
+        Raises
+        ------
+        TypeError
+            If other is not an instance of FractionArray, Fraction or int.
+        ValueError
+            If other is a FractionArray of a different length.
+        '''
+        if isinstance(other, int):
+            return [other] * len(self), [1] * len(self)
+        if isinstance(other, Fraction):
+            return [other.numerator] * len(self), [other.denominator] * len(self)
+        if not isinstance(other, FractionArray):
+            raise TypeError("You can only operate a FractionArray with another FractionArray, " +
+            "a fraction or an integer.")
+        if len(other) != len(self):
+            raise ValueError("The arrays must have the same length.")
+        return other.numerators, other.denominators
+
+    def __len__(self):
+        '''
+        The number of elements of the array.
+        '''
+        return len(self.numerators)
+
+    def __getitem__(self, index):
+        '''
+        The element (or the slice of the array) at index.
+
+        Args
+        ----
+        index : int or slice
+            The position of the element or the slice to be taken.
+
+        Returns
+        -------
+        Fraction or FractionArray
+            A Fraction if index is an integer; a FractionArray if it is a slice.
+        '''
+        if isinstance(index, slice):
+            return FractionArray._from_reduced(self.numerators[index], self.denominators[index])
+        return Fraction._from_reduced(self.numerators[index], self.denominators[index])
+
+    def __iter__(self):
+        '''
+        Iterates over the elements of the array as instances of Fraction.
+
+        The columns are already simplified, so the fractions are built without a gcd.
+        '''
+        from_reduced = Fraction._from_reduced
+        for numerator, denominator in zip(self.numerators, self.denominators):
+            yield from_reduced(numerator, denominator)
+
+    def __repr__(self):
+        '''
+        The abstract representation of an instance of FractionArray.
+        '''
+        return f"FractionArray({self.to_list()})"
+
+    def __str__(self):
+        '''
+        The string representation of an instance of FractionArray.
+        '''
+        return "[" + ", ".join(str(element) for element in self) + "]"
+
+    def to_list(self):
+        '''
+        Returns the elements as a list of Fraction.
+
+        Returns
+        -------
+        list of Fraction
+            The elements of the array.
+        '''
+        return list(self)
+
+    def __add__(self, other):
+        '''
+        The elementwise sum of the array and other.
+
+        Args
+        ----
+        other : FractionArray or Fraction or int
+            The array, fraction or integer to be summed to each element.
+
+        Returns
+        -------
+        FractionArray
+            The elementwise sum.
+        '''
+        numerators, denominators = self._columns_of(other)
+        return FractionArray._reduce(
+            [a * d + b * c for a, b, c, d in
+             zip(self.numerators, self.denominators, numerators, denominators)],
+            [b * d for b, d in zip(self.denominators, denominators)])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        '''
+        The elementwise subtraction of other from the array.
+
+        Args
+        ----
+        other : FractionArray or Fraction or int
+            The array, fraction or integer to be subtracted from each element.
+
+        Returns
+        -------
+        FractionArray
+            The elementwise subtraction.
+        '''
+        numerators, denominators = self._columns_of(other)
+        return FractionArray._reduce(
+            [a * d - b * c for a, b, c, d in
+             zip(self.numerators, self.denominators, numerators, denominators)],
+            [b * d for b, d in zip(self.denominators, denominators)])
+
+    def __rsub__(self, other):
+        '''
+        The elementwise subtraction of the array from other.
+        '''
+        return -self + other
+
+    def __mul__(self, other):
+        '''
+        The elementwise multiplication of the array and other.
+
+        Args
+        ----
+        other : FractionArray or Fraction or int
+            The array, fraction or integer to multiply each element.
+
+        Returns
+        -------
+        FractionArray
+            The elementwise multiplication.
+        '''
+        numerators, denominators = self._columns_of(other)
+        return FractionArray._reduce(
+            [a * c for a, c in zip(self.numerators, numerators)],
+            [b * d for b, d in zip(self.denominators, denominators)])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        '''
+        The elementwise division of the array by other.
+
+        Args
+        ----
+        other : FractionArray or Fraction or int
+            The array, fraction or integer to divide each element.
+
+        Returns
+        -------
+        FractionArray
+            The elementwise division.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If some element of other is equal to zero.
+        '''
+        numerators, denominators = self._columns_of(other)
+        if 0 in numerators:
+            raise ZeroDivisionError("Division by zero is undefined.")
+        return FractionArray._reduce(
+            [a * d for a, d in zip(self.numerators, denominators)],
+            [b * c for b, c in zip(self.denominators, numerators)])
+
+
+    def __rtruediv__(self, other):
+        '''
+        The elementwise division of other by the array.
+        '''
+        return FractionArray._from_reduced(*self._columns_of(other)) / self
+
+    def __floordiv__(self, other):
+        '''
+        The elementwise floor division of the array by other.
+
+        Args
+        ----
+        other : FractionArray or Fraction or int
+            The array, fraction or integer to divide each element.
+
+        Returns
+        -------
+        FractionArray
+            The elementwise floor division, as integers.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If some element of other is equal to zero.
+        '''
+        numerators, denominators = self._columns_of(other)
+        if 0 in numerators:
+            raise ZeroDivisionError("Division by zero is undefined.")
+        return FractionArray._from_reduced(
+            [(a * d) // (c * b) for a, b, c, d in
+             zip(self.numerators, self.denominators, numerators, denominators)],
+            [1] * len(self))
+
+
+    def __rfloordiv__(self, other):
+        '''
+        The elementwise floor division of other by the array.
+        '''
+        return FractionArray._from_reduced(*self._columns_of(other)) // self
+
+    def __mod__(self, other):
+        '''
+        The elementwise remainder of the floor division of the array by other.
+
+        Args
+        ----
+        other : FractionArray or Fraction or int
+            The array, fraction or integer to divide each element.
+
+        Returns
+        -------
+        FractionArray
+            The elementwise remainder.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If some element of other is equal to zero.
+        '''
+        numerators, denominators = self._columns_of(other)
+        if 0 in numerators:
+            raise ZeroDivisionError("Division by zero is undefined.")
+        return FractionArray._reduce(
+            [(a * d) % (c * b) for a, b, c, d in
+             zip(self.numerators, self.denominators, numerators, denominators)],
+            [b * d for b, d in zip(self.denominators, denominators)])
+
+
+    def __rmod__(self, other):
+        '''
+        The elementwise remainder of the floor division of other by the array.
+        '''
+        return FractionArray._from_reduced(*self._columns_of(other)) % self
+
+    def __pow__(self, power):
+        '''
+        Raises every element of the array to the given power.
+
+        Args
+        ----
+        power : int
+            The power to raise the elements.
+
+        Returns
+        -------
+        FractionArray
+            The elementwise exponentiation.
+
+        Raises
+        ------
+        TypeError
+            If power is not an instance of int.
+        ZeroDivisionError
+            If power is negative and some element is equal to zero.
+        '''
+        if not isinstance(power, int):
+            raise TypeError("The power must be an integer.")
+
+        if power < 0:
+            if 0 in self.numerators:
+                raise ZeroDivisionError("The denominator must not be equal to zero.")
+            power = -power
+            numerators, denominators = self.denominators, self.numerators
+        else:
+            numerators, denominators = self.numerators, self.denominators
+        # Powers of coprime integers are still coprime, so only the signal must be fixed.
+        powered_numerators, powered_denominators = [], []
+        for numerator, denominator in zip(numerators, denominators):
+            if denominator < 0:
+                numerator, denominator = -numerator, -denominator
+            powered_numerators.append(numerator ** power)
+            powered_denominators.append(denominator ** power)
+        return FractionArray._from_reduced(powered_numerators, powered_denominators)
+
+
+    def __rpow__(self, base):
+        '''
+        Raises base to each element of the array.
+
+        Args
+        ----
+        base : Fraction or int
+            The fraction or integer to be raised.
+
+        Returns
+        -------
+        FractionArray
+            The elementwise exponentiation.
+
+        Raises
+        ------
+        TypeError
+            If base is not an instance of Fraction or int, or some element is not an integer.
+        ZeroDivisionError
+            If base is equal to zero and some element is negative.
+        '''
+        numerators, denominators = self._columns_of(base)
+        if any(denominator != 1 for denominator in self.denominators):
+            raise TypeError("The powers must be integers.")
+
+        # Powers of coprime integers are still coprime, so only the signal must be fixed.
+        powered_numerators, powered_denominators = [], []
+        for numerator, denominator, power in zip(numerators, denominators, self.numerators):
+            if power < 0:
+                if numerator == 0:
+                    raise ZeroDivisionError("The denominator must not be equal to zero.")
+                numerator, denominator, power = denominator, numerator, -power
+                if denominator < 0:
+                    numerator, denominator = -numerator, -denominator
+            powered_numerators.append(numerator ** power)
+            powered_denominators.append(denominator ** power)
+        return FractionArray._from_reduced(powered_numerators, powered_denominators)
+
+    def __neg__(self):
+        '''
+        Returns the elementwise negative of the array.
+        '''
+        return FractionArray._from_reduced([-n for n in self.numerators], self.denominators)
+
+    def __pos__(self):
+        '''
+        Returns the array itself (unary sum operator).
+        '''
+        return self
+
+    def __abs__(self):
+        '''
+        Returns the elementwise absolute value of the array.
+        '''
+        return FractionArray._from_reduced([abs(n) for n in self.numerators], self.denominators)
+
+    def __eq__(self, other):
+        '''
+        Elementwise equality between the array and other.
+
+        Args
+        ----
+        other : FractionArray or Fraction or int
+            The array, fraction or integer to be compared with each element.
+
+        Returns
+        -------
+        list of bool
+            The result of each comparison.
+        '''
+        numerators, denominators = self._columns_of(other)
+        return [a * d == b * c for a, b, c, d in
+                zip(self.numerators, self.denominators, numerators, denominators)]
+
+    def __ne__(self, other):
+        '''
+        Elementwise inequality between the array and other.
+        '''
+        return [not equal for equal in self == other]
+
+    def __lt__(self, other):
+        '''
+        Elementwise check if the array is smaller than other.
+
+        Args
+        ----
+        other : FractionArray or Fraction or int
+            The array, fraction or integer to be compared with each element.
+
+        Returns
+        -------
+        list of bool
+            The result of each comparison.
+        '''
+        numerators, denominators = self._columns_of(other)
+        return [a * d < b * c for a, b, c, d in
+                zip(self.numerators, self.denominators, numerators, denominators)]
+
+    def __le__(self, other):
+        '''
+        Elementwise check if the array is smaller or equal than other.
+        '''
+        numerators, denominators = self._columns_of(other)
+        return [a * d <= b * c for a, b, c, d in
+                zip(self.numerators, self.denominators, numerators, denominators)]
+
+    def __gt__(self, other):
+        '''
+        Elementwise check if the array is greater than other.
+        '''
+        numerators, denominators = self._columns_of(other)
+        return [a * d > b * c for a, b, c, d in
+                zip(self.numerators, self.denominators, numerators, denominators)]
+
+    def __ge__(self, other):
+        '''
+        Elementwise check if the array is greater or equal than other.
+        '''
+        numerators, denominators = self._columns_of(other)
+        return [a * d >= b * c for a, b, c, d in
+                zip(self.numerators, self.denominators, numerators, denominators)]
+
+    def sum(self):
+        '''
+        The sum of all the elements.
+
+        Returns
+        -------
+        Fraction
+            The sum of the elements (zero for an empty array).
+        '''
+        return Fraction._from_reduced(
+            *_tree_reduce(zip(self.numerators, self.denominators), _add_pairs, (0, 1)))
+
+    def prod(self):
+        '''
+        The product of all the elements.
+
+        Returns
+        -------
+        Fraction
+            The product of the elements (one for an empty array).
+        '''
+        return Fraction._from_reduced(
+            *_tree_reduce(zip(self.numerators, self.denominators), _mul_pairs, (1, 1)))
+
+    def min(self):
+        '''
+        The smallest element.
+
+        Returns
+        -------
+        Fraction
+            The smallest element of the array.
+
+        Raises
+        ------
+        ValueError
+            If the array is empty.
+        '''
+        if len(self) == 0:
+            raise ValueError("The array is empty.")
+        index = 0
+        for i in range(1, len(self)):
+            if self.numerators[i] * self.denominators[index] < \
+               self.numerators[index] * self.denominators[i]:
+                index = i
+        return self[index]
+
+    def max(self):
+        '''
+        The greatest element.
+
+        Returns
+        -------
+        Fraction
+            The greatest element of the array.
+
+        Raises
+        ------
+        ValueError
+            If the array is empty.
+        '''
+        if len(self) == 0:
+            raise ValueError("The array is empty.")
+        index = 0
+        for i in range(1, len(self)):
+            if self.numerators[i] * self.denominators[index] > \
+               self.numerators[index] * self.denominators[i]:
+                index = i
+        return self[index]
+
+def _pairs(values):
+    '''
+    Yields the simplified (numerator, denominator) pair of each fraction or integer in values.
+
+    Raises
+    ------
+    TypeError
+        If some value is not an instance of Fraction or int.
+    '''
+    for value in values:
+        if isinstance(value, int):
+            yield value, 1
+        elif isinstance(value, Fraction):
+            yield value.numerator, value.denominator
+        else:
+            raise TypeError("You can only reduce fractions and integers.")
+
+def _tree_reduce(values, combine, identity):
+    '''
+    Reduces a stream along a balanced binary tree, keeping the order of the operands.
+
+    Partial results are merged like the digits of a binary counter, so operands of similar size
+    are combined and only O(log n) partial results are kept in memory. It is shared by the exact
+    reductions of this module and by parallel_reduce.
+
+    Args
+    ----
+    values : iterable
+        The operands.
+    combine : callable
+        A binary operation, combine(left, right).
+    identity : object
+        The result for an empty stream.
+
+    Returns
+    -------
+    object
+        The result of the reduction.
+    '''
+    levels = []
+    for value in values:
+        level = 0
+        while levels and levels[-1][0] == level:
+            value = combine(levels.pop()[1], value)
+            level += 1
+        levels.append((level, value))
+
+    if not levels:
+        return identity
+    _, value = levels.pop()
+    while levels:
+        value = combine(levels.pop()[1], value)
+    return value
+
+def _add_pairs(left, right):
+    '''
+    The sum of two simplified (numerator, denominator) pairs, see _add_reduced.
+    '''
+    return _add_reduced(*left, *right)
+
+def _mul_pairs(left, right):
+    '''
+    The product of two simplified (numerator, denominator) pairs, see _mul_reduced.
+    '''
+    return _mul_reduced(*left, *right)
+
+def fsum(values):
+    '''
+    The exact sum of fractions and integers.
+
+    Args
+    ----
+    values : iterable of Fraction or int
+        The values to be summed.
+
+    Returns
+    -------
+    Fraction
+        The sum of the values (zero if there are none).
+
+    Raises
+    ------
+    TypeError
+        If some value is not an instance of Fraction or int.
+    '''
+    return Fraction._from_reduced(*_tree_reduce(_pairs(values), _add_pairs, (0, 1)))
+
+def fprod(values):
+    '''
+    The exact product of fractions and integers.
+
+    Args
+    ----
+    values : iterable of Fraction or int
+        The values to be multiplied.
+
+    Returns
+    -------
+    Fraction
+        The product of the values (one if there are none).
+
+    Raises
+    ------
+    TypeError
+        If some value is not an instance of Fraction or int.
+    '''
+    return Fraction._from_reduced(*_tree_reduce(_pairs(values), _mul_pairs, (1, 1)))
+
+def fdot(values, weights):
+    '''
+    The exact dot product of two sequences of fractions and integers.
+
+    Args
+    ----
+    values : iterable of Fraction or int
+        The first sequence.
+    weights : iterable of Fraction or int
+        The second sequence, with the same length as values.
+
+    Returns
+    -------
+    Fraction
+        The sum of the products of the corresponding values and weights.
+
+    Raises
+    ------
+    TypeError
+        If some value or weight is not an instance of Fraction or int.
+    ValueError
+        If values and weights have different lengths.
+    '''
+    products = (_mul_reduced(*value, *weight)
+                for value, weight in zip(_pairs(values), _pairs(weights), strict=True))
+    return Fraction._from_reduced(*_tree_reduce(products, _add_pairs, (0, 1)))
+
+def fmean(values):
+    '''
+    The exact arithmetic mean of fractions and integers.
+
+    Args
+    ----
+    values : iterable of Fraction or int
+        The values to be averaged.
+
+    Returns
+    -------
+    Fraction
+        The mean of the values.
+
+    Raises
+    ------
+    TypeError
+        If some value is not an instance of Fraction or int.
+    ValueError
+        If there are no values.
+    '''
+    count = 0
+
+    def counted(pairs):
+        nonlocal count
+        for pair in pairs:
+            count += 1
+            yield pair
+
+    numerator, denominator = _tree_reduce(counted(_pairs(values)), _add_pairs, (0, 1))
+    if count == 0:
+        raise ValueError("The mean of an empty sequence is undefined.")
+    return Fraction._from_reduced(*_mul_reduced(numerator, denominator, 1, count))
+
+def _parse(string):
+    '''
+    The (numerator, denominator) pair written in string, not yet simplified.
+
+    Raises
+    ------
+    TypeError
+        If string is not an instance of str.
+    ValueError
+        If string is not a valid representation of a fraction.
+    '''
+    if not isinstance(string, str):
+        raise TypeError("A fraction can only be parsed from a string.")
+    match = _FRACTION_PATTERN.match(string)
+    if match is None:
+        raise ValueError(f"Invalid literal for a fraction: {string!r}.")
+
+    integer, decimals, exponent, denominator = match.group("integer", "decimals", "exponent",
+                                                           "denominator")
+    if denominator is not None:
+        if decimals is not None or exponent is not None:
+            raise ValueError(f"Invalid literal for a fraction: {string!r}.")
+        numerator, denominator = int(integer), int(denominator)
+    else:
+        numerator, denominator = int(integer or "0"), 1
+        if decimals:
+            numerator = numerator * 10 ** len(decimals) + int(decimals)
+            denominator = 10 ** len(decimals)
+        if exponent is not None:
+            exponent = int(exponent)
+            if exponent >= 0:
+                numerator *= 10 ** exponent
+            else:
+                denominator *= 10 ** -exponent
+
+    if match.group("sign") == "-":
+        numerator = -numerator
+    return numerator, denominator
+
+def parse_fractions(source, column=None, delimiter=',', skip_header=False, chunk_size=None):
+    '''
+    Streams the fractions written in the lines of a text or CSV source.
+
+    The source is read lazily, so only one line (or one chunk) is kept in memory at a time.
+    Blank lines and empty fields are skipped.
+
+    Args
+    ----
+    source : file or iterable of str
+        The lines to be parsed, such as an open text file.
+    column : int, optional
+        The index of the CSV column to be parsed; if None, each whole line is a value
+        (default = None).
+    delimiter : str, optional
+        The CSV delimiter, used when column is given (default = ',').
+    skip_header : bool, optional
+        Whether the first line is a header to be ignored (default = False).
+    chunk_size : int, optional
+        If given, yields FractionArray chunks of at most chunk_size elements instead of one
+        Fraction at a time (default = None).
+
+    Yields
+    ------
+    Fraction or FractionArray
+        The parsed fractions, one by one or in chunks.
+
+    Raises
+    ------
+    TypeError
+        If column or chunk_size are not integers.
+    ValueError
+        If chunk_size is not positive, or if a value is not a valid fraction; the message
+        gives the line number.
+    ZeroDivisionError
+        If some denominator is equal to zero.
+    '''
+    if column is not None and not isinstance(column, int):
+        raise TypeError("The column must be an integer.")
+    if chunk_size is not None:
+        if not isinstance(chunk_size, int):
+            raise TypeError("The chunk size must be an integer.")
+        if chunk_size <= 0:
+            raise ValueError("The chunk size must be a positive integer.")
+
+    if column is None:
+        fields = (line.strip() for line in source)
+    else:
+        fields = (row[column].strip() if len(row) > column else ""
+                  for row in csv.reader(source, delimiter=delimiter))
+    if skip_header:
+        next(fields, None)
+
+    numerators, denominators = [], []
+    for line_number, field in enumerate(fields, start=2 if skip_header else 1):
+        if not field:
+            continue
+        try:
+            numerator, denominator = _parse(field)
+        except ValueError as error:
+            raise ValueError(f"Line {line_number}: {error}") from error
+
+        if chunk_size is None:
+            yield Fraction(numerator, denominator)
+            continue
+        numerators.append(numerator)
+        denominators.append(denominator)
+        if len(numerators) == chunk_size:
+            yield FractionArray.from_columns(numerators, denominators)
+            numerators, denominators = [], []
+
+    if numerators:
+        yield FractionArray.from_columns(numerators, denominators)
+
+def sort_fractions(values, reverse=False):
+    '''
+    Sorts fractions and integers, comparing precomputed keys.
+
+    Each value gets its Fraction.sort_key once, so the sort compares floats and only falls back
+    to exact comparisons on ties.
+
+    Args
+    ----
+    values : iterable of Fraction or int
+        The values to be sorted.
+    reverse : bool, optional
+        Whether to sort in descending order (default = False).
+
+    Returns
+    -------
+    list
+        The values in order.
+
+    Raises
+    ------
+    TypeError
+        If some value is not an instance of Fraction or int.
+    '''
+    keys = [_order_key(value) for value in values]
+    keys.sort(reverse=reverse)
+    return [value for _, value in keys]
@@ -0,0 +1,311 @@
+'''
+Implements an opt-in profile of Fraction: constructions, gcd calls, operators and bit growth.
+
+While a FractionProfile is active, the operators and constructors of Fraction and the gcd used
+by the fractions module are replaced by counting wrappers; on exit the original functions are
+put back. Nothing is checked or counted while no profile is active, so the instrumentation
+costs nothing when disabled.
+
+Classes
+-------
+FractionProfile
+    A context manager that records how Fraction is used inside its with block.
+'''
+
+import os
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
+from time import perf_counter
+
+from . import fractions
+from .fractions import Fraction
+
+# The operators whose calls are counted, with the bit lengths of their results.
+_OPERATORS = ("__add__", "__iadd__", "__sub__", "__isub__", "__mul__", "__imul__",
+              "__truediv__", "__itruediv__", "__floordiv__", "__ifloordiv__", "__mod__",
+              "__imod__", "__pow__", "__ipow__", "__neg__", "__pos__", "__abs__", "__eq__",
+              "__ne__", "__lt__", "__le__", "__gt__", "__ge__")
+
+# Frames from the files of this directory (the package) are skipped when looking for the call
+# site.
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+@lru_cache(maxsize=None)
+def _internal(filename):
+    '''
+    Whether a code file belongs to the package.
+    '''
+    return os.path.abspath(filename).startswith(_PACKAGE_DIRECTORY)
+
+def _bucket(bits):
+    '''
+    The histogram bucket of a bit length: 0 for zero, k for the range [2**(k-1), 2**k).
+    '''
+    return bits.bit_length()
+
+def _bucket_label(bucket):
+    '''
+    The range of bit lengths in a histogram bucket, such as "8-15".
+    '''
+    if bucket == 0:
+        return "0"
+    return f"{2 ** (bucket - 1)}-{2 ** bucket - 1}"
+
+class FractionProfile:
+    '''
+    A context manager that records how Fraction is used inside its with block.
+
+    The counters accumulate across with blocks until reset() is called.
+
+    Attributes
+    ----------
+    constructions : int
+        The number of Fraction instances requested (interned ones included).
+    gcd_calls : int
+        The number of gcd calls made by the fractions module.
+    gcd_time : float
+        The seconds spent in those gcd calls.
+    operations : Counter
+        The number of calls of each operator, by name.
+    numerator_bits, denominator_bits : Counter
+        Histograms of the bit lengths of the terms of the operator results; bucket k counts the
+        lengths from 2**(k-1) to 2**k - 1 (bucket 0, the zero numerator).
+    call_sites : Counter
+        The number of operator calls and constructions made from each (file, line, function)
+        outside the package, if call_sites is True.
+    site_gcd_calls, site_gcd_time : Counter
+        The gcd calls and the seconds spent in them, by call site, if call_sites is True.
+    site_numerator_bits, site_denominator_bits : defaultdict of Counter
+        The histograms of bit lengths of the operator results, by call site, if call_sites is
+        True.
+
+    Methods
+    -------
+    counters():
+        The counters as a flat dict, for metrics exporters.
+    report():
+        A readable summary of the counters.
+    reset():
+        Sets every counter back to zero.
+    '''
+    def __init__(self, call_sites=False):
+        '''
+        Initializes a FractionProfile instance.
+
+        Args
+        ----
+        call_sites : bool, optional
+            Whether to attribute the calls to the first frame outside the package, which slows
+            the profiled code down further (default = False).
+        '''
+        self.track_call_sites = bool(call_sites)
+        self._saved = None
+        self.reset()
+
+    def __repr__(self):
+        '''
+        The abstract representation of an instance of FractionProfile.
+        '''
+        return f"FractionProfile(call_sites={self.track_call_sites})"
+
+    def reset(self):
+        '''
+        Sets every counter back to zero.
+        '''
+        self.constructions = 0
+        self.gcd_calls = 0
+        self.gcd_time = 0.0
+        self.operations = Counter()
+        self.numerator_bits = Counter()
+        self.denominator_bits = Counter()
+        self.call_sites = Counter()
+        self.site_gcd_calls = Counter()
+        self.site_gcd_time = Counter()
+        self.site_numerator_bits = defaultdict(Counter)
+        self.site_denominator_bits = defaultdict(Counter)
+
+    def _site(self):
+        '''
+        The (file, line, function) of the first frame outside the package, or None.
+        '''
+        frame = sys._getframe(2)
+        while frame is not None and _internal(frame.f_code.co_filename):
+            frame = frame.f_back
+        if frame is None:
+            return None
+        code = frame.f_code
+        return code.co_filename, frame.f_lineno, code.co_name
+
+    def _record(self, result, site):
+        '''
+        Adds the bit lengths of an operator result to the histograms.
+        '''
+        if type(result) is Fraction:
+            numerator_bucket = _bucket(result._numerator.bit_length())
+            denominator_bucket = _bucket(result._denominator.bit_length())
+            self.numerator_bits[numerator_bucket] += 1
+            self.denominator_bits[denominator_bucket] += 1
+            if site is not None:
+                self.site_numerator_bits[site][numerator_bucket] += 1
+                self.site_denominator_bits[site][denominator_bucket] += 1
+
+    def _wrap_operator(self, name, function):
+        '''
+        A wrapper of an operator that counts its calls and records its result.
+        '''
+        def operator(*args):
+            self.operations[name] += 1
+            site = self._site() if self.track_call_sites else None
+            if site is not None:
+                self.call_sites[site] += 1
+            result = function(*args)
+            self._record(result, site)
+            return result
+        operator.__name__ = name
+        operator.__doc__ = function.__doc__
+        return operator
+
+    def _wrap_constructor(self, function):
+        '''
+        A wrapper of a constructor that counts its calls.
+        '''
+        def constructor(*args, **kwargs):
+            self.constructions += 1
+            if self.track_call_sites:
+                site = self._site()
+                if site is not None:
+                    self.call_sites[site] += 1
+            return function(*args, **kwargs)
+        constructor.__name__ = function.__name__
+        constructor.__doc__ = function.__doc__
+        return constructor
+
+    def _wrap_deferred(self, function):
+        '''
+        A wrapper of Fraction._new that counts the deferred results of unreduced(), which are
+        the only ones not built by another constructor.
+        '''
+        def new(cls, numerator, denominator):
+            if fractions._unreduced_max_bits is not None and fractions._precision_policy is None:
+                self.constructions += 1
+            return function(cls, numerator, denominator)
+        new.__name__ = function.__name__
+        new.__doc__ = function.__doc__
+        return new
+
+    def _wrap_gcd(self, function):
+        '''
+        A wrapper of gcd that counts its calls and the time spent in them.
+        '''
+        def gcd(*integers):
+            start = perf_counter()
+            result = function(*integers)
+            elapsed = perf_counter() - start
+            self.gcd_time += elapsed
+            self.gcd_calls += 1
+            if self.track_call_sites:
+                site = self._site()
+                if site is not None:
+                    self.site_gcd_calls[site] += 1
+                    self.site_gcd_time[site] += elapsed
+            return result
+        return gcd
+
+    def __enter__(self):
+        '''
+        Installs the counting wrappers.
+
+        Raises
+        ------
+        RuntimeError
+            If the profile is already active.
+        '''
+        if self._saved is not None:
+            raise RuntimeError("The profile is already active.")
+        names = _OPERATORS + ("__new__", "_from_reduced", "_new")
+        self._saved = ({name: Fraction.__dict__[name] for name in names}, fractions.gcd)
+
+        for name in _OPERATORS:
+            setattr(Fraction, name, self._wrap_operator(name, Fraction.__dict__[name]))
+        Fraction.__new__ = staticmethod(self._wrap_constructor(
+            Fraction.__dict__["__new__"].__func__))
+        Fraction._from_reduced = classmethod(self._wrap_constructor(
+            Fraction.__dict__["_from_reduced"].__func__))
+        Fraction._new = classmethod(self._wrap_deferred(Fraction.__dict__["_new"].__func__))
+        fractions.gcd = self._wrap_gcd(fractions.gcd)
+        return self
+
+    def __exit__(self, *exc_info):
+        '''
+        Puts the original functions back.
+        '''
+        attributes, gcd = self._saved
+        for name, attribute in attributes.items():
+            setattr(Fraction, name, attribute)
+        fractions.gcd = gcd
+        self._saved = None
+
+    def counters(self):
+        '''
+        The counters as a flat dict, for metrics exporters.
+
+        Returns
+        -------
+        dict
+            "constructions", "gcd_calls", "gcd_time", "operations.<name>",
+            "numerator_bits.<range>" and "denominator_bits.<range>" to their values, and
+            "call_sites.<file>:<line>:<function>.<counter>" to the calls, gcd_calls and gcd_time
+            of each call site.
+        '''
+        counters = {"constructions": self.constructions, "gcd_calls": self.gcd_calls,
+                    "gcd_time": self.gcd_time}
+        for name, count in sorted(self.operations.items()):
+            counters[f"operations.{name}"] = count
+        for histogram in ("numerator_bits", "denominator_bits"):
+            for bucket, count in sorted(getattr(self, histogram).items()):
+                counters[f"{histogram}.{_bucket_label(bucket)}"] = count
+        for site in sorted(set(self.call_sites) | set(self.site_gcd_calls)):
+            prefix = "call_sites.{}:{}:{}".format(*site)
+            counters[f"{prefix}.calls"] = self.call_sites[site]
+            counters[f"{prefix}.gcd_calls"] = self.site_gcd_calls[site]
+            counters[f"{prefix}.gcd_time"] = self.site_gcd_time[site]
+        return counters
+
+    def report(self, top=10):
+        '''
+        A readable summary of the counters.
+
+        Args
+        ----
+        top : int, optional
+            The number of busiest call sites listed (default = 10).
+
+        Returns
+        -------
+        str
+            The report, one counter per line.
+        '''
+        lines = [f"constructions: {self.constructions}",
+                 f"gcd calls: {self.gcd_calls} ({self.gcd_time:.6f} s)",
+                 "operations:"]
+        lines += [f"  {name}: {count}" for name, count in self.operations.most_common()]
+        for title, histogram in (("numerator bits:", self.numerator_bits),
+                                 ("denominator bits:", self.denominator_bits)):
+            lines.append(title)
+            lines += [f"  {_bucket_label(bucket)}: {count}"
+                      for bucket, count in sorted(histogram.items())]
+        if self.call_sites:
+            lines.append("call sites:")
+            for site, count in self.call_sites.most_common(top):
+                file, line, function = site
+                entry = (f"  {file}:{line} ({function}): {count} calls, " +
+                         f"{self.site_gcd_calls[site]} gcd calls " +
+                         f"({self.site_gcd_time[site]:.6f} s)")
+                if site in self.site_numerator_bits:
+                    # The widest buckets of the results of the operators called there.
+                    entry += (", widest results " +
+                              f"{_bucket_label(max(self.site_numerator_bits[site]))} / " +
+                              f"{_bucket_label(max(self.site_denominator_bits[site]))} bits")
+                lines.append(entry)
+        return "\n".join(lines)
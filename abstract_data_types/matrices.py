@@ -0,0 +1,301 @@
+'''
+Implements the Matrix Abstract Data Type over the rational numbers.
+
+Classes
+-------
+RationalMatrix
+    An exact matrix of fractions, with fraction-free elimination.
+'''
+
+from math import lcm
+
+from .fractions import Fraction
+
+def _eliminate(rows, columns):
+    '''
+    Fraction-free Gauss-Jordan elimination of an integer matrix, in place.
+
+    Bareiss' update a[i][j] = (a[r][c] * a[i][j] - a[i][c] * a[r][j]) // previous pivot is
+    applied to every row but the pivot one, so each entry stays an integer minor of the original
+    matrix and the divisions are exact; no gcd is ever taken. At the end, every pivot is equal
+    to the last one.
+
+    Args
+    ----
+    rows : list of list of int
+        The matrix to be eliminated.
+    columns : int
+        Only the first columns are searched for pivots (the others are carried along, as in an
+        augmented matrix).
+
+    Returns
+    -------
+    tuple
+        The list of pivot columns and the signal of the row permutation.
+    '''
+    pivots = []
+    signal = 1
+    previous = 1
+    for column in range(columns):
+        row = len(pivots)
+        if row == len(rows):
+            break
+        pivot_row = next((i for i in range(row, len(rows)) if rows[i][column]), None)
+        if pivot_row is None:
+            continue
+        if pivot_row != row:
+            rows[row], rows[pivot_row] = rows[pivot_row], rows[row]
+            signal = -signal
+
+        pivot_line = rows[row]
+        pivot = pivot_line[column]
+        for i, line in enumerate(rows):
+            if i == row:
+                continue
+            factor = line[column]
+            rows[i] = [(pivot * a - factor * b) // previous for a, b in zip(line, pivot_line)]
+        previous = pivot
+        pivots.append(column)
+    return pivots, signal
+
+class RationalMatrix:
+    '''
+    An exact matrix of fractions.
+
+    Each row is stored as integer numerators over a shared (positive) row denominator, and the
+    algorithms run fraction-free elimination on the integers, converting to Fraction only at
+    the end.
+
+    Attributes
+    ----------
+    numerators : list of list of int
+        The numerators of each row.
+    denominators : list of int
+        The common denominator of each row.
+
+    Methods
+    -------
+    shape():
+        The number of rows and of columns.
+    to_rows():
+        The entries as lists of Fraction.
+    determinant():
+        The determinant of a square matrix.
+    rank():
+        The rank of the matrix.
+    rref():
+        The reduced row echelon form of the matrix.
+    solve(vector):
+        Solves the linear system with the current matrix of coefficients.
+    inverse():
+        The inverse of a square matrix.
+    '''
+    def __init__(self, rows):
+        '''
+        Initializes a RationalMatrix instance.
+
+        Args
+        ----
+        rows : iterable of iterable of Fraction or int
+            The rows of the matrix.
+
+        Raises
+        ------
+        TypeError
+            If some entry is not an instance of Fraction or int.
+        ValueError
+            If the matrix is empty or the rows have different lengths.
+        '''
+        self.numerators = []
+        self.denominators = []
+        for row in rows:
+            pairs = []
+            for entry in row:
+                if isinstance(entry, int):
+                    pairs.append((entry, 1))
+                elif isinstance(entry, Fraction):
+                    pairs.append((entry.numerator, entry.denominator))
+                else:
+                    raise TypeError("The entries of a matrix must be fractions or integers.")
+            denominator = lcm(*(d for _, d in pairs)) if pairs else 1
+            self.numerators.append([n * (denominator // d) for n, d in pairs])
+            self.denominators.append(denominator)
+
+        if not self.numerators or not self.numerators[0]:
+            raise ValueError("The matrix must not be empty.")
+        if any(len(row) != len(self.numerators[0]) for row in self.numerators):
+            raise ValueError("All the rows must have the same length.")
+
+    def __repr__(self):
+        '''
+        The abstract representation of an instance of RationalMatrix.
+        '''
+        return f"RationalMatrix({self.to_rows()})"
+
+    def __str__(self):
+        '''
+        The string representation of the matrix, one row per line.
+        '''
+        return "\n".join("[" + ", ".join(str(entry) for entry in row) + "]"
+                         for row in self.to_rows())
+
+    def __getitem__(self, index):
+        '''
+        The entry at the given position.
+
+        Args
+        ----
+        index : tuple of int
+            The row and the column of the entry.
+
+        Returns
+        -------
+        Fraction
+            The entry.
+        '''
+        row, column = index
+        return Fraction(self.numerators[row][column], self.denominators[row])
+
+    def shape(self):
+        '''
+        The number of rows and of columns.
+
+        Returns
+        -------
+        tuple of int
+            The number of rows and the number of columns.
+        '''
+        return len(self.numerators), len(self.numerators[0])
+
+    def to_rows(self):
+        '''
+        The entries as lists of Fraction.
+
+        Returns
+        -------
+        list of list of Fraction
+            The rows of the matrix.
+        '''
+        return [[Fraction(n, denominator) for n in row]
+                for row, denominator in zip(self.numerators, self.denominators)]
+
+    def _check_square(self):
+        '''
+        Raises ValueError if the matrix is not square.
+        '''
+        rows, columns = self.shape()
+        if rows != columns:
+            raise ValueError("The matrix must be square.")
+        return rows
+
+    def determinant(self):
+        '''
+        The determinant of a square matrix.
+
+        Returns
+        -------
+        Fraction
+            The determinant.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is not square.
+        '''
+        size = self._check_square()
+        rows = [row[:] for row in self.numerators]
+        pivots, signal = _eliminate(rows, size)
+        if len(pivots) < size:
+            return Fraction(0)
+
+        scale = 1
+        for denominator in self.denominators:
+            scale *= denominator
+        return Fraction(signal * rows[-1][-1], scale)
+
+    def rank(self):
+        '''
+        The rank of the matrix.
+
+        Returns
+        -------
+        int
+            The number of linearly independent rows.
+        '''
+        rows = [row[:] for row in self.numerators]
+        pivots, _ = _eliminate(rows, len(rows[0]))
+        return len(pivots)
+
+    def rref(self):
+        '''
+        The reduced row echelon form of the matrix.
+
+        Returns
+        -------
+        RationalMatrix
+            The matrix in reduced row echelon form.
+        '''
+        rows = [row[:] for row in self.numerators]
+        pivots, _ = _eliminate(rows, len(rows[0]))
+        echelon = [[Fraction(entry, rows[i][column]) for entry in rows[i]]
+                   for i, column in enumerate(pivots)]
+        echelon += [[0] * len(rows[0]) for _ in range(len(rows) - len(pivots))]
+        return RationalMatrix(echelon)
+
+    def solve(self, vector):
+        '''
+        Solves the linear system with the current matrix of coefficients.
+
+        Args
+        ----
+        vector : iterable of Fraction or int
+            The constant terms of the system, one for each row.
+
+        Returns
+        -------
+        list of Fraction
+            The unique solution of the system.
+
+        Raises
+        ------
+        TypeError
+            If some constant term is not an instance of Fraction or int.
+        ValueError
+            If the matrix is not square, if vector has the wrong length or if the matrix is
+            singular.
+        '''
+        size = self._check_square()
+        vector = list(vector)
+        if len(vector) != size:
+            raise ValueError("The vector must have one entry for each row of the matrix.")
+
+        augmented = RationalMatrix([row + [entry] for row, entry in zip(self.to_rows(), vector)])
+        rows = augmented.numerators
+        pivots, _ = _eliminate(rows, size)
+        if len(pivots) < size:
+            raise ValueError("The matrix is singular.")
+        return [Fraction(row[-1], row[i]) for i, row in enumerate(rows)]
+
+    def inverse(self):
+        '''
+        The inverse of a square matrix.
+
+        Returns
+        -------
+        RationalMatrix
+            The inverse matrix.
+
+        Raises
+        ------
+        ValueError
+            If the matrix is not square or is singular.
+        '''
+        size = self._check_square()
+        # Augments each row with the matching row of the identity, scaled by its denominator.
+        rows = [row + [denominator if i == j else 0 for j in range(size)]
+                for i, (row, denominator) in enumerate(zip(self.numerators, self.denominators))]
+        pivots, _ = _eliminate(rows, size)
+        if len(pivots) < size:
+            raise ValueError("The matrix is singular.")
+        return RationalMatrix([[Fraction(entry, row[i]) for entry in row[size:]]
+                               for i, row in enumerate(rows)])
@@ -0,0 +1,106 @@
+'''
+Packs whole sequences of fractions and complex numbers into single pickled payloads.
+
+Pickling a list of Fraction or Complex instances still writes one reduce call per object.
+pack() stores a homogeneous sequence as two typed columns instead (the narrowest integer
+array or a float64 array when the values fit, plain lists otherwise), which is much smaller
+and faster to send to another process, for instance through a multiprocessing pool.
+
+Functions
+---------
+pack(values)
+    Packs a sequence into a single bytes payload.
+unpack(payload)
+    Rebuilds the list packed by pack().
+'''
+
+import pickle
+from array import array
+
+from .complex import Complex
+from .fractions import Fraction
+
+def _column(values):
+    '''
+    The most compact picklable column for a list of numbers.
+
+    Returns
+    -------
+    array or list
+        The narrowest signed integer array (8 to 64 bits) that holds the values if they are all
+        ints, a float64 array if they are all floats, and the list itself otherwise.
+    '''
+    if all(type(value) is float for value in values):
+        return array('d', values)
+    if values and all(type(value) is int for value in values):
+        smallest, largest = min(values), max(values)
+        for typecode in 'bhiq':
+            bits = 8 * array(typecode).itemsize
+            if -2 ** (bits - 1) <= smallest and largest < 2 ** (bits - 1):
+                return array(typecode, values)
+    return values
+
+def pack(values):
+    '''
+    Packs a sequence into a single bytes payload.
+
+    Sequences made only of Fraction (or only of Complex) are stored as columns; anything else
+    is pickled as a plain list.
+
+    Args
+    ----
+    values : iterable
+        The values to be packed.
+
+    Returns
+    -------
+    bytes
+        The payload, to be read by unpack().
+    '''
+    values = list(values)
+    if values and all(type(value) is Fraction for value in values):
+        packed = ("fractions", _column([value.numerator for value in values]),
+                  _column([value.denominator for value in values]))
+    elif values and all(type(value) is Complex for value in values):
+        packed = ("complex", _column([value.real for value in values]),
+                  _column([value.imaginary for value in values]))
+    else:
+        packed = ("objects", values)
+    return pickle.dumps(packed, protocol=pickle.HIGHEST_PROTOCOL)
+
+def unpack(payload):
+    '''
+    Rebuilds the list packed by pack().
+
+    Like pickle.loads, it must only be used on trusted payloads.
+
+    Args
+    ----
+    payload : bytes
+        A payload returned by pack().
+
+    Returns
+    -------
+    list
+        The packed values.
+
+    Raises
+    ------
+    ValueError
+        If payload was not created by pack().
+    '''
+    packed = pickle.loads(payload)
+    if not isinstance(packed, tuple) or not packed:
+        raise ValueError("The payload was not created by pack().")
+
+    kind = packed[0]
+    if kind == "fractions":
+        _, numerators, denominators = packed
+        return [Fraction._from_reduced(numerator, denominator)
+                for numerator, denominator in zip(numerators, denominators)]
+    if kind == "complex":
+        _, reals, imaginaries = packed
+        return [Complex(real, imaginary) for real, imaginary in zip(reals, imaginaries)]
+    if kind == "objects":
+        return packed[1]
+    raise ValueError("The payload was not created by pack().")
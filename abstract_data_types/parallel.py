@@ -0,0 +1,95 @@
+'''
+Implements the parallel reduction of streams of fractions and complex numbers.
+
+Functions
+---------
+parallel_reduce(op, iterable, workers=None, chunk=10000)
+    Reduces a stream with a binary operation, splitting the work across processes.
+'''
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .fractions import _tree_reduce
+from .packing import pack, unpack
+
+# The result of _tree_reduce for an empty stream, which no operation can return.
+_EMPTY = object()
+
+def _reduce_chunk(op, payload):
+    '''
+    Reduces a packed chunk in a worker process.
+    '''
+    return _tree_reduce(unpack(payload), op, _EMPTY)
+
+def _partial_results(executor, op, chunks, workers):
+    '''
+    Yields the reductions of the chunks in order, keeping at most two chunks per worker in
+    flight.
+    '''
+    pending = deque()
+    for values in chunks:
+        pending.append(executor.submit(_reduce_chunk, op, pack(values)))
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def parallel_reduce(op, iterable, workers=None, chunk=10000):
+    '''
+    Reduces a stream with a binary operation, splitting the work across processes.
+
+    The stream is cut into chunks, which are packed (see packing.pack) and reduced in worker
+    processes; the partial results are then combined along a balanced tree, keeping the order of
+    the stream. At most two chunks per worker are in flight at any time, so the memory used does
+    not depend on the length of the stream.
+
+    Args
+    ----
+    op : callable
+        A picklable associative binary operation, such as operator.add or operator.mul, which
+        use Fraction.__add__, Fraction.__mul__ or their Complex equivalents.
+    iterable : iterable
+        The values to be reduced.
+    workers : int, optional
+        The number of worker processes; 1 reduces in the current process (default = the number
+        of CPUs).
+    chunk : int, optional
+        The number of values sent to a worker at a time (default = 10000).
+
+    Returns
+    -------
+    object
+        The result of the reduction.
+
+    Raises
+    ------
+    TypeError
+        If op is not callable, or workers or chunk are not integers.
+    ValueError
+        If workers or chunk are not positive, or if iterable is empty.
+    '''
+    if not callable(op):
+        raise TypeError("The operation must be callable.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    for name, value in (("number of workers", workers), ("chunk size", chunk)):
+        if not isinstance(value, int):
+            raise TypeError(f"The {name} must be an integer.")
+        if value <= 0:
+            raise ValueError(f"The {name} must be a positive integer.")
+
+    iterator = iter(iterable)
+    chunks = iter(lambda: list(islice(iterator, chunk)), [])
+    if workers == 1:
+        result = _tree_reduce((_tree_reduce(values, op, _EMPTY) for values in chunks), op,
+                              _EMPTY)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            result = _tree_reduce(_partial_results(executor, op, chunks, workers), op, _EMPTY)
+
+    if result is _EMPTY:
+        raise ValueError("Cannot reduce an empty iterable.")
+    return result
@@ -0,0 +1,299 @@
+'''
+Finds the complex roots of polynomials by simultaneous iteration.
+
+All the roots of a polynomial are refined together, each correction using the current
+approximations of the others: Aberth-Ehrlich's method (cubic convergence) or Durand-Kerner's
+(quadratic). Many polynomials can be solved in one batch, which iterates over every root of
+every polynomial at once; a root stops being updated as soon as its correction falls below the
+tolerance. The iteration runs on Python's built-in complex numbers and the roots are returned as
+instances of Complex.
+
+Coefficients are given from the highest degree down, so [1, 0, -2] is x**2 - 2.
+
+Functions
+---------
+horner(coefficients, x)
+    The value of a polynomial at x.
+roots(coefficients, tolerance=1e-12, max_iterations=200, method="aberth")
+    The complex roots of a polynomial.
+batch_roots(polynomials, tolerance=1e-12, max_iterations=200, method="aberth")
+    The complex roots of many polynomials, iterated together.
+'''
+
+import cmath
+import math
+
+from .complex import Complex
+
+_METHODS = ("aberth", "durand-kerner")
+# Every this many sweeps, the converged roots are checked again.
+_FULL_SWEEP = 8
+
+def _number(value):
+    '''
+    A coefficient or point as a built-in complex.
+
+    Raises
+    ------
+    TypeError
+        If value is not an instance of Complex, int or float.
+    '''
+    if isinstance(value, Complex):
+        return complex(value.real, value.imaginary)
+    if isinstance(value, (int, float)):
+        return complex(value)
+    raise TypeError("The coefficients must be complex numbers, integers or floats.")
+
+def _evaluate(coefficients, z):
+    '''
+    The value of a polynomial and of its derivative at z, by Horner's rule.
+    '''
+    value, derivative = coefficients[0], 0j
+    for coefficient in coefficients[1:]:
+        derivative = derivative * z + value
+        value = value * z + coefficient
+    return value, derivative
+
+def horner(coefficients, x):
+    '''
+    The value of a polynomial at x, by Horner's rule.
+
+    Args
+    ----
+    coefficients : iterable of Complex or int or float
+        The coefficients, from the highest degree down.
+    x : Complex or int or float
+        The point of evaluation.
+
+    Returns
+    -------
+    Complex
+        The value of the polynomial at x.
+
+    Raises
+    ------
+    TypeError
+        If some coefficient or x is not an instance of Complex, int or float.
+    '''
+    coefficients = [_number(coefficient) for coefficient in coefficients] or [0j]
+    value, _ = _evaluate(coefficients, _number(x))
+    return Complex(value.real, value.imag)
+
+def _prepare(coefficients):
+    '''
+    The monic coefficients of a polynomial without its zero roots, and the number of them.
+
+    Raises
+    ------
+    ValueError
+        If every coefficient is zero.
+    '''
+    coefficients = [_number(coefficient) for coefficient in coefficients]
+    while coefficients and coefficients[0] == 0:
+        coefficients.pop(0)
+    if not coefficients:
+        raise ValueError("The zero polynomial has no finite set of roots.")
+    zeros = 0
+    while coefficients[-1] == 0:
+        coefficients.pop()
+        zeros += 1
+    leading = coefficients[0]
+    return [coefficient / leading for coefficient in coefficients], zeros
+
+def _initial(coefficients):
+    '''
+    Starting points for the roots of a monic polynomial.
+
+    They are spread on a circle around the mean of the roots, at angles that avoid the
+    symmetries of real polynomials. The radius is the geometric mean of the distances of the
+    roots to the center, read from the constant term of the shifted polynomial, or Fujiwara's
+    bound on them if the center is a root.
+    '''
+    degree = len(coefficients) - 1
+    center = -coefficients[1] / degree
+    # The coefficients of the polynomial shifted to the center, by repeated synthetic division.
+    shifted = list(coefficients)
+    for i in range(degree):
+        for j in range(1, degree + 1 - i):
+            shifted[j] += center * shifted[j - 1]
+    radius = abs(shifted[degree]) ** (1 / degree) or \
+        2 * max(abs(shifted[k]) ** (1 / k) for k in range(1, degree + 1)) or 1.0
+    return [center + radius * cmath.exp(1j * (2 * math.pi * k / degree + 0.4))
+            for k in range(degree)]
+
+def _newton(coefficients, reverse, z):
+    '''
+    The Newton correction p(z) / p'(z) of a monic polynomial, or None if p(z) is zero.
+
+    Outside the unit circle the polynomial is evaluated through its reverse q(w) = w**n p(1/w)
+    at w = 1/z, where p / p' = z / (n - w q'(w) / q(w)), so Horner's rule never overflows.
+    '''
+    if abs(z) <= 1:
+        value, derivative = _evaluate(coefficients, z)
+        if value == 0:
+            return None
+        # Without a derivative, the value itself is a small step that moves z.
+        return value / derivative if derivative != 0 else value
+    w = 1 / z
+    value, derivative = _evaluate(reverse, w)
+    if value == 0:
+        return None
+    denominator = len(coefficients) - 1 - w * derivative / value
+    return z / denominator if denominator != 0 else value
+
+def _weierstrass(coefficients, reverse, roots, z):
+    '''
+    The Durand-Kerner correction p(z) / prod(z - other) of a monic polynomial, or None if
+    p(z) is zero; through the reverse polynomial outside the unit circle, as in _newton.
+    '''
+    if abs(z) <= 1:
+        value, _ = _evaluate(coefficients, z)
+        if value == 0:
+            return None
+        product = 1
+        for other in roots:
+            if other != z:
+                product *= z - other
+        return value / product
+    # p(z) = z**n q(1/z) and prod(z - other) = z**(n-1) prod(1 - other / z).
+    w = 1 / z
+    value, _ = _evaluate(reverse, w)
+    if value == 0:
+        return None
+    product = 1
+    for other in roots:
+        if other != z:
+            product *= 1 - other * w
+    return z * value / product
+
+def _correction(method, coefficients, reverse, roots, z):
+    '''
+    The correction of the approximation z by method, or None if z is an exact root.
+    '''
+    if method == "durand-kerner":
+        return _weierstrass(coefficients, reverse, roots, z)
+    correction = _newton(coefficients, reverse, z)
+    if correction is not None:
+        repulsion = sum(1 / (z - other) for other in roots if other != z)
+        correction /= 1 - correction * repulsion
+    return correction
+
+def _iterate(problems, tolerance, max_iterations, method):
+    '''
+    Refines the roots of every problem in place, until all converge or the iterations end.
+
+    Each problem is a pair (coefficients, roots) with monic coefficients; the converged roots
+    of all problems are kept in masks and skipped. A correction may be small only because
+    another approximation is still far away, so every _FULL_SWEEP sweeps, and once all its
+    roots have stopped, a problem is swept whole and the roots whose correction is no longer
+    small are put back; a problem is done after a whole sweep that moves no root.
+    '''
+    active = [[True] * len(roots) for _, roots in problems]
+    reverses = [coefficients[::-1] for coefficients, _ in problems]
+    pending = [index for index, (_, roots) in enumerate(problems) if roots]
+    for sweep in range(1, max_iterations + 1):
+        if not pending:
+            break
+        still_pending = []
+        for index in pending:
+            coefficients, roots = problems[index]
+            reverse, mask = reverses[index], active[index]
+            whole = sweep % _FULL_SWEEP == 0 or not any(mask)
+            for k, z in enumerate(roots):
+                if not (whole or mask[k]):
+                    continue
+                correction = _correction(method, coefficients, reverse, roots, z)
+                if correction is None:
+                    mask[k] = False
+                    continue
+                roots[k] = z - correction
+                mask[k] = abs(correction) > tolerance * max(1.0, abs(z))
+            if not whole or any(mask):
+                still_pending.append(index)
+        pending = still_pending
+
+def _solve(polynomials, tolerance, max_iterations, method):
+    '''
+    Validates the arguments and returns the roots of each polynomial as lists of Complex.
+    '''
+    if not isinstance(tolerance, (int, float)) or not isinstance(max_iterations, int):
+        raise TypeError("The tolerance must be a number and the maximum of iterations an " +
+        "integer.")
+    if tolerance <= 0 or max_iterations < 1:
+        raise ValueError("The tolerance and the maximum of iterations must be positive.")
+    if method not in _METHODS:
+        raise ValueError("The method must be 'aberth' or 'durand-kerner'.")
+
+    problems, zeros = [], []
+    for coefficients in polynomials:
+        monic, count = _prepare(coefficients)
+        problems.append((monic, _initial(monic) if len(monic) > 1 else []))
+        zeros.append(count)
+    _iterate(problems, tolerance, max_iterations, method)
+    return [[Complex(z.real, z.imag) for z in roots] + [Complex(0.0, 0.0)] * count
+            for (_, roots), count in zip(problems, zeros)]
+
+def roots(coefficients, tolerance=1e-12, max_iterations=200, method="aberth"):
+    '''
+    The complex roots of a polynomial.
+
+    Args
+    ----
+    coefficients : iterable of Complex or int or float
+        The coefficients, from the highest degree down.
+    tolerance : float, optional
+        A root stops being refined when its correction is at most tolerance times its
+        modulus (or tolerance, below one) (default = 1e-12).
+    max_iterations : int, optional
+        The greatest number of sweeps over the roots (default = 200).
+    method : str, optional
+        "aberth" or "durand-kerner" (default = "aberth").
+
+    Returns
+    -------
+    list of Complex
+        The roots, repeated by multiplicity; the approximations reached if some did not
+        converge within max_iterations.
+
+    Raises
+    ------
+    TypeError
+        If some coefficient is not an instance of Complex, int or float, or the tolerance or
+        the maximum of iterations have the wrong type.
+    ValueError
+        If every coefficient is zero, if the tolerance or the maximum of iterations are not
+        positive or if method is not valid.
+    '''
+    return _solve([coefficients], tolerance, max_iterations, method)[0]
+
+def batch_roots(polynomials, tolerance=1e-12, max_iterations=200, method="aberth"):
+    '''
+    The complex roots of many polynomials, iterated together.
+
+    Every sweep visits the roots still moving in all the polynomials; a polynomial leaves the
+    batch when all its roots have converged.
+
+    Args
+    ----
+    polynomials : iterable of iterable of Complex or int or float
+        The coefficients of each polynomial, from the highest degree down.
+    tolerance : float, optional
+        See roots (default = 1e-12).
+    max_iterations : int, optional
+        See roots (default = 200).
+    method : str, optional
+        "aberth" or "durand-kerner" (default = "aberth").
+
+    Returns
+    -------
+    list of list of Complex
+        The roots of each polynomial, in the order of polynomials.
+
+    Raises
+    ------
+    TypeError
+        See roots.
+    ValueError
+        See roots.
+    '''
+    return _solve(list(polynomials), tolerance, max_iterations, method)
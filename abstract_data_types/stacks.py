@@ -121,6 +121,19 @@ class Stack:
         string = string[:-1] + ")"
         return string
 
+    def __getstate__(self):
+        '''
+        The state to be pickled: only the list of items, in a tuple so that the state of an
+        empty stack is not false (pickle protocols 0 and 1 skip __setstate__ for false states).
+        '''
+        return (self.stack,)
+
+    def __setstate__(self, state):
+        '''
+        Restores a pickled stack from its list of items.
+        '''
+        self.stack, = state
+
     def __repr__(self):
         '''
         Returns the abstract representation of the stack. 
@@ -211,7 +224,7 @@ class FixedStack:
         '''
         if self.length == self.max_length:
             raise IndexError("The stack is full.")
-        self.stack.append(item)
+        self.stack[self.length] = item
         self.length += 1
 
     def pop(self):
@@ -232,6 +245,7 @@ class FixedStack:
             raise Empty("The stack is empty.")
         popped = self.stack[self.length - 1]
         self.stack[self.length - 1] = None
+        self.length -= 1
         return popped
 
     def top(self):
@@ -291,6 +305,22 @@ class FixedStack:
         string = string[:-1] + ")"
         return string
 
+    def __getstate__(self):
+        '''
+        The state to be pickled: the maximum length and the live items, without the empty
+        slots.
+        '''
+        return self.max_length, self.stack[:self.length]
+
+    def __setstate__(self, state):
+        '''
+        Restores a pickled stack from its maximum length and live items.
+        '''
+        max_length, items = state
+        self.stack = items + [None] * (max_length - len(items))
+        self.max_length = max_length
+        self.length = len(items)
+
     def __repr__(self):
         '''
         The abstract representation of the stack. 
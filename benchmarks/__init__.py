@@ -0,0 +1,9 @@
+'''
+Benchmarks of the abstract data types.
+
+Each module is a script, run from the root of the repository as
+
+    python -m benchmarks.<module>
+
+and prints a table of timings; redirect it to bench_output.txt to keep it out of the tree.
+'''
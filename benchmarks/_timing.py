@@ -0,0 +1,22 @@
+'''
+Helpers shared by the benchmark scripts.
+'''
+
+import timeit
+
+def best_of(function, repeat=5, number=1):
+    '''
+    The best time, in seconds, of repeat runs of number calls of function.
+    '''
+    return min(timeit.repeat(function, repeat=repeat, number=number))
+
+def table(header, rows):
+    '''
+    Prints rows of values under a header, in aligned columns; floats are printed as seconds.
+    '''
+    cells = [list(header)] + [[f"{value:.4f}s" if isinstance(value, float) else str(value)
+                               for value in row] for row in rows]
+    widths = [max(len(row[column]) for row in cells) for column in range(len(header))]
+    for row in cells:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+    print()
@@ -0,0 +1,58 @@
+'''
+Fraction construction from skewed (Zipfian) streams of raw pairs, with and without a
+CanonicalCache, to show when the cache pays off.
+
+    python -m benchmarks.canonical_cache
+'''
+
+import random
+from itertools import accumulate
+
+from abstract_data_types.fractions import CanonicalCache, Fraction
+
+from ._timing import best_of, table
+
+CONSTRUCTIONS = 2 * 10 ** 5
+DISTINCT = 10 ** 5
+BITS = (32, 512)
+EXPONENTS = (0.5, 1.2)
+CAPACITIES = (1024, 65536)
+
+def construct(pairs):
+    return [Fraction(numerator, denominator) for numerator, denominator in pairs]
+
+def cached(pairs, capacity):
+    '''
+    construct(pairs) inside a fresh cache of the given capacity, and the cache.
+    '''
+    cache = CanonicalCache(capacity)
+    with cache:
+        construct(pairs)
+    return cache
+
+def main():
+    generator = random.Random(0)
+    rows = []
+    for bits in BITS:
+        # Random pairs with a common factor, so every construction has to simplify.
+        distinct = []
+        for _ in range(DISTINCT):
+            factor = generator.getrandbits(bits // 2) | 1
+            distinct.append((factor * generator.getrandbits(bits // 2),
+                             factor * (generator.getrandbits(bits // 2) | 1)))
+        for exponent in EXPONENTS:
+            weights = list(accumulate(1 / rank ** exponent for rank in range(1, DISTINCT + 1)))
+            pairs = generator.choices(distinct, cum_weights=weights, k=CONSTRUCTIONS)
+            plain = best_of(lambda: construct(pairs), repeat=3)
+            for capacity in CAPACITIES:
+                cache = cached(pairs, capacity)
+                hit_rate = cache.hits / (cache.hits + cache.misses)
+                rows.append([bits, str(exponent), capacity, plain,
+                             best_of(lambda: cached(pairs, capacity), repeat=3),
+                             f"{hit_rate:.0%}"])
+    print(f"{CONSTRUCTIONS} constructions drawn from {DISTINCT} distinct pairs with Zipf " +
+          "exponent s.")
+    table(["bits", "s", "capacity", "no cache", "cache", "hits"], rows)
+
+if __name__ == "__main__":
+    main()
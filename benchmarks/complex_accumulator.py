@@ -0,0 +1,60 @@
+'''
+Accumulation loops with Complex against the in-place ComplexAccumulator and its fused helpers.
+
+    python -m benchmarks.complex_accumulator
+'''
+
+from abstract_data_types.complex import Complex, ComplexAccumulator
+
+from ._timing import best_of, table
+
+ITERATIONS = 10 ** 5
+
+def main():
+    w, x = Complex(0.5, -0.25), Complex(0.125, 2.0)
+
+    def complex_product():
+        z = Complex(0.0, 0.0)
+        for _ in range(ITERATIONS):
+            z += w * x
+        return z
+
+    def accumulator_product():
+        acc = ComplexAccumulator()
+        for _ in range(ITERATIONS):
+            acc += w * x
+        return acc
+
+    def fused_product():
+        acc = ComplexAccumulator()
+        for _ in range(ITERATIONS):
+            acc.add_product(w, x)
+        return acc
+
+    def complex_scaled():
+        z = Complex(0.0, 0.0)
+        for _ in range(ITERATIONS):
+            z += w * 0.5
+        return z
+
+    def fused_scaled():
+        acc = ComplexAccumulator()
+        for _ in range(ITERATIONS):
+            acc.add_scaled(w, 0.5)
+        return acc
+
+    loops = (("z += w * x", "Complex", complex_product),
+             ("acc += w * x", "ComplexAccumulator", accumulator_product),
+             ("acc.add_product(w, x)", "ComplexAccumulator", fused_product),
+             ("z += w * 0.5", "Complex", complex_scaled),
+             ("acc.add_scaled(w, 0.5)", "ComplexAccumulator", fused_scaled))
+    rows = []
+    for statement, kind, loop in loops:
+        result = loop()
+        rows.append([statement, kind, best_of(loop, repeat=3),
+                     f"{result.real:.6g} + {result.imaginary:.6g}i"])
+    print(f"{ITERATIONS} iterations.")
+    table(["loop body", "accumulator", "time", "result"], rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+'''
+Throughput of Complex division and modulus against the textbook formulas and the built-in
+complex type.
+
+    python -m benchmarks.complex_division
+'''
+
+import math
+import random
+
+from abstract_data_types.complex import Complex, ComplexArray
+
+from ._timing import best_of, table
+
+COUNT = 10 ** 5
+
+def textbook(a, b, c, d):
+    '''
+    (a + bi) / (c + di) by the conjugate over the sum of squares, which overflows and
+    underflows outside moderate ranges.
+    '''
+    norm = c * c + d * d
+    return (a * c + b * d) / norm, (b * c - a * d) / norm
+
+def main():
+    generator = random.Random(0)
+    parts = [(generator.uniform(-1e3, 1e3), generator.uniform(-1e3, 1e3),
+              generator.uniform(-1e3, 1e3), generator.uniform(-1e3, 1e3))
+             for _ in range(COUNT)]
+    dividends = [Complex(a, b) for a, b, _, _ in parts]
+    divisors = [Complex(c, d) for _, _, c, d in parts]
+    dividend_array, divisor_array = ComplexArray(dividends), ComplexArray(divisors)
+    builtin = [(complex(a, b), complex(c, d)) for a, b, c, d in parts]
+
+    rows = [["Complex /", best_of(lambda: [x / y for x, y in zip(dividends, divisors)])],
+            ["ComplexArray /", best_of(lambda: dividend_array / divisor_array)],
+            ["textbook formula on floats", best_of(lambda: [textbook(*p) for p in parts])],
+            ["built-in complex /", best_of(lambda: [x / y for x, y in builtin])],
+            ["abs(Complex)", best_of(lambda: [abs(x) for x in dividends])],
+            ["abs(ComplexArray)", best_of(lambda: abs(dividend_array))],
+            ["sqrt of the sum of squares", best_of(lambda: [math.sqrt(a * a + b * b)
+                                                            for a, b, _, _ in parts])]]
+    print(f"{COUNT} operations, best of 5.")
+    table(["operation", "time"], rows)
+
+if __name__ == "__main__":
+    main()
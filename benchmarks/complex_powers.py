@@ -0,0 +1,54 @@
+'''
+Integer powers of Complex by binary exponentiation against repeated multiplication, and
+rotate() against multiplying by from_polar(1, angle): once per value for a list, once for the
+whole ComplexArray.
+
+    python -m benchmarks.complex_powers
+'''
+
+import cmath
+import random
+
+from abstract_data_types.complex import Complex, ComplexArray, rotate
+
+from ._timing import best_of, table
+
+EXPONENTS = (10, 100, 1000, 10000)
+ROTATED = 10 ** 5
+
+def repeated(z, n):
+    result = z
+    for _ in range(n - 1):
+        result = result * z
+    return result
+
+def error(value, exact):
+    return abs(complex(value.real, value.imaginary) - exact)
+
+def main():
+    z = Complex.from_polar(1.0, 0.7)
+    exact = {n: cmath.exp(0.7j * n) for n in EXPONENTS}
+    rows = []
+    for n in EXPONENTS:
+        calls = max(1, 1000 // n)
+        power = best_of(lambda: z ** n, number=calls * 10) / (calls * 10) * 1e6
+        product = best_of(lambda: repeated(z, n), number=calls) / calls * 1e6
+        rows.append([n, f"{power:.1f}us", f"{product:.1f}us", f"{error(z ** n, exact[n]):.1e}",
+                     f"{error(repeated(z, n), exact[n]):.1e}"])
+    print("Powers of a complex number on the unit circle.")
+    table(["n", "z ** n", "z * z * ... * z", "error of **", "error of *"], rows)
+
+    generator = random.Random(0)
+    values = [Complex(generator.random(), generator.random()) for _ in range(ROTATED)]
+    array = ComplexArray(values)
+    angle = 0.3
+    rows = [["list", best_of(lambda: rotate(values, angle), repeat=3),
+             best_of(lambda: [value * Complex.from_polar(1.0, angle) for value in values],
+                     repeat=3)],
+            ["ComplexArray", best_of(lambda: rotate(array, angle), repeat=3),
+             best_of(lambda: array * Complex.from_polar(1.0, angle), repeat=3)]]
+    print(f"Rotating {ROTATED} values.")
+    table(["values", "rotate", "times from_polar"], rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+'''
+The fast Fourier transform against a naive O(n**2) discrete Fourier transform over Complex, for
+radix-2, mixed-radix and Bluestein (prime) lengths, and convolve against the direct sum.
+
+    python -m benchmarks.fft
+'''
+
+import math
+import random
+
+from abstract_data_types.complex import Complex, ComplexArray
+from abstract_data_types.fft import clear_cache, convolve, fft
+
+from ._timing import best_of, table
+
+# (length, algorithm); the naive transform is only timed up to NAIVE_MAX.
+LENGTHS = ((64, "radix-2"), (256, "radix-2"), (1024, "radix-2"), (4096, "radix-2"),
+           (210, "mixed-radix"), (1000, "mixed-radix"), (97, "Bluestein"),
+           (331, "Bluestein"), (1009, "Bluestein"))
+NAIVE_MAX = 1024
+CONVOLVED = (64, 256, 1024)
+
+def naive_dft(values):
+    '''
+    X[k] = sum(x[j] * w**(j*k)), with the n roots of unity built once.
+    '''
+    n = len(values)
+    roots = [Complex.from_polar(1.0, -2 * math.pi * k / n) for k in range(n)]
+    result = []
+    for k in range(n):
+        total = Complex(0.0, 0.0)
+        for j, value in enumerate(values):
+            total = total + value * roots[j * k % n]
+        result.append(total)
+    return result
+
+def direct_convolution(a, b):
+    result = [Complex(0.0, 0.0)] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] = result[i + j] + x * y
+    return result
+
+def values(n, seed=0):
+    generator = random.Random(seed)
+    return [Complex(generator.uniform(-1, 1), generator.uniform(-1, 1)) for _ in range(n)]
+
+def main():
+    rows = []
+    for n, algorithm in LENGTHS:
+        sequence = values(n)
+        array = ComplexArray(sequence)
+        clear_cache()
+        cold = best_of(lambda: fft(sequence), repeat=1)
+        warm = best_of(lambda: fft(sequence))
+        warm_array = best_of(lambda: fft(array))
+        naive = best_of(lambda: naive_dft(sequence), repeat=1) if n <= NAIVE_MAX else "-"
+        rows.append([n, algorithm, cold, warm, warm_array, naive])
+    print("fft of n complex values; the first call also builds the cached twiddle factors.")
+    table(["n", "algorithm", "fft (first call)", "fft", "fft(ComplexArray)", "naive DFT"],
+          rows)
+
+    rows = []
+    for n in CONVOLVED:
+        a, b = values(n, seed=1), values(n, seed=2)
+        rows.append([n, best_of(lambda: convolve(a, b)),
+                     best_of(lambda: direct_convolution(a, b), repeat=1)])
+    print("Linear convolution of two sequences of n complex values.")
+    table(["n", "convolve", "direct sum"], rows)
+
+if __name__ == "__main__":
+    main()
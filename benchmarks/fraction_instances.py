@@ -0,0 +1,77 @@
+'''
+Memory per instance and construction time of the slotted Fraction, against the same class as it
+was before, with a __dict__ and no interning, and against the standard library's Fraction.
+
+    python -m benchmarks.fraction_instances
+'''
+
+import fractions
+import sys
+import tracemalloc
+from math import gcd
+
+from abstract_data_types.fractions import Fraction
+
+from ._timing import best_of, table
+
+INSTANCES = 10 ** 5
+CALLS = 10 ** 5
+
+class DictFraction:
+    '''
+    The constructor of Fraction before __slots__ and interning: validation, signal and gcd.
+    '''
+    def __init__(self, numerator, denominator=1):
+        if not isinstance(numerator, int) or not isinstance(denominator, int):
+            raise TypeError("The numerator and the denominator must be integer numbers.")
+        if denominator == 0:
+            raise ZeroDivisionError("The denominator must not be equal to zero.")
+        if numerator * denominator >= 0:
+            signal = 1
+        else: signal = -1
+        numerator, denominator = abs(numerator), abs(denominator)
+        factor = gcd(numerator, denominator)
+        self.numerator = signal * numerator // factor
+        self.denominator = denominator // factor
+
+def size(value):
+    '''
+    sys.getsizeof of the instance, plus its __dict__ if it has one.
+    '''
+    extra = sys.getsizeof(vars(value)) if hasattr(value, "__dict__") else 0
+    return sys.getsizeof(value) + extra
+
+def allocated(build):
+    '''
+    The bytes allocated per instance while INSTANCES distinct fractions are kept alive.
+    '''
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [build(1000 + i, 1001 + 2 * i) for i in range(INSTANCES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The numerators and the denominators are allocated the same for every class.
+    integers = sum(sys.getsizeof(value.numerator) + sys.getsizeof(value.denominator)
+                   for value in instances)
+    return (after - before - sys.getsizeof(instances) - integers) / INSTANCES
+
+def main():
+    classes = (("Fraction", Fraction), ("Fraction before (__dict__)", DictFraction),
+               ("fractions.Fraction", fractions.Fraction))
+    rows = [[name, f"{allocated(build):.0f} B", f"{size(build(6, 14))} B"]
+            for name, build in classes]
+    print(f"Memory per instance, besides its integers ({INSTANCES} distinct instances).")
+    table(["class", "tracemalloc", "getsizeof (with __dict__)"], rows)
+
+    cases = (("(6, 14)", (6, 14)), ("(10**12 + 1, 3)", (10 ** 12 + 1, 3)),
+             ("(7,), interned", (7,)), ("(2, 4), interned", (2, 4)))
+    rows = []
+    for name, arguments in cases:
+        times = [best_of(lambda: build(*arguments), number=CALLS) / CALLS * 1e6
+                 for _, build in classes]
+        rows.append([name] + [f"{time:.2f}us" for time in times])
+    print("Construction time per call; only Fraction interns small values.")
+    table(["arguments"] + [name for name, _ in classes], rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+'''
+Round trips of fractions and complex numbers through a process pool, pickled as lists of
+objects or packed with packing.pack, and the pickled sizes of stacks.
+
+    python -m benchmarks.ipc
+'''
+
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from abstract_data_types.complex import Complex
+from abstract_data_types.fractions import Fraction
+from abstract_data_types.packing import pack, unpack
+from abstract_data_types.stacks import FixedStack, Stack
+
+from ._timing import best_of, table
+
+COUNT = 10 ** 5
+CHUNKS = 10
+WORKERS = 4
+
+def echo(values):
+    '''
+    Returns the values, so they are pickled both ways.
+    '''
+    return values
+
+def echo_packed(payload):
+    '''
+    Unpacks the values and packs them back, as a worker that uses them would.
+    '''
+    return pack(unpack(payload))
+
+def round_trip(executor, chunks):
+    return [value for chunk in executor.map(echo, chunks) for value in chunk]
+
+def round_trip_packed(executor, chunks):
+    payloads = executor.map(echo_packed, [pack(chunk) for chunk in chunks])
+    return [value for payload in payloads for value in unpack(payload)]
+
+def main():
+    generator = random.Random(0)
+    samples = {
+        "Fraction": [Fraction(generator.randint(-10 ** 6, 10 ** 6), generator.randint(1, 10 ** 6))
+                     for _ in range(COUNT)],
+        "Complex": [Complex(generator.random(), generator.random()) for _ in range(COUNT)],
+    }
+    size = COUNT // CHUNKS
+    rows = []
+    with ProcessPoolExecutor(max_workers=WORKERS) as executor:
+        for name, values in samples.items():
+            chunks = [values[start:start + size] for start in range(0, COUNT, size)]
+            # Complex has no __eq__, so the values are compared by their representations.
+            assert list(map(repr, round_trip_packed(executor, chunks))) == \
+                list(map(repr, round_trip(executor, chunks)))
+            rows.append([name, best_of(lambda: round_trip(executor, chunks), repeat=3),
+                         best_of(lambda: round_trip_packed(executor, chunks), repeat=3),
+                         f"{len(pickle.dumps(chunks[0], pickle.HIGHEST_PROTOCOL)) // 1024}KB",
+                         f"{len(pack(chunks[0])) // 1024}KB"])
+    print(f"{COUNT} values in {CHUNKS} chunks through {WORKERS} worker processes.")
+    table(["values", "pickled lists", "packed", "list chunk", "packed chunk"], rows)
+
+    stack, fixed = Stack(), FixedStack(1000)
+    for item in range(10):
+        stack.push(item)
+        fixed.push(item)
+    table(["stack", "pickled size"],
+          [["Stack, 10 items", f"{len(pickle.dumps(stack))} bytes"],
+           ["FixedStack(1000), 10 items", f"{len(pickle.dumps(fixed))} bytes"],
+           ["FixedStack(1000), empty", f"{len(pickle.dumps(FixedStack(1000)))} bytes"]])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+'''
+The gcd-splitting kernels of Fraction against the standard library's fractions.Fraction and
+against the textbook cross product followed by one gcd, on large coprime denominators.
+
+    python -m benchmarks.kernels
+'''
+
+import fractions
+import operator
+import random
+from math import gcd
+
+from abstract_data_types.fractions import Fraction
+
+from ._timing import best_of, table
+
+COUNT = 200
+BITS = (64, 256, 512)
+
+def textbook(operation):
+    '''
+    The operation on (numerator, denominator) pairs by the full cross products and one gcd.
+    '''
+    def run(left, right):
+        (na, da), (nb, db) = left, right
+        if operation is operator.add:
+            numerator, denominator = na * db + nb * da, da * db
+        elif operation is operator.sub:
+            numerator, denominator = na * db - nb * da, da * db
+        elif operation is operator.mul:
+            numerator, denominator = na * nb, da * db
+        else:
+            numerator, denominator = na * db, da * nb
+            if denominator < 0:
+                numerator, denominator = -numerator, -denominator
+        common = gcd(numerator, denominator)
+        return numerator // common, denominator // common
+    return run
+
+def chain(operation, values):
+    '''
+    Folds values with operation, from left to right.
+    '''
+    def run():
+        total = values[0]
+        for value in values[1:]:
+            total = operation(total, value)
+        return total
+    return run
+
+def main():
+    generator = random.Random(0)
+    rows = []
+    for bits in BITS:
+        pairs = []
+        while len(pairs) < COUNT:
+            numerator = generator.getrandbits(bits) | 1
+            denominator = generator.getrandbits(bits) | 1 | 1 << (bits - 1)
+            if gcd(numerator, denominator) == 1:
+                pairs.append((numerator, denominator))
+        ours = [Fraction(*pair) for pair in pairs]
+        standard = [fractions.Fraction(*pair) for pair in pairs]
+        for name, operation in (("+", operator.add), ("-", operator.sub),
+                                ("*", operator.mul), ("/", operator.truediv)):
+            result = chain(operation, ours)()
+            expected = chain(operation, standard)()
+            assert (result.numerator, result.denominator) == \
+                (expected.numerator, expected.denominator)
+            rows.append([bits, name, best_of(chain(operation, ours), repeat=3),
+                         best_of(chain(operation, standard), repeat=3),
+                         # The textbook kernels are slow enough for a single run.
+                         best_of(chain(textbook(operation), pairs), repeat=1)])
+    print(f"Chains of {COUNT} fractions with coprime terms of the given bit length.")
+    table(["bits", "operator", "Fraction", "fractions.Fraction", "cross product + gcd"], rows)
+
+if __name__ == "__main__":
+    main()
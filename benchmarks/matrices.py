@@ -0,0 +1,93 @@
+'''
+RationalMatrix (fraction-free Bareiss elimination on integers) against naive Gaussian
+elimination over Fraction objects, on random systems with small rational entries. The whole
+run takes about twenty minutes, most of it on the 300x300 system.
+
+    python -m benchmarks.matrices
+'''
+
+import random
+
+from abstract_data_types.fractions import Fraction
+from abstract_data_types.matrices import RationalMatrix
+
+from ._timing import best_of, table
+
+SIZES = (50, 100, 150, 200, 300)
+# The determinant is timed only on the smaller sizes, which already show the trend.
+DETERMINANT_SIZES = (50, 100, 150)
+
+def naive_solve(rows, vector):
+    '''
+    Gaussian elimination with back substitution, every entry a Fraction.
+    '''
+    rows = [row[:] + [entry] for row, entry in zip(rows, vector)]
+    size = len(rows)
+    for column in range(size):
+        pivot_row = next(i for i in range(column, size) if rows[i][column] != 0)
+        rows[column], rows[pivot_row] = rows[pivot_row], rows[column]
+        pivot_line = rows[column]
+        pivot = pivot_line[column]
+        for line in rows[column + 1:]:
+            factor = line[column] / pivot
+            if factor != 0:
+                for j in range(column, size + 1):
+                    line[j] = line[j] - factor * pivot_line[j]
+    solution = [Fraction(0)] * size
+    for i in range(size - 1, -1, -1):
+        total = rows[i][size]
+        for j in range(i + 1, size):
+            total = total - rows[i][j] * solution[j]
+        solution[i] = total / rows[i][i]
+    return solution
+
+def naive_determinant(rows):
+    '''
+    The product of the pivots of Gaussian elimination, every entry a Fraction.
+    '''
+    rows = [row[:] for row in rows]
+    size = len(rows)
+    determinant = Fraction(1)
+    for column in range(size):
+        pivot_row = next((i for i in range(column, size) if rows[i][column] != 0), None)
+        if pivot_row is None:
+            return Fraction(0)
+        if pivot_row != column:
+            rows[column], rows[pivot_row] = rows[pivot_row], rows[column]
+            determinant = -determinant
+        pivot_line = rows[column]
+        pivot = pivot_line[column]
+        determinant = determinant * pivot
+        for line in rows[column + 1:]:
+            factor = line[column] / pivot
+            if factor != 0:
+                for j in range(column, size):
+                    line[j] = line[j] - factor * pivot_line[j]
+    return determinant
+
+def system(size, seed=0):
+    generator = random.Random(seed)
+    entry = lambda: Fraction(generator.randint(-9, 9), generator.randint(1, 9))
+    return [[entry() for _ in range(size)] for _ in range(size)], [entry() for _ in range(size)]
+
+def main():
+    rows = []
+    for size in SIZES:
+        matrix_rows, vector = system(size)
+        matrix = RationalMatrix(matrix_rows)
+        rows.append([f"{size}x{size}", best_of(lambda: matrix.solve(vector), repeat=1),
+                     best_of(lambda: naive_solve(matrix_rows, vector), repeat=1)])
+    print("Exact solve of random systems with entries a/b, |a| <= 9, 1 <= b <= 9.")
+    table(["size", "RationalMatrix.solve", "naive Fraction elimination"], rows)
+
+    rows = []
+    for size in DETERMINANT_SIZES:
+        matrix_rows, _ = system(size)
+        matrix = RationalMatrix(matrix_rows)
+        rows.append([f"{size}x{size}", best_of(matrix.determinant, repeat=1),
+                     best_of(lambda: naive_determinant(matrix_rows), repeat=1)])
+    print("Exact determinant of the same matrices.")
+    table(["size", "RationalMatrix.determinant", "naive Fraction elimination"], rows)
+
+if __name__ == "__main__":
+    main()
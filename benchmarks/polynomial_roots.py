@@ -0,0 +1,53 @@
+'''
+Batched polynomial root finding, Aberth-Ehrlich against Durand-Kerner, at degrees 10 to 200.
+
+    python -m benchmarks.polynomial_roots
+
+The error is the worst backward error of the roots, |p(z)| / sum(|a_k| |z|**k).
+'''
+
+import random
+from time import perf_counter
+
+from abstract_data_types.polynomials import batch_roots
+
+from ._timing import table
+
+# The degrees and the number of polynomials solved in each batch.
+BATCHES = ((10, 200), (50, 40), (100, 10), (200, 4))
+METHODS = ("aberth", "durand-kerner")
+
+def backward_error(coefficients, roots):
+    worst = 0.0
+    for root in roots:
+        z = complex(root.real, root.imaginary)
+        value, scale = 0j, 0.0
+        for coefficient in coefficients:
+            value = value * z + coefficient
+            scale = scale * abs(z) + abs(coefficient)
+        worst = max(worst, abs(value) / scale)
+    return worst
+
+def main():
+    generator = random.Random(1)
+    rows = []
+    for degree, count in BATCHES:
+        polynomials = [[generator.uniform(-1, 1) for _ in range(degree + 1)]
+                       for _ in range(count)]
+        row = [degree, count]
+        for method in METHODS:
+            start = perf_counter()
+            roots = batch_roots(polynomials, method=method)
+            elapsed = perf_counter() - start
+            error = max(backward_error(coefficients, found)
+                        for coefficients, found in zip(polynomials, roots))
+            row += [f"{elapsed / count * 1000:.1f}ms", f"{error:.1e}"]
+        rows.append(row)
+    print("Random real coefficients in [-1, 1]; time per polynomial.")
+    header = ["degree", "batch"]
+    for method in METHODS:
+        header += [method, "error"]
+    table(header, rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+'''
+Micro-benchmarks of the Fraction operators whose results are built with _from_reduced, against
+building the same results through the validating constructor, as they were before.
+
+    python -m benchmarks.reduced_constructor
+'''
+
+from abstract_data_types.fractions import Fraction
+
+from ._timing import best_of, table
+
+CALLS = 100000
+
+def main():
+    x = Fraction(355, 113)
+    y = -x
+    n, d = x.numerator, x.denominator
+    cases = (
+        ("-x", lambda: -x, lambda: Fraction(-n, d)),
+        ("abs(y)", lambda: abs(y), lambda: Fraction(abs(y.numerator), y.denominator)),
+        ("x ** 5", lambda: x ** 5, lambda: Fraction(n ** 5, d ** 5)),
+        ("x ** -3", lambda: x ** -3, lambda: Fraction(d ** 3, n ** 3)),
+        ("x + 7", lambda: x + 7, lambda: x + Fraction(7)),
+        ("x * 7", lambda: x * 7, lambda: x * Fraction(7)),
+        ("x < 7", lambda: x < 7, lambda: x < Fraction(7)),
+        ("x // 7", lambda: x // 7, lambda: Fraction(n // (7 * d))),
+    )
+    rows = []
+    for name, fast, validated in cases:
+        assert fast() == validated()
+        fast_time = best_of(fast, number=CALLS) / CALLS * 1e6
+        validated_time = best_of(validated, number=CALLS) / CALLS * 1e6
+        rows.append([name, f"{fast_time:.2f}us", f"{validated_time:.2f}us"])
+    print("Time per call.")
+    table(["operation", "_from_reduced", "validating constructor"], rows)
+
+if __name__ == "__main__":
+    main()
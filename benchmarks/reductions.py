@@ -0,0 +1,59 @@
+'''
+The exact reductions fsum, fprod and fdot against the naive += and *= loops.
+
+    python -m benchmarks.reductions
+'''
+
+import random
+
+from abstract_data_types.fractions import Fraction, fdot, fprod, fsum
+
+from ._timing import best_of, table
+
+SUM_LENGTHS = (10 ** 4, 10 ** 5, 10 ** 6)
+# The exact products grow too large beyond 10 ** 5 terms.
+PRODUCT_LENGTHS = (10 ** 4, 10 ** 5)
+
+def loop_sum(values):
+    total = Fraction(0)
+    for value in values:
+        total += value
+    return total
+
+def loop_product(values):
+    total = Fraction(1)
+    for value in values:
+        total *= value
+    return total
+
+def loop_dot(values, weights):
+    total = Fraction(0)
+    for value, weight in zip(values, weights):
+        total += value * weight
+    return total
+
+def main():
+    generator = random.Random(0)
+    values = [Fraction(generator.randint(-1000, 1000), generator.randint(1, 1000))
+              for _ in range(max(SUM_LENGTHS))]
+    rows = []
+    for length in SUM_LENGTHS:
+        head = values[:length]
+        assert fsum(head) == loop_sum(head)
+        rows.append(["sum", length, best_of(lambda: loop_sum(head), repeat=1),
+                     best_of(lambda: fsum(head), repeat=1)])
+    for length in PRODUCT_LENGTHS:
+        # Zero factors would stop the growth of the product.
+        head = [value for value in values[:length] if value]
+        assert fprod(head) == loop_product(head)
+        rows.append(["product", length, best_of(lambda: loop_product(head), repeat=1),
+                     best_of(lambda: fprod(head), repeat=1)])
+    for length in SUM_LENGTHS[:2]:
+        head, weights = values[:length], values[-length:]
+        assert fdot(head, weights) == loop_dot(head, weights)
+        rows.append(["dot", length, best_of(lambda: loop_dot(head, weights), repeat=1),
+                     best_of(lambda: fdot(head, weights), repeat=1)])
+    table(["reduction", "length", "loop", "fsum/fprod/fdot"], rows)
+
+if __name__ == "__main__":
+    main()
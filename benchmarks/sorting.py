@@ -0,0 +1,58 @@
+'''
+Sorting and bisecting large lists of fractions: sorted() and bisect on the fractions against
+sort_fractions and bisect on precomputed Fraction.sort_key keys.
+
+    python -m benchmarks.sorting
+'''
+
+import random
+from bisect import bisect_left
+
+from abstract_data_types.fractions import Fraction, sort_fractions
+
+from ._timing import best_of, table
+
+COUNT = 10 ** 5
+SEARCHES = 2 * 10 ** 4
+BITS = (20, 200)
+
+def main():
+    generator = random.Random(0)
+    rows = []
+    for bits in BITS:
+        values = [Fraction(generator.getrandbits(bits) - 2 ** (bits - 1),
+                           generator.getrandbits(bits) + 1) for _ in range(COUNT)]
+        targets = [Fraction(generator.getrandbits(bits) - 2 ** (bits - 1),
+                            generator.getrandbits(bits) + 1) for _ in range(SEARCHES)]
+        ordered = sorted(values)
+        assert sort_fractions(values) == ordered
+        keys = [value.sort_key() for value in ordered]
+
+        def search_values():
+            return [bisect_left(ordered, target) for target in targets]
+
+        def search_keys():
+            return [bisect_left(keys, target.sort_key()) for target in targets]
+
+        assert search_values() == search_keys()
+        rows.append([bits, "sort", best_of(lambda: sorted(values), repeat=3),
+                     best_of(lambda: sort_fractions(values), repeat=3)])
+        rows.append([bits, f"{SEARCHES} bisects", best_of(search_values, repeat=3),
+                     best_of(search_keys, repeat=3)])
+
+    print(f"{COUNT} fractions with terms of the given bit length.")
+    table(["bits", "operation", "fractions", "sort keys"], rows)
+
+    # A comparison of huge fractions of different sizes, decided by the bit lengths of the
+    # cross products, against computing them.
+    small = Fraction(3 ** 100000 + 1, 2 ** 150000 + 1)
+    large = Fraction(3 ** 120000 + 1, 2 ** 150000 + 3)
+    assert small < large
+    bounds = best_of(lambda: small < large, number=1000) / 1000 * 1e6
+    products = best_of(lambda: small.numerator * large.denominator <
+                       large.numerator * small.denominator, number=10) / 10 * 1e6
+    table(["comparison", "Fraction <", "cross products"],
+          [["x < y, ~200000-bit terms", f"{bounds:.2f}us", f"{products:.2f}us"]])
+
+if __name__ == "__main__":
+    main()
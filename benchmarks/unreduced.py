@@ -0,0 +1,60 @@
+'''
+Long sums and products of fractions, eager and inside unreduced().
+
+    python -m benchmarks.unreduced
+'''
+
+import random
+
+from abstract_data_types.fractions import Fraction, unreduced
+
+from ._timing import best_of, table
+
+LENGTHS = (500, 2000)
+MAX_BITS = (256, 1024, 4096)
+
+def harmonic(length):
+    '''
+    The sum of 1/k for k from 1 to length, by repeated +.
+    '''
+    total = Fraction(0)
+    for k in range(1, length + 1):
+        total = total + Fraction(1, k)
+    return total.normalize()
+
+def product(values):
+    '''
+    The product of values, by repeated *.
+    '''
+    total = Fraction(1)
+    for value in values:
+        total = total * value
+    return total.normalize()
+
+def deferred(function, max_bits):
+    '''
+    function, run inside unreduced(max_bits).
+    '''
+    def run():
+        with unreduced(max_bits):
+            return function()
+    return run
+
+def main():
+    generator = random.Random(0)
+    rows = []
+    for length in LENGTHS:
+        values = [Fraction(generator.randint(1, 1000), generator.randint(1, 1000))
+                  for _ in range(length)]
+        for name, function in ((f"sum of 1/k, k <= {length}", lambda: harmonic(length)),
+                               (f"product of {length} fractions", lambda: product(values))):
+            expected = function()
+            row = [name, best_of(function, repeat=3)]
+            for max_bits in MAX_BITS:
+                assert deferred(function, max_bits)() == expected
+                row.append(best_of(deferred(function, max_bits), repeat=3))
+            rows.append(row)
+    table(["chain", "eager"] + [f"unreduced({bits})" for bits in MAX_BITS], rows)
+
+if __name__ == "__main__":
+    main()
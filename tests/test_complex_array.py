@@ -0,0 +1,47 @@
+'''
+Scalar broadcasting between Complex and ComplexArray, on either side of the operator.
+'''
+
+import operator
+
+import pytest
+
+from abstract_data_types.complex import Complex, ComplexArray
+
+VALUES = [Complex(1.5, -2.0), Complex(-3.0, 0.25), Complex(0.0, 4.0), 2.0, -7]
+SCALARS = [Complex(1.0, 1.0), Complex(-0.5, 2.0), 3, -1.25]
+OPERATORS = [operator.add, operator.sub, operator.mul, operator.truediv]
+
+def parts(value):
+    if isinstance(value, Complex):
+        return value.real, value.imaginary
+    return float(value), 0.0
+
+@pytest.mark.parametrize("scalar", SCALARS)
+@pytest.mark.parametrize("operation", OPERATORS)
+def test_scalar_on_the_left(operation, scalar):
+    result = operation(scalar, ComplexArray(VALUES))
+    assert isinstance(result, ComplexArray)
+    expected = [operation(Complex(*parts(scalar)), Complex(*parts(value))) for value in VALUES]
+    assert [parts(value) for value in result] == [parts(value) for value in expected]
+
+@pytest.mark.parametrize("scalar", SCALARS)
+@pytest.mark.parametrize("operation", OPERATORS)
+def test_scalar_on_the_right(operation, scalar):
+    result = operation(ComplexArray(VALUES), scalar)
+    assert isinstance(result, ComplexArray)
+    expected = [operation(Complex(*parts(value)), Complex(*parts(scalar))) for value in VALUES]
+    assert [parts(value) for value in result] == [parts(value) for value in expected]
+
+def test_in_place_operator_on_a_complex_gives_an_array():
+    value = Complex(1.0, 1.0)
+    value += ComplexArray(VALUES)
+    assert isinstance(value, ComplexArray)
+    assert [parts(element) for element in value] == \
+        [parts(Complex(1.0, 1.0) + element) for element in VALUES]
+
+def test_unsupported_operand():
+    with pytest.raises(TypeError):
+        Complex(1.0, 1.0) + "1"
+    with pytest.raises(TypeError):
+        ComplexArray(VALUES) + "1"
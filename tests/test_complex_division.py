@@ -0,0 +1,104 @@
+'''
+Accuracy of the complex division kernel across extreme exponent ranges.
+
+Every quotient is compared with the exact one, computed with the standard library's fractions
+from the exact values of the float operands. The error is measured normwise, as
+|computed - exact| / |exact|, in units of the machine epsilon.
+'''
+
+import random
+import sys
+from fractions import Fraction
+
+import pytest
+
+from abstract_data_types.complex import Complex, ComplexAccumulator, ComplexArray, _divide
+
+EPSILON = sys.float_info.epsilon
+# The greatest normwise error accepted, in epsilons; the worst case measured is about 1.3.
+MAX_ERROR = 8
+EXPONENTS = (-1000, -300, -10, 0, 10, 300, 1000)
+# The pairs of exponents (of the dividend, of the divisor) whose quotients stay normal floats.
+EXPONENT_PAIRS = [(first, second) for first in EXPONENTS for second in EXPONENTS
+                  if abs(first - second) <= 1010]
+
+def operands(first, second, count=200, seed=0):
+    '''
+    Random dividends a + bi near 2**first and divisors c + di near 2**second.
+
+    One part of each operand is smaller than the other by up to 2**60 (staying a normal float)
+    and either may be the greater, so both branches of Smith's algorithm and ratios that
+    underflow are exercised.
+    '''
+    generator = random.Random(f"{first}/{second}/{seed}")
+
+    def pair(exponent):
+        smaller = max(exponent - generator.randint(0, 60), -1020)
+        parts = [generator.choice((-1, 1)) * generator.uniform(1, 2) * 2.0 ** power
+                 for power in (exponent, smaller)]
+        generator.shuffle(parts)
+        return parts
+
+    return [(*pair(first), *pair(second)) for _ in range(count)]
+
+def error(real, imaginary, a, b, c, d):
+    '''
+    The normwise relative error of real + imaginary*i as (a + bi) / (c + di), in epsilons.
+    '''
+    a, b, c, d = map(Fraction, (a, b, c, d))
+    norm = c * c + d * d
+    exact_real, exact_imaginary = (a * c + b * d) / norm, (b * c - a * d) / norm
+    if real != real or imaginary != imaginary or abs(real) == float("inf") or \
+        abs(imaginary) == float("inf"):
+        return float("inf")
+    difference = (Fraction(real) - exact_real) ** 2 + \
+        (Fraction(imaginary) - exact_imaginary) ** 2
+    size = exact_real ** 2 + exact_imaginary ** 2
+    return float(difference / size) ** 0.5 / EPSILON
+
+@pytest.mark.parametrize("first, second", EXPONENT_PAIRS)
+def test_divide_kernel(first, second):
+    worst = max(error(*_divide(a, b, c, d), a, b, c, d)
+                for a, b, c, d in operands(first, second))
+    assert worst <= MAX_ERROR
+
+@pytest.mark.parametrize("first, second", EXPONENT_PAIRS)
+def test_complex_truediv(first, second):
+    for a, b, c, d in operands(first, second, seed=1):
+        quotient = Complex(a, b) / Complex(c, d)
+        assert error(quotient.real, quotient.imaginary, a, b, c, d) <= MAX_ERROR
+
+        accumulator = ComplexAccumulator(a, b)
+        accumulator /= Complex(c, d)
+        assert (accumulator.real, accumulator.imaginary) == (quotient.real, quotient.imaginary)
+
+@pytest.mark.parametrize("first, second", EXPONENT_PAIRS)
+def test_complex_array_truediv(first, second):
+    cases = operands(first, second, seed=2)
+    dividends = ComplexArray(Complex(a, b) for a, b, _, _ in cases)
+    divisors = ComplexArray(Complex(c, d) for _, _, c, d in cases)
+    quotients = dividends / divisors
+    for quotient, (a, b, c, d) in zip(quotients, cases):
+        assert error(quotient.real, quotient.imaginary, a, b, c, d) <= MAX_ERROR
+        # The array and the scalar division give the same floats.
+        scalar = Complex(a, b) / Complex(c, d)
+        assert (quotient.real, quotient.imaginary) == (scalar.real, scalar.imaginary)
+
+def test_complex_array_truediv_mixed_ranges():
+    # One element outside the safe range sends the whole array through the robust kernel.
+    cases = operands(0, 0, count=50, seed=3) + operands(1000, -10, count=5, seed=3)
+    dividends = ComplexArray(Complex(a, b) for a, b, _, _ in cases)
+    divisors = ComplexArray(Complex(c, d) for _, _, c, d in cases)
+    for quotient, (a, b, c, d) in zip(dividends / divisors, cases):
+        assert error(quotient.real, quotient.imaginary, a, b, c, d) <= MAX_ERROR
+
+def test_division_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        Complex(1, 1) / Complex(0, 0)
+    with pytest.raises(ZeroDivisionError):
+        ComplexArray([Complex(1, 1)]) / Complex(0.0, 0.0)
+
+@pytest.mark.parametrize("exponent", EXPONENTS)
+def test_abs_does_not_overflow(exponent):
+    value = Complex(3 * 2.0 ** exponent, 4 * 2.0 ** exponent)
+    assert abs(value) == 5 * 2.0 ** exponent
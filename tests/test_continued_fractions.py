@@ -0,0 +1,66 @@
+'''
+Exactness of Gosper's arithmetic on continued fractions, and the opt-in settling of results.
+'''
+
+import itertools
+import math
+
+import pytest
+
+from abstract_data_types.continued_fractions import ContinuedFraction
+from abstract_data_types.fractions import Fraction
+
+def fibonacci(n):
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+def sqrt_two():
+    '''
+    The terms [1; 2, 2, 2, ...] of the square root of 2.
+    '''
+    yield 1
+    yield from itertools.repeat(2)
+
+def test_cancellation_of_long_fractions_is_exact():
+    x = Fraction(fibonacci(301), fibonacci(300))
+    y = Fraction(fibonacci(302), fibonacci(301))
+    difference = ContinuedFraction.from_fraction(x) - ContinuedFraction.from_fraction(y)
+    # By Cassini's identity, x - y = 1 / (F(300) * F(301)), about 1.2514e-125.
+    assert difference.to_fraction() == Fraction(1, fibonacci(300) * fibonacci(301))
+    quotient = ContinuedFraction.from_fraction(x) / ContinuedFraction.from_fraction(y)
+    assert quotient.to_fraction() == x / y
+
+def test_cancellation_against_a_convergent():
+    convergent = ContinuedFraction(itertools.islice(sqrt_two(), 400)).to_fraction()
+    after = ContinuedFraction(itertools.islice(sqrt_two(), 401)).to_fraction()
+    difference = ContinuedFraction(sqrt_two()) - ContinuedFraction.from_fraction(convergent)
+    approximation = difference.to_fraction(max_terms=4)
+    # The square root of 2 lies strictly between consecutive convergents.
+    assert approximation != 0
+    assert (approximation < 0) == (after < convergent)
+    assert abs(approximation) < abs(after - convergent)
+
+def test_exhausted_operand_is_never_settled():
+    # The integer part of the product needs about 130 terms of the root after 10**100 is read.
+    root = ContinuedFraction(sqrt_two(), max_pending=10)
+    product = root * 10 ** 100
+    assert product.term(0) == math.isqrt(2 * 10 ** 200)
+    x = Fraction(fibonacci(301), fibonacci(300))
+    total = ContinuedFraction.from_fraction(x) + ContinuedFraction([10 ** 100], max_pending=10)
+    assert total.to_fraction() == x + 10 ** 100
+
+def test_opt_in_settling():
+    root = ContinuedFraction(sqrt_two(), max_pending=500)
+    assert list((root * ContinuedFraction(sqrt_two())).terms()) == [2]
+    assert list((root - ContinuedFraction(sqrt_two())).terms()) == [0]
+    assert list((root / ContinuedFraction(sqrt_two())).terms()) == [1]
+    # The results keep the limit, so later operations settle too.
+    square = root * ContinuedFraction(sqrt_two())
+    assert (square - 2).to_fraction() == 0
+
+@pytest.mark.parametrize("max_pending, error", [(0, ValueError), (1.5, TypeError)])
+def test_invalid_max_pending(max_pending, error):
+    with pytest.raises(error):
+        ContinuedFraction([1], max_pending=max_pending)
@@ -0,0 +1,91 @@
+'''
+The fast Fourier transforms against a naive O(n**2) discrete Fourier transform.
+
+The lengths cover the radix-2 (128), mixed-radix (210, 1000) and Bluestein (97, 331)
+algorithms, besides the trivial lengths 0 and 1.
+'''
+
+import cmath
+import random
+
+import pytest
+
+from abstract_data_types.complex import Complex, ComplexArray
+from abstract_data_types.fft import convolve, fft, ifft, irfft, rfft
+
+LENGTHS = (0, 1, 2, 3, 128, 210, 1000, 97, 331)
+# The greatest error accepted, relative to the sum of the moduli of the input.
+TOLERANCE = 1e-12
+
+def sequence(n, seed=0, real=False):
+    generator = random.Random(f"{n}/{seed}")
+    if real:
+        return [generator.uniform(-1, 1) for _ in range(n)]
+    return [Complex(generator.uniform(-1, 1), generator.uniform(-1, 1)) for _ in range(n)]
+
+def numbers(values):
+    return [complex(value.real, value.imaginary) if isinstance(value, Complex)
+            else complex(value) for value in values]
+
+def naive_dft(values, sign=-1):
+    n = len(values)
+    return [sum(value * cmath.exp(sign * 2j * cmath.pi * j * k / n)
+                for j, value in enumerate(values)) for k in range(n)]
+
+def assert_close(result, expected, scale):
+    assert len(result) == len(expected)
+    assert all(abs(a - b) <= TOLERANCE * max(scale, 1.0) for a, b in zip(result, expected))
+
+@pytest.mark.parametrize("n", LENGTHS)
+def test_fft(n):
+    values = numbers(sequence(n))
+    expected = naive_dft(values)
+    assert_close(numbers(fft(sequence(n))), expected, sum(map(abs, values)))
+
+@pytest.mark.parametrize("n", LENGTHS)
+def test_ifft(n):
+    values = numbers(sequence(n))
+    expected = [value / n for value in naive_dft(values, sign=1)]
+    assert_close(numbers(ifft(sequence(n))), expected, sum(map(abs, values)))
+
+@pytest.mark.parametrize("n", LENGTHS)
+def test_rfft(n):
+    values = sequence(n, real=True)
+    expected = naive_dft(numbers(values))[:n // 2 + 1]
+    assert_close(numbers(rfft(values)), expected, sum(map(abs, values)))
+
+@pytest.mark.parametrize("n", [n for n in LENGTHS if n])
+def test_irfft(n):
+    values = sequence(n, real=True)
+    terms = naive_dft(numbers(values))[:n // 2 + 1]
+    result = irfft([Complex(term.real, term.imag) for term in terms], n)
+    assert_close(numbers(result), numbers(values), 1.0)
+
+@pytest.mark.parametrize("n", LENGTHS)
+def test_round_trips(n):
+    values = sequence(n)
+    assert_close(numbers(ifft(fft(values))), numbers(values), 1.0)
+    samples = sequence(n, real=True)
+    if n:
+        assert_close(numbers(irfft(rfft(samples), n)), numbers(samples), 1.0)
+
+@pytest.mark.parametrize("sizes", [(0, 5), (1, 1), (5, 1), (97, 128), (210, 331)])
+def test_convolve(sizes):
+    a, b = sequence(sizes[0], seed=1), sequence(sizes[1], seed=2)
+    x, y = numbers(a), numbers(b)
+    expected = [sum(x[j] * y[k - j] for j in range(len(x)) if 0 <= k - j < len(y))
+                for k in range(len(x) + len(y) - 1)] if x and y else []
+    scale = sum(map(abs, x)) * sum(map(abs, y))
+    assert_close(numbers(convolve(a, b)), expected, scale)
+
+@pytest.mark.parametrize("n", LENGTHS)
+def test_complex_array_in_complex_array_out(n):
+    values = sequence(n)
+    array = ComplexArray(values)
+    for transform in (fft, ifft):
+        result = transform(array)
+        assert isinstance(result, ComplexArray)
+        assert numbers(result) == numbers(transform(values))
+    assert isinstance(convolve(array, values), ComplexArray)
+    assert isinstance(convolve(values, array), ComplexArray)
+    assert isinstance(fft(values), list)
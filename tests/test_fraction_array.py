@@ -0,0 +1,61 @@
+'''
+Scalar broadcasting between Fraction and FractionArray, on either side of the operator.
+'''
+
+import operator
+
+import pytest
+
+from abstract_data_types.fractions import Fraction, FractionArray
+
+VALUES = [Fraction(1, 2), Fraction(-3, 4), Fraction(5, 3), 2, -7]
+SCALARS = [Fraction(1, 3), Fraction(-7, 5), 3, -2]
+OPERATORS = [operator.add, operator.sub, operator.mul, operator.truediv, operator.floordiv,
+             operator.mod]
+COMPARISONS = [operator.eq, operator.ne, operator.lt, operator.le, operator.gt, operator.ge]
+
+def scalar(value):
+    return value if isinstance(value, Fraction) else Fraction(value)
+
+@pytest.mark.parametrize("other", SCALARS)
+@pytest.mark.parametrize("operation", OPERATORS)
+def test_scalar_on_the_left(operation, other):
+    result = operation(other, FractionArray(VALUES))
+    assert isinstance(result, FractionArray)
+    assert result.to_list() == [operation(scalar(other), scalar(value)) for value in VALUES]
+
+@pytest.mark.parametrize("other", SCALARS)
+@pytest.mark.parametrize("operation", OPERATORS)
+def test_scalar_on_the_right(operation, other):
+    result = operation(FractionArray(VALUES), other)
+    assert isinstance(result, FractionArray)
+    assert result.to_list() == [operation(scalar(value), scalar(other)) for value in VALUES]
+
+@pytest.mark.parametrize("other", SCALARS)
+@pytest.mark.parametrize("comparison", COMPARISONS)
+def test_comparison_with_scalar_on_the_left(comparison, other):
+    assert comparison(other, FractionArray(VALUES)) == \
+        [comparison(scalar(other), scalar(value)) for value in VALUES]
+
+@pytest.mark.parametrize("base", SCALARS)
+def test_scalar_raised_to_array(base):
+    powers = [3, 0, -2, 1]
+    result = base ** FractionArray(powers)
+    assert isinstance(result, FractionArray)
+    assert result.to_list() == [scalar(base) ** power for power in powers]
+
+def test_in_place_operator_on_a_fraction_gives_an_array():
+    total = Fraction(1, 3)
+    total += FractionArray(VALUES)
+    assert isinstance(total, FractionArray)
+    assert total.to_list() == [Fraction(1, 3) + value for value in VALUES]
+
+def test_invalid_reflected_operands():
+    with pytest.raises(ZeroDivisionError):
+        1 / FractionArray([1, 0])
+    with pytest.raises(ZeroDivisionError):
+        0 ** FractionArray([-1])
+    with pytest.raises(TypeError):
+        2 ** FractionArray([Fraction(1, 2)])
+    with pytest.raises(TypeError):
+        1.5 / FractionArray([1])
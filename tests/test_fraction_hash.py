@@ -0,0 +1,58 @@
+'''
+The numeric hash of Fraction and its interned small values.
+'''
+
+import fractions
+import random
+import sys
+
+import pytest
+
+from abstract_data_types.fractions import Fraction, unreduced
+
+MODULUS = sys.hash_info.modulus  # 2**61 - 1 on 64-bit builds.
+
+PAIRS = [(0, 1), (1, 1), (-1, 1), (3, 1), (-3, 1), (1, 2), (-1, 2), (6, 14), (-6, 14),
+         (6, -14), (-1, 3), (10 ** 30 + 1, 7), (-10 ** 30 - 1, 7), (MODULUS, 1), (-MODULUS, 3),
+         (1, MODULUS), (-1, MODULUS), (5, 2 * MODULUS), (-5, 2 * MODULUS),
+         (7, MODULUS ** 2), (-7, 3 * MODULUS ** 2), (MODULUS + 1, MODULUS), (2 ** 61, 2 ** 62)]
+
+@pytest.mark.parametrize("numerator, denominator", PAIRS)
+def test_hash_matches_standard_library(numerator, denominator):
+    assert hash(Fraction(numerator, denominator)) == \
+        hash(fractions.Fraction(numerator, denominator))
+
+def test_hash_matches_on_random_values():
+    generator = random.Random(0)
+    for _ in range(2000):
+        numerator = generator.randint(-10 ** 25, 10 ** 25)
+        denominator = generator.randint(1, 10 ** 25) * generator.choice([1, MODULUS])
+        assert hash(Fraction(numerator, denominator)) == \
+            hash(fractions.Fraction(numerator, denominator))
+
+def test_hash_matches_int_and_float():
+    assert hash(Fraction(3)) == hash(3)
+    assert hash(Fraction(-7, 1)) == hash(-7)
+    assert hash(Fraction(1, 2)) == hash(0.5)
+    assert hash(Fraction(-3, 8)) == hash(-0.375)
+    assert hash(Fraction(-1)) == hash(-1) == -2
+
+def test_hash_of_unreduced_results():
+    with unreduced():
+        value = Fraction(1, 6) + Fraction(1, 3)
+        assert hash(value) == hash(fractions.Fraction(1, 2))
+    assert len({Fraction(1, 2), Fraction(2, 4), Fraction(-3, -6)}) == 1
+
+@pytest.mark.parametrize("numerator, denominator", [(0, 1), (1, 1), (-1, 1), (256, 1),
+                                                    (-256, 1), (1, 2), (-1, 2)])
+def test_interned_values_are_identical(numerator, denominator):
+    value = Fraction(numerator, denominator)
+    assert Fraction(numerator * 3, denominator * 3) is value
+    assert Fraction(-numerator, -denominator) is value
+    assert Fraction._from_reduced(numerator, denominator) is value
+
+def test_arithmetic_results_are_interned():
+    assert Fraction(1, 3) + Fraction(2, 3) is Fraction(1)
+    assert Fraction(1, 4) * 2 is Fraction(1, 2)
+    assert Fraction(5, 7) - Fraction(5, 7) is Fraction(0)
+    assert -Fraction(1, 2) is Fraction(-1, 2)
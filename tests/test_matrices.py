@@ -0,0 +1,138 @@
+'''
+RationalMatrix against a reference Gauss-Jordan elimination over the standard library's
+fractions, on square, singular, rank-deficient and rectangular matrices.
+'''
+
+import fractions
+import random
+
+import pytest
+
+from abstract_data_types.fractions import Fraction
+from abstract_data_types.matrices import RationalMatrix
+
+def standard(value):
+    return fractions.Fraction(value.numerator, value.denominator)
+
+def reference_rref(rows):
+    '''
+    The reduced row echelon form and the pivot columns, by plain Gauss-Jordan elimination.
+    '''
+    rows = [[fractions.Fraction(entry) for entry in row] for row in rows]
+    pivots = []
+    for column in range(len(rows[0])):
+        row = len(pivots)
+        pivot_row = next((i for i in range(row, len(rows)) if rows[i][column]), None)
+        if pivot_row is None:
+            continue
+        rows[row], rows[pivot_row] = rows[pivot_row], rows[row]
+        pivot = rows[row][column]
+        rows[row] = [entry / pivot for entry in rows[row]]
+        for i, line in enumerate(rows):
+            if i != row and line[column]:
+                factor = line[column]
+                rows[i] = [a - factor * b for a, b in zip(line, rows[row])]
+        pivots.append(column)
+    return rows, pivots
+
+def reference_determinant(rows):
+    rows = [[fractions.Fraction(entry) for entry in row] for row in rows]
+    determinant = fractions.Fraction(1)
+    for column in range(len(rows)):
+        pivot_row = next((i for i in range(column, len(rows)) if rows[i][column]), None)
+        if pivot_row is None:
+            return fractions.Fraction(0)
+        if pivot_row != column:
+            rows[column], rows[pivot_row] = rows[pivot_row], rows[column]
+            determinant = -determinant
+        determinant *= rows[column][column]
+        for line in rows[column + 1:]:
+            factor = line[column] / rows[column][column]
+            for j in range(column, len(rows)):
+                line[j] -= factor * rows[column][j]
+    return determinant
+
+def random_matrix(generator, rows, columns, rank=None):
+    '''
+    A random matrix of small fractions; of the given rank, if any, as a product of factors.
+    '''
+    entry = lambda: fractions.Fraction(generator.randint(-5, 5), generator.randint(1, 6))
+    if rank is None:
+        return [[entry() for _ in range(columns)] for _ in range(rows)]
+    left = [[entry() for _ in range(rank)] for _ in range(rows)]
+    right = [[entry() for _ in range(columns)] for _ in range(rank)]
+    return [[sum((left[i][k] * right[k][j] for k in range(rank)), fractions.Fraction(0))
+             for j in range(columns)] for i in range(rows)]
+
+def matrix(rows):
+    return RationalMatrix([[Fraction(entry.numerator, entry.denominator) for entry in row]
+                           for row in rows])
+
+def cases(count, seed):
+    generator = random.Random(seed)
+    for _ in range(count):
+        rows, columns = generator.randint(1, 6), generator.randint(1, 6)
+        rank = generator.choice([None, generator.randint(0, min(rows, columns))])
+        yield random_matrix(generator, rows, columns, rank)
+
+@pytest.mark.parametrize("seed", range(4))
+def test_rank_and_rref(seed):
+    for rows in cases(250, seed):
+        echelon, pivots = reference_rref(rows)
+        result = matrix(rows)
+        assert result.rank() == len(pivots)
+        assert [[standard(entry) for entry in row] for row in result.rref().to_rows()] == echelon
+
+@pytest.mark.parametrize("seed", range(4))
+def test_square_operations(seed):
+    generator = random.Random(seed)
+    for _ in range(250):
+        size = generator.randint(1, 6)
+        rank = generator.choice([None, None, generator.randint(0, size)])
+        rows = random_matrix(generator, size, size, rank)
+        result = matrix(rows)
+        determinant = reference_determinant(rows)
+        assert standard(result.determinant()) == determinant
+
+        vector = [fractions.Fraction(generator.randint(-9, 9), generator.randint(1, 9))
+                  for _ in range(size)]
+        if determinant == 0:
+            with pytest.raises(ValueError):
+                result.solve([Fraction(v.numerator, v.denominator) for v in vector])
+            with pytest.raises(ValueError):
+                result.inverse()
+            continue
+        echelon, _ = reference_rref([row + [v] for row, v in zip(rows, vector)])
+        solution = result.solve([Fraction(v.numerator, v.denominator) for v in vector])
+        assert [standard(value) for value in solution] == [row[-1] for row in echelon]
+
+        identity = [[fractions.Fraction(int(i == j)) for j in range(size)] for i in range(size)]
+        echelon, _ = reference_rref([row + unit for row, unit in zip(rows, identity)])
+        assert [[standard(entry) for entry in row] for row in result.inverse().to_rows()] == \
+            [row[size:] for row in echelon]
+
+def test_known_values():
+    result = RationalMatrix([[2, Fraction(1, 2)], [Fraction(1, 3), 1]])
+    assert result.determinant() == Fraction(11, 6)
+    assert result.solve([1, 1]) == [Fraction(3, 11), Fraction(10, 11)]
+    assert RationalMatrix([[1, 2], [2, 4]]).determinant() == 0
+    assert RationalMatrix([[0, 0], [0, 0]]).rank() == 0
+    assert RationalMatrix([[1, 2, 3], [2, 4, 6]]).rref().to_rows() == \
+        [[1, 2, 3], [0, 0, 0]]
+    assert RationalMatrix([[1], [2], [3]]).rank() == 1
+
+def test_invalid_matrices():
+    with pytest.raises(ValueError):
+        RationalMatrix([])
+    with pytest.raises(ValueError):
+        RationalMatrix([[1, 2], [3]])
+    with pytest.raises(TypeError):
+        RationalMatrix([[1.5]])
+    rectangular = RationalMatrix([[1, 2, 3], [4, 5, 6]])
+    for method in (rectangular.determinant, rectangular.inverse):
+        with pytest.raises(ValueError):
+            method()
+    with pytest.raises(ValueError):
+        rectangular.solve([1, 2])
+    with pytest.raises(ValueError):
+        RationalMatrix([[1, 0], [0, 1]]).solve([1, 2, 3])